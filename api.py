@@ -0,0 +1,326 @@
+"""
+API HTTP lokal untuk hasil analisis (ASGI murni, tanpa framework web).
+
+    uvicorn api:app --host 127.0.0.1 --port 8600
+
+Endpoint (GET):
+    /                        daftar endpoint
+    /forecast/{country}?h=10 forecast LSTM satu negara (nama, alias, atau ISO-3)
+    /forecast?h=10           forecast semua negara (bulk, satu batch model)
+    /cluster/{year}          label cluster DEC semua negara pada tahun tsb
+    /granger                 hasil uji Granger semua negara
+
+Format respons: JSON (default) atau Arrow IPC stream untuk tabel besar
+(`?format=arrow` atau header `Accept: application/vnd.apache.arrow.stream`,
+butuh pyarrow).
+
+Data & model diambil lewat loaders.py, lapisan tanpa Streamlit yang juga
+dipakai dashboard (cache disk, model server bersama), jadi API tidak memuat
+model sendiri jika model_server.py aktif. Komputasi berjalan di thread pool agar
+event loop tetap melayani request lain; respons di-cache per (rute, parameter,
+format, isi file data, model yang menjawab), dan request identik yang datang
+bersamaan hanya dihitung sekali.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import numpy as np
+import pandas as pd
+
+import loaders
+from data_cache import DATA_FILES, CACHE_TTL_SECONDS, content_key, file_stat
+from forecasting import to_kwh
+from model_server import get_client
+
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+JSON_MIME = "application/json"
+
+MAX_HORIZON = 30
+DEFAULT_HORIZON = 10
+RESPONSE_CACHE_MAX = 256
+API_WORKERS = int(os.environ.get("ENERGY_API_WORKERS", "4"))
+
+_executor = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="energy-api")
+logger = logging.getLogger(__name__)
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# -------------------------------------------------------------------------
+# HANDLER (blocking, dijalankan di thread pool) -> DataFrame
+# -------------------------------------------------------------------------
+def _dataset(name):
+    df = loaders.get_data()[name]
+    if df is None:
+        raise HTTPError(503, f"Dataset '{os.path.basename(DATA_FILES[name])}' tidak tersedia")
+    return df
+
+def forecast_country(country, h):
+    # Nama kanonik, alias, maupun ISO-3 diterima (mis. /forecast/IDN)
+    df_lstm = _dataset('lstm')
+    country_id = loaders.country_id_of(country)
+    df_c = df_lstm[df_lstm["Country_ID"] == country_id]
+    if df_c.empty:
+        raise HTTPError(404, f"Negara '{country}' tidak ditemukan")
+    country = df_c["Country Name"].iat[0]
+    window, model_key = loaders.country_window(df_lstm, country_id)
+    if window is None:
+        raise HTTPError(422, f"Data historis '{country}' kurang untuk prediksi")
+    preds = loaders.forecast_window(window, h, model_key)
+    last_year = int(df_c["Year"].max())
+    preds = np.asarray(preds, dtype=float)
+    return pd.DataFrame({
+        "Country Name": country,
+        "Last_Year": last_year,
+        "Horizon": np.arange(1, h + 1),
+        "Year": np.arange(last_year + 1, last_year + 1 + h),
+        "Predicted_log_Energy": preds,
+        "Predicted_Energy_kWh": to_kwh(preds),
+    })
+
+def forecast_all(h):
+    return loaders.all_country_forecasts(_dataset('lstm'), h)
+
+def cluster_year(year):
+    df = _dataset('dec')
+    df = df[df["Year"] == year]
+    if df.empty:
+        raise HTTPError(404, f"Tidak ada data cluster untuk tahun {year}")
+    cols = ["Country Name", "ISO3", "Region", "Year", "Cluster", "Cluster Label", "GDP_per_Capita",
+            "Energy_Consumption_kWh"]
+    return df[[c for c in cols if c in df.columns]].reset_index(drop=True)
+
+def granger():
+    return _dataset('granger')
+
+def index():
+    return pd.DataFrame({
+        "Endpoint": ["/forecast/{country}?h=", "/forecast?h=", "/cluster/{year}", "/granger"],
+        "Deskripsi": ["Forecast LSTM satu negara", "Forecast semua negara (bulk)",
+                      "Label cluster DEC per tahun", "Hasil uji Granger"],
+    })
+
+
+def _horizon(query):
+    raw = query.get("h", [str(DEFAULT_HORIZON)])[-1]
+    try:
+        h = int(raw)
+    except ValueError:
+        raise HTTPError(400, f"Parameter h harus bilangan bulat, bukan '{raw}'")
+    if not 1 <= h <= MAX_HORIZON:
+        raise HTTPError(400, f"Parameter h harus di antara 1 dan {MAX_HORIZON}")
+    return h
+
+def _year(raw):
+    try:
+        return int(raw)
+    except ValueError:
+        raise HTTPError(400, f"Tahun harus bilangan bulat, bukan '{raw}'")
+
+_COUNTRIES = DATA_FILES['countries']
+
+# (pola path, fungsi(match, query) -> (handler, args), file data yang menentukan isi respons,
+#  apakah respons bergantung pada model forecast)
+ROUTES = [
+    (re.compile(r"^/forecast/(?P<country>[^/]+)/?$"),
+     # scope["path"] dari ASGI sudah di-decode; unquote lagi merusak nama yang memuat '%'
+     lambda m, q: (forecast_country, (m["country"], _horizon(q))),
+     (DATA_FILES['lstm'], _COUNTRIES), True),
+    (re.compile(r"^/forecast/?$"),
+     lambda m, q: (forecast_all, (_horizon(q),)),
+     (DATA_FILES['lstm'], _COUNTRIES), True),
+    (re.compile(r"^/cluster/(?P<year>[^/]+)/?$"),
+     lambda m, q: (cluster_year, (_year(m["year"]),)),
+     (DATA_FILES['dec'], _COUNTRIES), False),
+    (re.compile(r"^/granger/?$"),
+     lambda m, q: (granger, ()),
+     (DATA_FILES['granger'], _COUNTRIES), False),
+    (re.compile(r"^/$"),
+     lambda m, q: (index, ()),
+     (), False),
+]
+
+def resolve(path, query):
+    for pattern, bind, files, uses_model in ROUTES:
+        m = pattern.match(path)
+        if m:
+            handler, args = bind(m, query)
+            return handler, args, files, uses_model
+    raise HTTPError(404, f"Endpoint '{path}' tidak dikenal")
+
+_inputs_keys = {}
+
+def inputs_signature(files, uses_model):
+    """Penanda murah (stat saja) untuk inputs_key: (mtime, size) file data + generasi model jika dipakai rute"""
+    return files, tuple(map(file_stat, files)), loaders.model_generation(get_client()) if uses_model else None
+
+def inputs_key(files, uses_model, signature=None):
+    """
+    Isi file data + model_key model yang menjawab (backend & artefak model server
+    jika aktif, selain itu model lokal), bukan file model sisi klien. Dihitung
+    sekali per inputs_signature, bukan per request.
+    """
+    signature = signature or inputs_signature(files, uses_model)
+    key = _inputs_keys.get(signature)
+    if key is None:
+        key = content_key(*files), loaders.forecast_model_info()["model_key"] if uses_model else None
+        if len(_inputs_keys) >= RESPONSE_CACHE_MAX:
+            _inputs_keys.clear()
+        _inputs_keys[signature] = key
+    return key
+
+
+# -------------------------------------------------------------------------
+# ENCODING
+# -------------------------------------------------------------------------
+def negotiate(query, headers):
+    fmt = query.get("format", [None])[-1]
+    if fmt is None:
+        fmt = "arrow" if ARROW_MIME in headers.get("accept", "") else "json"
+    if fmt not in ("json", "arrow"):
+        raise HTTPError(400, f"Format '{fmt}' tidak didukung (json / arrow)")
+    return fmt
+
+def encode(df, fmt):
+    """DataFrame -> (body bytes, content type)"""
+    # Kolom kategorikal (mis. Cluster Label) dikirim sebagai teks biasa
+    df = df.astype({c: str for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)})
+    if fmt == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise HTTPError(406, "pyarrow tidak terpasang; gunakan format=json")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), ARROW_MIME
+    return df.to_json(orient="records").encode("utf-8"), JSON_MIME
+
+
+# -------------------------------------------------------------------------
+# CACHE RESPONS
+# -------------------------------------------------------------------------
+class ResponseCache:
+    """
+    Cache LRU + TTL untuk body respons yang sudah di-encode, dengan
+    penggabungan request identik yang sedang dihitung (single-flight).
+    Hanya diakses dari event loop, jadi tidak butuh lock.
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX, ttl=CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._inflight = {}
+
+    async def get_or_compute(self, key, compute):
+        hit = self._entries.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.ttl:
+            self._entries.move_to_end(key)
+            return hit[1]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        pending = loop.create_future()
+        self._inflight[key] = pending
+        try:
+            value = await loop.run_in_executor(_executor, compute)
+        except Exception as e:
+            pending.set_exception(e)
+            pending.exception()  # ditandai sudah dibaca jika tidak ada request lain yang menunggu
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        pending.set_result(value)
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+# -------------------------------------------------------------------------
+# APLIKASI ASGI
+# -------------------------------------------------------------------------
+async def _send(send, status, body, content_type, head=False):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"" if head else body})
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            _executor.shutdown(wait=False, cancel_futures=True)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    head = scope["method"] == "HEAD"
+    try:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPError(405, "Hanya metode GET yang didukung")
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        fmt = negotiate(query, headers)
+        handler, args, files, uses_model = resolve(scope["path"], query)
+
+        # Kunci = rute + parameter + format + isi file sumber + model, sehingga respons
+        # lama otomatis tidak dipakai lagi setelah CSV / model diperbarui
+        # (hash file / info model server pertama kali bisa lama -> thread pool, bukan event loop)
+        signature = inputs_signature(files, uses_model)
+        source_key = _inputs_keys.get(signature)
+        if source_key is None:
+            source_key = await asyncio.get_running_loop().run_in_executor(
+                _executor, inputs_key, files, uses_model, signature)
+        key = (handler.__name__, args, fmt, source_key)
+        body, content_type = await response_cache.get_or_compute(key, lambda: encode(handler(*args), fmt))
+        status = 200
+    except HTTPError as e:
+        status, body, content_type = e.status, json.dumps({"error": e.message}).encode("utf-8"), JSON_MIME
+    except Exception:
+        # Detail exception (path, pesan internal) hanya ke log; klien menerima request_id untuk dicocokkan
+        request_id = uuid.uuid4().hex[:12]
+        logger.exception("%s %s gagal [request_id=%s]", scope["method"], scope["path"], request_id)
+        status, content_type = 500, JSON_MIME
+        body = json.dumps({"error": "Kesalahan internal server", "request_id": request_id}).encode("utf-8")
+
+    await _send(send, status, body, content_type, head=head)
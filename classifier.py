@@ -0,0 +1,93 @@
+"""
+Classifier Low/High (Deep Forest dengan cadangan Random Forest).
+
+Model dilatih on-the-fly dari label DEC (`Cluster`) memakai fitur
+`log_GDP_per_Capita` dan `log_Energy`.
+"""
+import numpy as np
+
+FEATURES = ['log_GDP_per_Capita', 'log_Energy']
+
+
+def build_classifier():
+    """Mengembalikan (clf, model_status)"""
+    try:
+        # 1. Coba Import Deep Forest
+        from deep_forest import CascadeForestClassifier
+        clf = CascadeForestClassifier(random_state=42, verbose=0)
+        model_status = "✅ Menggunakan Deep Forest (Cascade Layer)"
+    except ImportError:
+        # 2. Jika Gagal (Library tidak ada), gunakan Random Forest
+        from sklearn.ensemble import RandomForestClassifier
+        clf = RandomForestClassifier(n_estimators=100, random_state=42)
+        model_status = "⚠️ Deep Forest tidak terinstall. Menggunakan Random Forest sebagai simulasi."
+    return clf, model_status
+
+
+def fit_classifier(df):
+    """Melatih classifier dari data DEC. Mengembalikan (clf, model_status)"""
+    clf, model_status = build_classifier()
+    clf.fit(df[FEATURES].values, df['Cluster'].values)
+    return clf, model_status
+
+
+def predict_labels(clf, X):
+    # Deep Forest kadang mengembalikan array 2D, kita ratakan jika perlu
+    pred = np.asarray(clf.predict(X))
+    if len(pred.shape) > 1:
+        pred = pred.flatten()
+    return pred
+
+
+# -------------------------------------------------------------------------
+# MODE SKENARIO (BATCH)
+# -------------------------------------------------------------------------
+SCENARIO_COLUMNS = ['GDP_per_Capita', 'Energy_Consumption_kWh']
+
+
+def read_scenarios(source):
+    """
+    Membaca tabel skenario (file upload atau teks CSV/TSV yang ditempel).
+    Wajib berisi kolom GDP_per_Capita dan Energy_Consumption_kWh (> 0).
+    """
+    import pandas as pd
+
+    df = pd.read_csv(source, sep=None, engine="python")
+    df.columns = [str(c).strip() for c in df.columns]
+
+    missing = [c for c in SCENARIO_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom {missing} tidak ada di tabel skenario.")
+    if df.empty:
+        raise ValueError("Tabel skenario kosong.")
+
+    values = df[SCENARIO_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    invalid = values.isna().any(axis=1) | (values <= 0).any(axis=1)
+    if invalid.any():
+        rows = ", ".join(str(i + 1) for i in np.flatnonzero(invalid.values)[:10])
+        raise ValueError(f"Nilai kosong / tidak positif pada baris: {rows}")
+
+    df[SCENARIO_COLUMNS] = values
+    return df
+
+
+def to_features(gdp_per_capita, energy_kwh):
+    """Nilai mentah -> fitur classifier, konvensi dataset DEC: log10(x + 1)"""
+    return np.log10(np.column_stack([gdp_per_capita, energy_kwh]).astype(float) + 1)
+
+
+def scenario_features(df):
+    """Fitur log10(x + 1) untuk seluruh skenario dalam satu array (n, 2)"""
+    return to_features(df[SCENARIO_COLUMNS[0]], df[SCENARIO_COLUMNS[1]])
+
+
+def scenario_results(df, result, tiers):
+    """Menggabungkan tabel skenario dengan label (ClusterTiers dari data DEC) & probabilitas hasil klasifikasi"""
+    out = df.copy()
+    labels = np.asarray(result["labels"])
+    out['Predicted_Cluster'] = labels
+    out['Predicted_Label'] = tiers.labels(labels)
+    if "proba" in result:
+        for j, c in enumerate(result["classes"]):
+            out[f'Prob_Cluster_{c}'] = np.round(result["proba"][:, j], 4)
+    return out
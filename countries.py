@@ -0,0 +1,102 @@
+"""
+Tabel dimensi negara: nama kanonik, ISO-3, region, kelompok pendapatan
+(klasifikasi World Bank FY2024) dan alias (countries.csv).
+
+Setiap dataset diberi kolom `Country_ID` (integer) saat dimuat, sehingga join
+antar dataset dan lookup negara memakai kunci integer, bukan perbandingan
+string nama (yang berbeda antar sumber: "Czech Republic" vs "Czechia", kolom
+`Country` vs `Country Name`). Peta memakai ISO-3 dari tabel ini.
+"""
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+COUNTRIES_PATH = os.path.join(base_path, "countries.csv")
+
+UNKNOWN_ID = -1
+AGGREGATE_REGION = "Aggregate"
+
+# Kolom atribut yang ditempelkan ke dataset oleh CountryIndex.attach
+ATTRIBUTES = ["ISO3", "Region", "Income_Group"]
+
+
+def normalize_name(name):
+    """Bentuk pembanding nama: tanpa aksen, huruf kecil, spasi & apostrof seragam"""
+    name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    name = name.replace("&", " and ").replace("`", "'").casefold()
+    return re.sub(r"\s+", " ", name).strip()
+
+
+class CountryIndex:
+    """
+    Dimensi negara dengan lookup nama/alias/ISO-3 -> Country_ID.
+    table: DataFrame ber-index Country_ID dengan kolom Country Name, ATTRIBUTES, Aliases.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self._ids = {}
+        for cid, row in table.iterrows():
+            for key in [row["Country Name"], row["ISO3"], *row["Aliases"]]:
+                if key:
+                    self._ids[normalize_name(key)] = cid
+
+    @classmethod
+    def from_names(cls, names):
+        """Dimensi darurat dari nama dataset saja (tanpa ISO-3 / region) jika countries.csv tidak terbaca"""
+        empty = pd.DataFrame({col: [] for col in ["Country Name", *ATTRIBUTES, "Aliases"]}, dtype=object)
+        return cls(empty.rename_axis("Country_ID")).with_names(names)
+
+    def with_names(self, names):
+        """
+        Salinan dimensi + baris baru (tanpa ISO-3 / region) untuk nama yang
+        belum dikenal, agar setiap negara di dataset tetap punya Country_ID unik.
+        """
+        new = sorted({n for n in pd.unique(pd.Series(names, dtype=object).dropna()) if self.id_of(n) == UNKNOWN_ID})
+        if not new:
+            return self
+        extra = pd.DataFrame({"Country Name": new, **{col: "" for col in ATTRIBUTES}, "Aliases": [[] for _ in new]})
+        return CountryIndex(pd.concat([self.table, extra], ignore_index=True).rename_axis("Country_ID"))
+
+    @property
+    def known_names(self):
+        return set(self.table["Country Name"]) | {a for aliases in self.table["Aliases"] for a in aliases}
+
+    def id_of(self, name):
+        return self._ids.get(normalize_name(name), UNKNOWN_ID)
+
+    def name_of(self, country_id):
+        """Nama kanonik untuk Country_ID (None jika tidak dikenal)"""
+        return self.table["Country Name"].iat[country_id] if 0 <= country_id < len(self.table) else None
+
+    def ids(self, names):
+        """Vektor nama -> array Country_ID (UNKNOWN_ID jika tidak dikenal); nama unik dinormalisasi sekali"""
+        codes, uniques = pd.factorize(pd.Series(names, dtype=object))
+        mapped = np.array([self.id_of(n) for n in uniques] + [UNKNOWN_ID], dtype=np.int32)
+        return mapped[codes]  # kode -1 (NaN) jatuh ke elemen terakhir = UNKNOWN_ID
+
+    def attach(self, df, name_col="Country Name"):
+        """Tambahkan kolom Country_ID + ATTRIBUTES (in-place) lalu kembalikan df"""
+        ids = self.ids(df[name_col])
+        known = ids != UNKNOWN_ID
+        df["Country_ID"] = ids
+        for col in ATTRIBUTES:
+            values = np.full(len(df), None, dtype=object)
+            values[known] = self.table[col].to_numpy()[ids[known]]
+            df[col] = values
+        return df
+
+
+def load_country_index(path=COUNTRIES_PATH):
+    table = pd.read_csv(path, keep_default_na=False, dtype=str)
+    missing = [c for c in ["Country Name", *ATTRIBUTES] if c not in table.columns]
+    if missing:
+        raise ValueError(f"Kolom {missing} tidak ada di {os.path.basename(path)}")
+    if "Aliases" not in table.columns:
+        table["Aliases"] = ""
+    table["Aliases"] = table["Aliases"].map(lambda s: [a.strip() for a in s.split("|") if a.strip()])
+    return CountryIndex(table.reset_index(drop=True).rename_axis("Country_ID"))
@@ -0,0 +1,80 @@
+"""
+Kubus agregasi region x kelompok pendapatan x tahun dari clustered_data_dec.csv.
+
+Dibangun sekali per isi file dengan groupby vektor untuk setiap kombinasi
+dimensi (termasuk total "Semua"), lalu dipotong per tahun dan per
+(region, pendapatan), sehingga setiap gerakan slider cukup satu lookup dict.
+"""
+from types import SimpleNamespace
+
+import pandas as pd
+
+from countries import AGGREGATE_REGION
+
+ALL = "Semua"
+DIMENSIONS = ["Region", "Income_Group"]
+INCOME_ORDER = ["Low income", "Lower middle income", "Upper middle income", "High income"]
+
+# Metrik per negara yang diringkas dengan rata-rata & kuantil antar negara
+COUNTRY_METRICS = ["Energy_Consumption_kWh", "GDP_per_Capita"]
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Kolom kubus -> label UI
+MEASURES = {
+    "Energy_per_Capita_kWh": "Energi per Kapita (kWh, tertimbang populasi)",
+    "GDP_per_Capita_Weighted": "GDP per Kapita (USD, tertimbang populasi)",
+    "Energy_Total_TWh": "Total Konsumsi Energi (TWh)",
+    "GDP_Total_Billion": "Total GDP (miliar USD)",
+    "Population_Total_Million": "Total Populasi (juta)",
+    "Countries": "Jumlah Negara",
+    **{f"{m}_{stat}": f"{m} ({stat})" for m in COUNTRY_METRICS
+       for stat in ["mean"] + [f"p{int(q * 100)}" for q in QUANTILES]},
+}
+
+
+def _aggregate(df, keys):
+    g = df.groupby(keys, sort=True)
+    sums = g[["GDP", "Population", "Energy_Total_kWh"]].sum()
+    out = pd.DataFrame({
+        "Countries": g["Country_ID"].nunique(),
+        "Energy_per_Capita_kWh": sums["Energy_Total_kWh"] / sums["Population"],
+        "GDP_per_Capita_Weighted": sums["GDP"] / sums["Population"],
+        "Energy_Total_TWh": sums["Energy_Total_kWh"] / 1e9,
+        "GDP_Total_Billion": sums["GDP"] / 1e9,
+        "Population_Total_Million": sums["Population"] / 1e6,
+    })
+    means = g[COUNTRY_METRICS].mean().add_suffix("_mean")
+    quant = g[COUNTRY_METRICS].quantile(list(QUANTILES)).unstack()
+    quant.columns = [f"{m}_p{int(q * 100)}" for m, q in quant.columns]
+    return out.join(means).join(quant)
+
+
+def build_cube(df):
+    """
+    DataFrame panjang (Region, Income_Group, Year) + MEASURES untuk semua
+    kombinasi dimensi; dimensi yang digulung bernilai ALL. Agregat
+    (World, North America) dan negara tanpa region tidak diikutkan.
+    """
+    df = df[df["Region"].notna() & (df["Region"] != "") & (df["Region"] != AGGREGATE_REGION)]
+    df = df.assign(Energy_Total_kWh=df["Energy_Consumption_kWh"] * df["Population"])
+
+    parts = []
+    for dims in (DIMENSIONS, ["Region"], ["Income_Group"], []):
+        agg = _aggregate(df, dims + ["Year"]).reset_index()
+        for d in DIMENSIONS:
+            if d not in dims:
+                agg[d] = ALL
+        parts.append(agg)
+    cube = pd.concat(parts, ignore_index=True)
+    return cube[DIMENSIONS + ["Year"] + list(MEASURES)]
+
+
+def slice_cube(cube):
+    """Potongan siap-lookup: by_year[tahun] (index dimensi) dan by_group[(region, pendapatan)] (index tahun)"""
+    by_year = {int(year): g.set_index(DIMENSIONS) for year, g in cube.groupby("Year")}
+    by_group = {key: g.set_index("Year") for key, g in cube.groupby(DIMENSIONS)}
+    regions = sorted(r for r in cube["Region"].unique() if r != ALL)
+    incomes = [i for i in INCOME_ORDER if i in set(cube["Income_Group"])]
+    incomes += sorted(set(cube["Income_Group"]) - set(incomes) - {ALL})
+    return SimpleNamespace(frame=cube, by_year=by_year, by_group=by_group, years=sorted(by_year),
+                           regions=[ALL] + regions, incomes=[ALL] + incomes)
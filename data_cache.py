@@ -0,0 +1,87 @@
+"""
+Sidik jari (fingerprint) file data untuk kunci cache.
+
+Loader di shared.py menerima fingerprint file yang dibacanya sebagai
+argumen, sehingga `st.cache_data` otomatis memuat ulang ketika CSV di disk
+berubah (ukuran, mtime, atau isi) tanpa perlu restart proses.
+"""
+import hashlib
+import os
+import threading
+import time
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+
+DATA_FILES = {
+    "lstm": os.path.join(base_path, "data_bersih.csv"),
+    "dec": os.path.join(base_path, "clustered_data_dec.csv"),
+    "granger": os.path.join(base_path, "granger_result_final.csv"),
+    "deepforest": os.path.join(base_path, "klasifikasi_deepforest.csv"),
+    "countries": os.path.join(base_path, "countries.csv"),
+}
+
+# Pengaturan cache loader data
+CACHE_TTL_SECONDS = 6 * 3600
+CACHE_MAX_ENTRIES = 4
+
+_hash_memo = {}
+_hash_lock = threading.Lock()
+
+
+def _content_hash(path, size, mtime_ns):
+    # Hash isi hanya dihitung ulang jika (size, mtime) berubah
+    key = (path, size, mtime_ns)
+    with _hash_lock:
+        if key in _hash_memo:
+            return _hash_memo[key]
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    with _hash_lock:
+        for old in [k for k in _hash_memo if k[0] == path]:
+            del _hash_memo[old]
+        _hash_memo[key] = digest
+    return digest
+
+
+def file_stat(path):
+    """(mtime_ns, size) tanpa membaca isi, atau None jika file tidak ada"""
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return None
+    return st_.st_mtime_ns, st_.st_size
+
+
+def file_fingerprint(path):
+    """(size, mtime_ns, hash isi) atau None jika file tidak ada"""
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return None
+    return (st_.st_size, st_.st_mtime_ns, _content_hash(path, st_.st_size, st_.st_mtime_ns))
+
+
+def content_key(*paths):
+    """
+    Kunci cache dari isi file saja: file yang di-touch tanpa perubahan isi
+    tidak membuang cache, file yang isinya berubah selalu membuangnya.
+    """
+    return tuple((fp[0], fp[2]) if fp else None for fp in map(file_fingerprint, paths))
+
+
+def describe(paths=DATA_FILES):
+    """Ringkasan fingerprint untuk panel admin"""
+    rows = []
+    for name, path in paths.items():
+        fp = file_fingerprint(path)
+        rows.append({
+            "Dataset": name,
+            "File": os.path.basename(path),
+            "Ukuran (KB)": round(fp[0] / 1024, 1) if fp else None,
+            "Diubah": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(fp[1] / 1e9)) if fp else "tidak ada",
+            "Hash": fp[2][:12] if fp else "-",
+        })
+    return rows
@@ -0,0 +1,291 @@
+"""
+Cache hasil komputasi di disk, dipakai bersama oleh semua proses dan
+bertahan setelah restart / deploy.
+
+Kunci = hash isi (nama fungsi, versi, argumen), nilai = blob pickle di
+satu direktori. Penulisan bersifat atomik (tulis file sementara lalu rename)
+dan dilindungi lock file antar-proses; pembacaan tidak perlu lock. Jika
+total ukuran melebihi batas, blob yang paling lama tidak dipakai (LRU,
+berdasarkan mtime yang diperbarui saat dibaca) dihapus.
+
+Ukuran & mtime blob disimpan di index memori yang diperbarui oleh get/set,
+sehingga eviction dan stats() tidak menelusuri direktori. Setiap penulisan
+menandai mtime file lock; penulis berikutnya yang melihat tanda dari proses
+lain memindai ulang direktori di bawah lock sebelum eviction, sehingga batas
+ukuran berlaku untuk semua proses. Kandidat eviction di-stat dulu: blob yang
+baru dibaca proses lain (mtime lebih baru dari index) tidak dihapus. Selain
+itu direktori dipindai saat index pertama dibuat, setiap RESCAN_SECONDS,
+atau lewat rescan() dari panel admin. Blob yang tidak bisa di-unpickle
+(rusak / dari versi kode lama) dianggap miss dan dihapus.
+
+    @disk_cached("forecast", version=1)
+    def hitung(window, n_years): ...
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("ENERGY_DISK_CACHE_DIR", os.path.join(base_path, ".cache", "disk"))
+MAX_BYTES = int(float(os.environ.get("ENERGY_DISK_CACHE_MB", "512")) * 1024 * 1024)
+ENABLED = os.environ.get("ENERGY_DISK_CACHE", "1") != "0"
+RESCAN_SECONDS = 600
+
+# Kelas pickle yang sudah tidak ada / berubah modul (versi kode lama) -> miss
+_STALE_ERRORS = (EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError)
+
+_MISSING = object()
+
+
+@contextmanager
+def _locked(directory):
+    """Lock eksklusif antar-proses untuk penulisan & eviction"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".lock"), "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class DiskCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index = None          # path -> (mtime, size), dibuat malas oleh _scan
+        self._total = 0
+        self._scanned_at = 0.0
+        self._lock_mark = None      # mtime_ns file lock setelah penulisan terakhir proses ini
+        self._index_lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _lock_path(self):
+        return os.path.join(self.directory, ".lock")
+
+    # --- Index memori ---
+    def _scan(self):
+        index = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".pkl"):
+                    path = os.path.join(root, name)
+                    try:
+                        st_ = os.stat(path)
+                    except OSError:
+                        continue
+                    index[path] = (st_.st_mtime, st_.st_size)
+        self._index, self._total, self._scanned_at = index, sum(size for _, size in index.values()), time.time()
+
+    def _ensure_index(self):
+        # Dipanggil dengan _index_lock dipegang
+        if self._index is None or time.time() - self._scanned_at > RESCAN_SECONDS:
+            self._scan()
+
+    def _record(self, path, size):
+        with self._index_lock:
+            self._ensure_index()
+            old = self._index.get(path)
+            self._total += size - (old[1] if old else 0)
+            self._index[path] = (time.time(), size)
+
+    def _forget(self, path):
+        with self._index_lock:
+            old = self._index.pop(path, None) if self._index is not None else None
+            if old:
+                self._total -= old[1]
+
+    def _touch(self, path):
+        with self._index_lock:
+            if self._index is not None and path in self._index:
+                self._index[path] = (time.time(), self._index[path][1])
+
+    def rescan(self):
+        """Pindai ulang direktori (mis. setelah proses lain menulis banyak blob)"""
+        with self._index_lock:
+            self._scan()
+
+    # --- API ---
+    def get(self, key, default=_MISSING):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except OSError:
+            return default
+        except _STALE_ERRORS:
+            self._discard(path)
+            return default
+        try:
+            os.utime(path)  # tandai baru dipakai (LRU)
+        except OSError:
+            pass
+        self._touch(path)
+        return value
+
+    def _discard(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        self._forget(path)
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp)
+            with _locked(self.directory):
+                self._sync_with_other_writers()
+                os.replace(tmp, path)
+                self._record(path, size)
+                self._evict()
+                self._mark_write()
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    # --- Koordinasi antar-proses (dipanggil dengan _locked dipegang) ---
+    def _sync_with_other_writers(self):
+        """Pindai ulang jika proses lain menulis sejak penulisan terakhir proses ini"""
+        try:
+            mark = os.stat(self._lock_path()).st_mtime_ns
+        except OSError:
+            mark = None
+        if mark != self._lock_mark:
+            with self._index_lock:
+                self._scan()
+
+    def _mark_write(self):
+        try:
+            os.utime(self._lock_path())
+            self._lock_mark = os.stat(self._lock_path()).st_mtime_ns
+        except OSError:
+            self._lock_mark = None
+
+    def _evict(self):
+        with self._index_lock:
+            if self._total <= self.max_bytes:
+                return
+            # Putaran pertama melewati blob yang baru dibaca proses lain; putaran
+            # kedua (urutan mtime aktual) dipakai hanya jika masih melebihi batas
+            for spare_recent in (True, False):
+                for path, (mtime, size) in sorted(self._index.items(), key=lambda item: item[1][0]):
+                    if self._total <= self.max_bytes:
+                        return
+                    try:
+                        st_ = os.stat(path)
+                    except OSError:
+                        self._index.pop(path, None)  # sudah dihapus proses lain
+                        self._total -= size
+                        continue
+                    if st_.st_size != size:
+                        self._total += st_.st_size - size
+                        size = st_.st_size
+                    self._index[path] = (st_.st_mtime, size)
+                    if spare_recent and st_.st_mtime > mtime:
+                        continue
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        continue
+                    del self._index[path]
+                    self._total -= size
+
+    def stats(self):
+        """Ringkasan dari index memori (tanpa menelusuri direktori)"""
+        with self._index_lock:
+            if self._index is None:
+                self._scan()
+            return {"entries": len(self._index), "bytes": self._total, "max_bytes": self.max_bytes}
+
+    def clear(self):
+        with _locked(self.directory), self._index_lock:
+            self._scan()
+            for path in list(self._index):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._index, self._total = {}, 0
+            self._mark_write()
+
+
+_default = DiskCache()
+
+
+def get_cache():
+    return _default
+
+
+def make_key(name, version, args, kwargs):
+    payload = pickle.dumps((name, version, args, sorted(kwargs.items())), protocol=4)
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+def disk_cached(name, version=1, cache=None):
+    """
+    Dekorator: hasil fungsi disimpan di disk dengan kunci hash argumen.
+    Argumen harus bisa di-pickle secara deterministik (angka, string, tuple).
+    Naikkan `version` jika logika fungsi berubah.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            c = cache or _default
+            if not ENABLED:
+                return func(*args, **kwargs)
+            key = make_key(name, version, args, kwargs)
+            value = c.get(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                try:
+                    c.set(key, value)
+                except OSError:
+                    pass  # disk penuh / read-only: tetap kembalikan hasil
+            return value
+
+        def peek(*args, **kwargs):
+            """Nilai tersimpan untuk argumen tsb tanpa menghitung (None jika belum ada)"""
+            if not ENABLED:
+                return None
+            value = (cache or _default).get(make_key(name, version, args, kwargs))
+            return None if value is _MISSING else value
+
+        def store(value, *args, **kwargs):
+            """Simpan hasil yang dihitung di tempat lain (mis. job background) di bawah kunci argumen tsb"""
+            if ENABLED:
+                try:
+                    (cache or _default).set(make_key(name, version, args, kwargs), value)
+                except OSError:
+                    pass
+
+        wrapper.peek, wrapper.store = peek, store
+        return wrapper
+    return decorator
@@ -0,0 +1,33 @@
+"""
+Ekspor tabel hasil (forecast semua negara, klasifikasi semua tahun) ke
+Parquet / CSV. Seluruh DataFrame ditulis sekaligus ke buffer memori oleh
+pandas/pyarrow, bukan dirangkai baris per baris.
+"""
+import io
+
+# label UI -> (ekstensi file, MIME)
+EXPORT_FORMATS = {
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "CSV": ("csv", "text/csv"),
+}
+
+
+def export_bytes(df, fmt):
+    """Tulis df ke buffer dalam format EXPORT_FORMATS[fmt]; Parquet butuh pyarrow"""
+    buf = io.BytesIO()
+    if fmt == "Parquet":
+        df.to_parquet(buf, index=False)
+    elif fmt == "CSV":
+        df.to_csv(buf, index=False, encoding="utf-8")
+    else:
+        raise ValueError(f"Format ekspor '{fmt}' tidak dikenal")
+    return buf.getvalue()
+
+
+def available_formats():
+    """Format yang bisa dipakai di lingkungan ini (Parquet hanya jika pyarrow terpasang)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return [f for f in EXPORT_FORMATS if f != "Parquet"]
+    return list(EXPORT_FORMATS)
@@ -0,0 +1,237 @@
+"""
+Mesin forecasting LSTM bersama.
+
+Berisi pemuatan model.h5 (dengan workaround `time_major`), pemuatan scaler,
+dan prediksi recursive yang di-vektorisasi: banyak sekuens (banyak negara /
+banyak request) diprediksi dalam satu panggilan model per langkah horizon.
+Dipakai oleh shared.py (dashboard) dan model_server.py.
+
+Backend inferensi dipilih lewat ENERGY_LSTM_BACKEND: "keras" (default, model.h5)
+atau model TFLite terkuantisasi hasil quantize.py ("tflite-dynamic" /
+"tflite-float16"). File TFLite yang hilang atau lebih tua dari model.h5 tidak
+dipakai; dashboard kembali ke model Keras dengan peringatan.
+"""
+import hashlib
+import os
+import pickle
+import threading
+import time
+import warnings
+
+import numpy as np
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(base_path, "model.h5")
+SCALER_PATH = os.path.join(base_path, "scalers.pkl")
+
+# Window model.h5 bawaan (input (None, 5, 1)); default training & cadangan jika input_shape tak terbaca
+DEFAULT_LOOK_BACK = 5
+
+BACKEND_KERAS = "keras"
+TFLITE_PATHS = {
+    "tflite-dynamic": os.path.join(base_path, "model_dynamic.tflite"),
+    "tflite-float16": os.path.join(base_path, "model_float16.tflite"),
+}
+LSTM_BACKEND = os.environ.get("ENERGY_LSTM_BACKEND", BACKEND_KERAS)
+
+
+def load_lstm_model(path=MODEL_PATH):
+    """Memuat model LSTM tanpa compile (TensorFlow baru di-import di sini)"""
+    from tensorflow.keras.layers import LSTM
+    from tensorflow.keras.models import load_model
+
+    # Wrapper untuk mengatasi error 'time_major'
+    class FixedLSTM(LSTM):
+        def __init__(self, **kwargs):
+            if 'time_major' in kwargs:
+                kwargs.pop('time_major')
+            super().__init__(**kwargs)
+
+    return load_model(path, custom_objects={'LSTM': FixedLSTM}, compile=False)
+
+
+class TFLiteModel:
+    """
+    Interpreter TFLite dengan antarmuka minimal seperti model Keras
+    (input_shape, predict), sehingga predict_next_step & get_look_back tidak berubah.
+    Memakai tflite_runtime jika terpasang (tanpa TensorFlow penuh), selain itu tf.lite.
+    """
+
+    def __init__(self, path):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+
+        self.path = path
+        self._interpreter = Interpreter(model_path=path)
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self.input_shape = (None,) + tuple(int(d) for d in self._input["shape"][1:])
+        self._batch = None
+        self._lock = threading.Lock()  # interpreter tidak thread-safe
+
+    def predict(self, x, verbose=0):
+        x = np.asarray(x, dtype=np.float32)
+        with self._lock:
+            if self._batch != len(x):
+                self._interpreter.resize_tensor_input(self._input["index"], x.shape)
+                self._interpreter.allocate_tensors()
+                self._batch = len(x)
+            self._interpreter.set_tensor(self._input["index"], x)
+            # LSTM hasil konversi bisa menyimpan state di resource variable: tiap
+            # panggilan harus mulai dari state nol seperti model Keras stateless
+            self._interpreter.reset_all_variables()
+            self._interpreter.invoke()
+            return self._interpreter.get_tensor(self._output["index"]).copy()
+
+
+def active_model_path(backend=None, model_path=MODEL_PATH):
+    """File model yang benar-benar dipakai backend tsb (model.h5 jika TFLite tidak layak)"""
+    backend = backend or LSTM_BACKEND
+    if backend == BACKEND_KERAS:
+        return model_path
+    path = TFLITE_PATHS.get(backend)
+    if path is None:
+        warnings.warn(f"Backend LSTM '{backend}' tidak dikenal, memakai Keras")
+        return model_path
+    if not os.path.exists(path):
+        warnings.warn(f"{os.path.basename(path)} belum ada (jalankan quantize.py), memakai Keras")
+        return model_path
+    if os.path.exists(model_path) and os.path.getmtime(path) < os.path.getmtime(model_path):
+        warnings.warn(f"{os.path.basename(path)} lebih tua dari model.h5 (jalankan ulang quantize.py), memakai Keras")
+        return model_path
+    return path
+
+
+def load_forecast_model(backend=None, model_path=MODEL_PATH):
+    """Model forecasting untuk backend terpilih: Keras (.h5) atau TFLiteModel (.tflite)"""
+    path = active_model_path(backend, model_path)
+    return TFLiteModel(path) if path.endswith(".tflite") else load_lstm_model(path)
+
+
+def load_scalers(path=SCALER_PATH):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+# Kunci di scalers.pkl berisi digest model.h5 pasangannya (ditulis train_lstm.save_artifacts)
+PAIR_KEY = "model_digest"
+
+
+def file_digest(path):
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_pair(model_path=MODEL_PATH, scaler_path=SCALER_PATH, backend=None, retries=40, wait=0.05):
+    """
+    (model, scalers) yang dijamin berpasangan. Dua file tidak bisa di-rename
+    bersamaan, jadi selama train_lstm.py menukar artefak pembaca bisa melihat
+    model baru + scaler lama: digest tidak cocok -> tunggu sebentar lalu ulangi.
+    Artefak lama tanpa PAIR_KEY diterima apa adanya.
+    """
+    for _ in range(retries):
+        scalers = load_scalers(scaler_path)
+        expected = scalers.get(PAIR_KEY) if isinstance(scalers, dict) else None
+        if expected is None:
+            return load_forecast_model(backend, model_path), scalers
+        if file_digest(model_path) == expected:
+            model = load_forecast_model(backend, model_path)
+            # model.h5 bisa berganti saat dimuat: cek ulang setelahnya
+            if file_digest(model_path) == expected:
+                return model, scalers
+        time.sleep(wait)
+    raise RuntimeError(f"{os.path.basename(model_path)} dan {os.path.basename(scaler_path)} tidak berpasangan "
+                       "(training ulang belum selesai menulis?)")
+
+
+def engine_signature(model_path=None, scaler_path=SCALER_PATH):
+    """
+    (mtime, size) kedua artefak; berubah ketika train_lstm.py menulis model baru.
+    Tanpa model_path: file model backend aktif (model.h5 atau .tflite).
+    """
+    model_path = model_path or active_model_path()
+    sig = []
+    for path in (model_path, scaler_path):
+        try:
+            st_ = os.stat(path)
+            sig.append((st_.st_mtime_ns, st_.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def get_look_back(model, default=DEFAULT_LOOK_BACK):
+    """Window size dari input shape model: (None, look_back, n_features)"""
+    input_shape = getattr(model, "input_shape", None)
+    if input_shape and len(input_shape) >= 2 and input_shape[1]:
+        return int(input_shape[1])
+    return default
+
+
+def predict_next_step(model, scalers, window):
+    """Prediksi satu langkah ke depan untuk batch window (n, look_back)"""
+    n, look_back = window.shape
+    seq_scaled = scalers["scaler_X"].transform(window).reshape(n, look_back, 1)
+    p_scaled = model.predict(seq_scaled, verbose=0)
+    return scalers["scaler_y"].inverse_transform(p_scaled)[:, 0]
+
+
+def iter_forecast(predict_next, seqs, n_years):
+    """
+    Generator prediksi recursive: menghasilkan (step, prediksi (n,)) per horizon,
+    sehingga hasil parsial bisa ditampilkan / dibatalkan di tengah jalan.
+    predict_next(window) -> array (n,) berisi log_Energy langkah berikutnya.
+    """
+    window = np.atleast_2d(np.asarray(seqs, dtype=float)).copy()
+    for step in range(n_years):
+        p = np.asarray(predict_next(window), dtype=float)
+        yield step, p
+        # Geser window: buang nilai tertua, masukkan prediksi
+        window[:, :-1] = window[:, 1:]
+        window[:, -1] = p
+
+
+def recursive_forecast(model, scalers, seqs, n_years):
+    """
+    Prediksi recursive untuk banyak sekuens sekaligus.
+
+    seqs : array (n, look_back) berisi log_Energy terakhir tiap sekuens.
+    Hasil: array (n, n_years) berisi prediksi log_Energy.
+    """
+    seqs = np.atleast_2d(np.asarray(seqs, dtype=float))
+    preds = np.empty((len(seqs), n_years))
+    step_fn = lambda w: predict_next_step(model, scalers, w)
+    for step, p in iter_forecast(step_fn, seqs, n_years):
+        preds[:, step] = p
+    return preds
+
+
+def to_kwh(log_values):
+    """Kebalikan dari log10(kWh + 1)"""
+    return np.power(10.0, log_values) - 1
+
+
+def latest_windows(df, look_back, value_col="log_Energy", require_consecutive=True):
+    """
+    Window terakhir (look_back tahun) untuk semua negara sekaligus.
+    Negara dengan data < look_back + 1 tahun dilewati (sama seperti halaman forecast).
+    require_consecutive=True juga melewati negara yang window terakhirnya
+    melintasi celah tahun (sama seperti windowing.build_windows).
+    Hasil: (countries, last_years, windows (n, look_back))
+    """
+    df = df.sort_values(["Country Name", "Year"])
+    sizes = df.groupby("Country Name").size()
+    eligible = sizes.index[sizes >= look_back + 1]
+
+    tail = df[df["Country Name"].isin(eligible)].groupby("Country Name").tail(look_back)
+    windows = tail[value_col].to_numpy(dtype=float).reshape(-1, look_back)
+    years = tail["Year"].to_numpy().astype(int).reshape(-1, look_back)
+    countries = tail["Country Name"].to_numpy()[look_back - 1::look_back]
+    keep = years[:, -1] - years[:, 0] == look_back - 1 if require_consecutive else slice(None)
+    return countries[keep], years[keep, -1], windows[keep]
@@ -0,0 +1,33 @@
+"""
+Pertumbuhan tahunan (YoY) dan elastisitas energi-GDP per negara-tahun.
+
+Dihitung sekali saat dataset dimuat dengan shift per negara (groupby vektor)
+dan disimpan sebagai kolom, sehingga kartu metrik & peta tinggal membaca.
+Pertumbuhan hanya diisi jika tahun sebelumnya tepat satu tahun lebih awal
+(celah tahun -> NaN, bukan pertumbuhan multi-tahun yang terlihat seperti YoY).
+"""
+import numpy as np
+
+GDP_GROWTH = "GDP_per_Capita_YoY"
+ENERGY_GROWTH = "Energy_YoY"
+ELASTICITY = "Energy_GDP_Elasticity"
+
+# |pertumbuhan GDP| (%) di bawah ambang ini membuat rasio meledak -> elastisitas NaN
+ELASTICITY_MIN_GDP_GROWTH = 0.5
+
+
+def add_growth_columns(df, key="Country_ID", gdp_col="GDP_per_Capita", energy_col="Energy_Consumption_kWh"):
+    """Tambahkan GDP_GROWTH, ENERGY_GROWTH (%) dan ELASTICITY (in-place) lalu kembalikan df"""
+    ordered = df.sort_values([key, "Year"], kind="stable")
+    grouped = ordered.groupby(key, sort=False)
+    consecutive = grouped["Year"].diff() == 1
+
+    for col, out in ((gdp_col, GDP_GROWTH), (energy_col, ENERGY_GROWTH)):
+        prev = grouped[col].shift(1)
+        growth = (ordered[col] / prev - 1) * 100
+        df[out] = growth.where(consecutive & (prev > 0))  # selaras kembali lewat index
+
+    gdp_growth = df[GDP_GROWTH]
+    df[ELASTICITY] = (df[ENERGY_GROWTH] / gdp_growth).where(gdp_growth.abs() >= ELASTICITY_MIN_GDP_GROWTH)
+    df[ELASTICITY] = df[ELASTICITY].replace([np.inf, -np.inf], np.nan)
+    return df
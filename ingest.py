@@ -0,0 +1,225 @@
+"""
+Ingestion data World Bank baru secara append-only.
+
+File ekspor mentah dibaca per chunk, divalidasi, lalu HANYA baris
+(Country Name, Year) yang belum ada ditambahkan di akhir data_bersih.csv
+dan clustered_data_dec.csv (tanpa menulis ulang file). Kolom turunan
+(GDP_per_Capita, log_Energy, log_GDP_per_Capita) dihitung untuk baris baru
+saja, dan Cluster baris baru ditetapkan ke centroid DEC terdekat.
+
+Baris baru ditentukan terpisah untuk setiap file tujuan (anti-join terhadap
+kunci file itu sendiri), jadi baris yang sudah ada di salah satu store tidak
+ditambahkan dua kali ke store tsb.
+
+Setiap ingestion menaikkan nomor revisi di ingest_manifest.json (status
+lokal, tidak di-commit), global dan per negara, sehingga dashboard hanya
+membuang cache milik negara yang berubah.
+
+Format yang didukung:
+  * long : kolom Country Name, Year, Energy_Consumption_kWh, GDP, Population
+  * wide : ekspor World Bank (Country Name, Indicator Code, 1960, 1961, ...)
+
+    python ingest.py export_baru.csv [--chunksize 50000] [--dry-run]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from quality import OK, build_report, invalid_rows
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+LSTM_PATH = os.path.join(base_path, "data_bersih.csv")
+DEC_PATH = os.path.join(base_path, "clustered_data_dec.csv")
+MANIFEST_PATH = os.path.join(base_path, "ingest_manifest.json")
+
+KEY = ["Country Name", "Year"]
+RAW_COLUMNS = ["Energy_Consumption_kWh", "GDP", "Population"]
+
+# Kode indikator World Bank -> kolom dataset
+WB_INDICATORS = {
+    "EG.USE.ELEC.KH.PC": "Energy_Consumption_kWh",
+    "NY.GDP.MKTP.CD": "GDP",
+    "SP.POP.TOTL": "Population",
+}
+
+
+# -------------------------------------------------------------------------
+# MANIFEST REVISI
+# -------------------------------------------------------------------------
+def read_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"revision": 0, "countries": {}, "history": []}
+
+
+def country_revision(manifest, country):
+    return manifest.get("countries", {}).get(country, 0)
+
+
+def _write_manifest(manifest, path=MANIFEST_PATH):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+# -------------------------------------------------------------------------
+# BACA & VALIDASI
+# -------------------------------------------------------------------------
+def _detect_format(path):
+    header = pd.read_csv(path, nrows=0).columns
+    return "wide" if "Indicator Code" in header else "long"
+
+
+def _wide_chunk_to_long(chunk):
+    chunk = chunk[chunk["Indicator Code"].isin(WB_INDICATORS)]
+    year_cols = [c for c in chunk.columns if str(c).strip().isdigit()]
+    melted = chunk.melt(id_vars=["Country Name", "Indicator Code"], value_vars=year_cols,
+                        var_name="Year", value_name="value")
+    melted["Year"] = melted["Year"].astype(int)
+    return melted.dropna(subset=["value"])
+
+
+def read_drop(path, fmt="auto", chunksize=50000):
+    """File ekspor -> DataFrame long (Country Name, Year, RAW_COLUMNS), dibaca per chunk"""
+    if fmt == "auto":
+        fmt = _detect_format(path)
+
+    if fmt == "wide":
+        parts = [_wide_chunk_to_long(c) for c in pd.read_csv(path, chunksize=chunksize)]
+        long = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=["Country Name", "Indicator Code", "Year", "value"])
+        long["column"] = long["Indicator Code"].map(WB_INDICATORS)
+        df = long.pivot_table(index=KEY, columns="column", values="value", aggfunc="last").reset_index()
+        df.columns.name = None
+    else:
+        missing = [c for c in KEY + RAW_COLUMNS if c not in pd.read_csv(path, nrows=0).columns]
+        if missing:
+            raise ValueError(f"Kolom {missing} tidak ditemukan di {path}")
+        parts = list(pd.read_csv(path, chunksize=chunksize, usecols=KEY + RAW_COLUMNS))
+        df = pd.concat(parts, ignore_index=True)
+
+    # Indikator yang tidak ada di ekspor wide -> kolom kosong (baris akan ditolak validasi)
+    return df.reindex(columns=KEY + RAW_COLUMNS)
+
+
+def validate_rows(df):
+    """
+    Validasi file ingestion dengan cek quality.py skema "lstm" (sama dengan
+    validasi saat dimuat); baris yang gagal cek tingkat baris berlevel error
+    dibuang. Kembalikan (df_valid, laporan).
+    """
+    report = {"rows_in": int(len(df))}
+    df = df.copy()
+    names = df["Country Name"]
+    df["Country Name"] = names.where(names.isna(), names.astype(str).str.strip())
+
+    issues = build_report({"lstm": df})
+    report["issues"] = {f"{r.Cek} ({r.Level})": int(r.Jumlah) for r in issues[issues["Level"] != OK].itertuples()}
+    bad = invalid_rows("lstm", df)
+    report["rows_invalid"] = int(bad.sum())
+    df = df[~bad]
+    for col in ["Year"] + RAW_COLUMNS:
+        df[col] = pd.to_numeric(df[col])
+    df["Year"] = df["Year"].astype(int)
+
+    dup = df.duplicated(KEY, keep="last")
+    report["rows_duplicate_in_drop"] = int(dup.sum())
+    return df[~dup], report
+
+
+def new_rows_only(df, store_path=LSTM_PATH):
+    """Anti-join terhadap kunci (Country Name, Year) yang sudah ada di store"""
+    if not os.path.exists(store_path):
+        return df
+    existing = pd.read_csv(store_path, usecols=KEY)
+    existing["Year"] = existing["Year"].astype(int)
+    merged = df.merge(existing.assign(_exists=True), on=KEY, how="left")
+    return df[merged["_exists"].isna().to_numpy()]
+
+
+# -------------------------------------------------------------------------
+# KOLOM TURUNAN (HANYA BARIS BARU)
+# -------------------------------------------------------------------------
+def derive_columns(df):
+    df = df.copy()
+    df["GDP_per_Capita"] = df["GDP"] / df["Population"]
+    df["log_Energy"] = np.log10(df["Energy_Consumption_kWh"] + 1)
+    df["log_GDP_per_Capita"] = np.log10(df["GDP_per_Capita"] + 1)
+    return df
+
+
+def assign_clusters(df_new, dec_path=DEC_PATH):
+    """Cluster baris baru = centroid DEC terdekat di ruang (log_GDP_per_Capita, log_Energy)"""
+    feats = ["log_GDP_per_Capita", "log_Energy"]
+    centroids = pd.read_csv(dec_path, usecols=feats + ["Cluster"]).groupby("Cluster")[feats].mean()
+    dist = ((df_new[feats].to_numpy()[:, None, :] - centroids.to_numpy()[None, :, :]) ** 2).sum(axis=2)
+    return centroids.index.to_numpy()[dist.argmin(axis=1)]
+
+
+def _append_csv(df, path):
+    # Kolom mengikuti urutan header file yang ada; mode append tanpa menulis ulang isi lama
+    columns = pd.read_csv(path, nrows=0).columns
+    df[list(columns)].to_csv(path, mode="a", header=False, index=False)
+
+
+# -------------------------------------------------------------------------
+# INGEST
+# -------------------------------------------------------------------------
+def ingest(path, fmt="auto", chunksize=50000, dry_run=False,
+           lstm_path=LSTM_PATH, dec_path=DEC_PATH, manifest_path=MANIFEST_PATH):
+    t0 = time.perf_counter()
+    df, report = validate_rows(read_drop(path, fmt, chunksize))
+    # Anti-join per file tujuan: baris yang sudah ada di salah satu store tidak ditambahkan lagi ke store itu
+    df_lstm = new_rows_only(df, lstm_path).sort_values(KEY)
+    df_dec = new_rows_only(df, dec_path).sort_values(KEY) if os.path.exists(dec_path) else df.iloc[:0]
+    report["rows_new"] = int(len(df_lstm))
+    report["rows_new_dec"] = int(len(df_dec))
+    report["countries"] = sorted(set(df_lstm["Country Name"]) | set(df_dec["Country Name"]))
+
+    if not dry_run and report["countries"]:
+        if len(df_lstm):
+            _append_csv(derive_columns(df_lstm), lstm_path)
+        if len(df_dec):
+            df_dec = derive_columns(df_dec)
+            df_dec["Cluster"] = assign_clusters(df_dec, dec_path)
+            _append_csv(df_dec, dec_path)
+
+        manifest = read_manifest(manifest_path)
+        manifest["revision"] = manifest.get("revision", 0) + 1
+        countries = manifest.setdefault("countries", {})
+        for c in report["countries"]:
+            countries[c] = manifest["revision"]
+        manifest.setdefault("history", []).append({
+            "revision": manifest["revision"],
+            "source": os.path.basename(path),
+            "rows": report["rows_new"],
+            "rows_dec": report["rows_new_dec"],
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        _write_manifest(manifest, manifest_path)
+        report["revision"] = manifest["revision"]
+
+    report["seconds"] = round(time.perf_counter() - t0, 3)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append-only ingestion ekspor World Bank")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--format", choices=["auto", "long", "wide"], default="auto")
+    parser.add_argument("--chunksize", type=int, default=50000)
+    parser.add_argument("--dry-run", action="store_true", help="Validasi saja, tanpa menulis")
+    args = parser.parse_args()
+
+    for file in args.files:
+        rep = ingest(file, args.format, args.chunksize, args.dry_run)
+        print(f"{file}: {rep['rows_new']} baris baru (DEC {rep['rows_new_dec']}) dari {rep['rows_in']} "
+              f"(invalid {rep['rows_invalid']}, duplikat {rep['rows_duplicate_in_drop']}) "
+              f"→ {len(rep['countries'])} negara, {rep['seconds']} s")
@@ -0,0 +1,167 @@
+"""
+Eksekusi job panjang (forecast banyak tahun / semua negara, training) di
+background thread pool agar script Streamlit tidak terblokir.
+
+Setiap job punya ID, status, progres, hasil parsial yang bertambah selama
+job berjalan, dan flag pembatalan yang dicek job di setiap langkah.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from forecasting import iter_forecast
+
+PENDING, RUNNING, DONE, CANCELLED, FAILED = "pending", "running", "done", "cancelled", "failed"
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, kind, params):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.status = PENDING
+        self.progress = 0.0
+        self.partial = []
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    # --- Dipanggil dari thread job ---
+    def publish(self, item, progress):
+        """Tambah hasil parsial; lempar JobCancelled jika job dibatalkan"""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        with self._lock:
+            self.partial.append(item)
+            self.progress = progress
+
+    # --- Dipanggil dari script Streamlit ---
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def active(self):
+        return self.status in (PENDING, RUNNING)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.partial), self.progress
+
+
+class JobManager:
+    def __init__(self, max_workers=2, keep_seconds=600):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="energy-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self.keep_seconds = keep_seconds
+
+    def submit(self, kind, fn, **params):
+        """Jalankan fn(job, **params) di background, kembalikan Job"""
+        job = Job(kind, params)
+        with self._lock:
+            self._purge()
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job, fn, params)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_job(self, kind):
+        """Job jenis tsb yang masih berjalan (dari sesi mana pun), terbaru dulu; None jika tidak ada"""
+        with self._lock:
+            running = [j for j in self._jobs.values() if j.kind == kind and j.active]
+        return max(running, key=lambda j: j.created, default=None)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def _run(self, job, fn, params):
+        if job.cancelled:
+            job.finished = time.time()
+            job.status = CANCELLED
+            return
+        job.status = RUNNING
+        status = FAILED
+        try:
+            job.result = fn(job, **params)
+            status = DONE
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            # finished diisi sebelum status agar pembaca tidak melihat DONE tanpa waktu selesai
+            job.finished = time.time()
+            job.status = status
+
+    def _purge(self):
+        # Buang job selesai yang sudah lama agar memori tidak tumbuh
+        now = time.time()
+        for job_id in [j.id for j in self._jobs.values()
+                       if j.finished is not None and now - j.finished > self.keep_seconds]:
+            del self._jobs[job_id]
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_manager():
+    """Satu JobManager per proses, dipakai bersama oleh semua sesi"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
+
+
+# -------------------------------------------------------------------------
+# JOB FORECAST
+# -------------------------------------------------------------------------
+def forecast_job(job, predict_next, seqs, n_years):
+    """
+    Forecast recursive per horizon; setiap horizon yang selesai dipublikasikan
+    sebagai array (n,) atau (n, n_fitur) sehingga grafik bisa diperbarui sebelum job selesai.
+    """
+    for step, p in iter_forecast(predict_next, seqs, n_years):
+        job.publish(p, (step + 1) / n_years)
+    partial, _ = job.snapshot()
+    return np.stack(partial, axis=1)
+
+
+# -------------------------------------------------------------------------
+# JOB TRAINING
+# -------------------------------------------------------------------------
+def training_job(job, epochs, **train_kwargs):
+    """
+    Training ulang LSTM univariat (train_lstm.train) di background. Setiap epoch
+    dipublikasikan sebagai {"epoch", "loss"}; pembatalan berlaku di akhir epoch
+    berjalan dan checkpoint tetap tersimpan, jadi training berikutnya melanjutkan.
+    Artefak ditulis atomik, lalu dashboard & model server memuatnya otomatis.
+    """
+    from train_lstm import save_artifacts, train
+
+    def on_epoch(epoch, logs):
+        job.publish({"epoch": epoch + 1, "loss": float((logs or {}).get("loss", np.nan))}, (epoch + 1) / epochs)
+
+    model, scalers, info = train(epochs=epochs, on_epoch=on_epoch, verbose=0, **train_kwargs)
+    save_artifacts(model, scalers)
+    return info
@@ -0,0 +1,86 @@
+"""
+Pelabelan cluster bersama untuk semua dataset (DEC, Deep Forest, prediksi classifier).
+
+Centroid tiap cluster dihitung sekali (satu groupby di ruang log10 GDP per
+kapita & energi), lalu diurutkan dari tier terendah ke tertinggi berdasarkan
+peringkat GDP dan energi. Label disimpan sebagai kolom kategorikal berurutan
+yang dibangun lewat `searchsorted` (tanpa dict `map` per baris), dan jumlah
+cluster berapa pun (k > 2) didukung tanpa kode tambahan di halaman.
+
+    tiers = rank_clusters(df, "Cluster")
+    df["Cluster Label"] = tiers.labels(df["Cluster"])
+"""
+import numpy as np
+import pandas as pd
+
+GDP_COL = "GDP_per_Capita"
+ENERGY_COL = "Energy_Consumption_kWh"
+
+# Nama tier dari terendah ke tertinggi, per jumlah cluster
+TIER_NAMES = {
+    1: ["All Countries"],
+    2: ["Low Economy - Low Energy", "High Economy - High Energy"],
+    3: ["Low Economy - Low Energy", "Middle Economy - Middle Energy", "High Economy - High Energy"],
+    4: ["Low Economy - Low Energy", "Lower-Middle Economy - Energy",
+        "Upper-Middle Economy - Energy", "High Economy - High Energy"],
+}
+
+# Palet merah (tier rendah) -> cyan (tier tinggi); k=2 memakai kedua ujungnya
+PALETTE = ["#FF6B6B", "#FF8E72", "#FFB26B", "#FFD166", "#C5E17A", "#8FD6A0", "#4ECDC4"]
+
+
+def tier_names(k):
+    if k in TIER_NAMES:
+        return list(TIER_NAMES[k])
+    return [f"Tier {i + 1}" + (" (Low)" if i == 0 else " (High)" if i == k - 1 else "") for i in range(k)]
+
+
+class ClusterTiers:
+    """
+    Urutan tier cluster:
+      ids    (k,) id cluster, dari tier terendah ke tertinggi
+      names  (k,) nama tier
+      colors {nama: warna}
+    """
+
+    def __init__(self, ids, names):
+        self.ids = np.asarray(ids)
+        self.names = list(names)
+        self.colors = dict(zip(self.names, (PALETTE[int(i)] for i in np.linspace(0, len(PALETTE) - 1, len(self.names)).round())))
+        self._order = np.argsort(self.ids, kind="stable")
+        self._sorted_ids = self.ids[self._order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def tier_of(self, clusters):
+        """Id cluster -> indeks tier (-1 untuk id yang tidak dikenal)"""
+        values = np.asarray(clusters)
+        if len(self.ids) == 0:
+            return np.full(values.shape, -1, dtype=int)
+        pos = np.searchsorted(self._sorted_ids, values).clip(0, len(self.ids) - 1)
+        known = self._sorted_ids[pos] == values
+        return np.where(known, self._order[pos], -1)
+
+    def labels(self, clusters):
+        """Id cluster -> Categorical berurutan (tier rendah < tier tinggi)"""
+        return pd.Categorical.from_codes(self.tier_of(clusters), categories=self.names, ordered=True)
+
+    def label_of(self, cluster):
+        tier = int(self.tier_of([cluster])[0])
+        return self.names[tier] if tier >= 0 else None
+
+
+def rank_clusters(df, cluster_col="Cluster", gdp_col=GDP_COL, energy_col=ENERGY_COL):
+    """
+    Peringkat cluster dari centroid log10(x + 1) GDP per kapita & energi:
+    skor = peringkat GDP + peringkat energi, seri dipecah dengan GDP.
+    """
+    feats = np.log10(df[[gdp_col, energy_col]].astype(float).clip(lower=0) + 1)
+    centroids = feats.groupby(df[cluster_col].to_numpy()).mean()
+    if centroids.empty:
+        return ClusterTiers([], [])
+
+    score = centroids.rank(method="average").sum(axis=1).to_numpy()
+    order = np.lexsort((centroids[gdp_col].to_numpy(), score))
+    return ClusterTiers(centroids.index.to_numpy()[order], tier_names(len(centroids)))
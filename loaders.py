@@ -0,0 +1,256 @@
+"""
+Pemuat dataset & forecast LSTM univariat tanpa Streamlit.
+
+Dipakai oleh shared.py (dashboard, dibungkus st.cache_data) dan api.py (proses
+uvicorn, tanpa runtime Streamlit sehingga tidak ada peringatan "bare mode").
+Lapisan cache-nya tidak bergantung pada Streamlit: cache disk lintas proses
+(disk_cache), memo per proses per fingerprint isi file (data_cache), dan
+model lokal yang dimuat sekali per signature jika model server tidak aktif.
+Objek hasil memo dipakai bersama antar thread, jadi jangan dimodifikasi.
+"""
+import functools
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from countries import UNKNOWN_ID, CountryIndex, load_country_index
+from data_cache import DATA_FILES, CACHE_MAX_ENTRIES, content_key, file_stat
+from disk_cache import disk_cached
+from forecasting import (MODEL_PATH, SCALER_PATH, TFLITE_PATHS, LSTM_BACKEND, engine_signature, active_model_path,
+                         load_pair, get_look_back, recursive_forecast, predict_next_step, latest_windows, to_kwh)
+from growth import add_growth_columns
+from labels import rank_clusters
+from model_server import get_client
+from quality import build_report
+
+DATA_KEYS = ("lstm", "dec", "granger", "countries")
+
+# Semua artefak yang bisa dipakai backend mana pun (lokal atau model server)
+MODEL_ARTIFACTS = (MODEL_PATH, SCALER_PATH, *TFLITE_PATHS.values())
+
+
+# -------------------------------------------------------------------------
+# DATA
+# -------------------------------------------------------------------------
+def quality_summary(frames, reference_names):
+    """Laporan quality.build_report untuk CSV mentah + waktu validasi & jumlah baris"""
+    t0 = time.perf_counter()
+    report = build_report(frames, reference_names)
+    return SimpleNamespace(report=report, validate_ms=(time.perf_counter() - t0) * 1000,
+                           rows={name: 0 if df is None else len(df) for name, df in frames.items()})
+
+@disk_cached("load_all_data", version=7)
+def load_all_data(fingerprint=None):
+    """
+    Memuat semua dataset sekaligus agar sinkron (fingerprint = isi file CSV di disk).
+    Dataset yang gagal dimuat bernilai None; alasannya dicatat di data['errors'].
+    Setiap dataset diberi kolom Country_ID / ISO3 / Region dari dimensi negara,
+    dan CSV mentahnya divalidasi sekali per isi file (data['quality']).
+    """
+    data = {'errors': {}}
+    raw = {}
+
+    # 1. Data LSTM (Data Bersih)
+    try:
+        df_lstm = pd.read_csv(DATA_FILES['lstm'])
+        raw['lstm'] = df_lstm.copy()
+        df_lstm["log_Energy"] = np.log10(df_lstm["Energy_Consumption_kWh"] + 1)
+        data['lstm'] = df_lstm
+    except (OSError, ValueError, KeyError) as e:
+        raw.setdefault('lstm', None)
+        data['lstm'] = None
+        data['errors']['lstm'] = str(e)
+
+    # 2. Data DEC (Clustering)
+    try:
+        df_dec = pd.read_csv(DATA_FILES['dec'])
+        raw['dec'] = df_dec.copy()
+        # Label tier (kategorikal) dihitung sekali per isi file, untuk k cluster berapa pun
+        tiers = rank_clusters(df_dec, 'Cluster')
+        df_dec['Cluster Label'] = tiers.labels(df_dec['Cluster'])
+        data['dec'] = df_dec
+        data['dec_tiers'] = tiers
+    except (OSError, ValueError, KeyError) as e:
+        raw.setdefault('dec', None)
+        data['dec'] = None
+        data['dec_tiers'] = None
+        data['errors']['dec'] = str(e)
+
+    # 3. Data Granger
+    try:
+        data['granger'] = pd.read_csv(DATA_FILES['granger'])
+        raw['granger'] = data['granger'].copy()
+    except (OSError, ValueError) as e:
+        data['granger'] = raw['granger'] = None
+        data['errors']['granger'] = str(e)
+
+    # 4. Dimensi negara: kunci integer untuk join & lookup, ISO-3 untuk peta.
+    # Nama yang belum ada di countries.csv tetap mendapat Country_ID sendiri.
+    name_cols = {'lstm': "Country Name", 'dec': "Country Name", 'granger': "Country"}
+    names = [data[k][col] for k, col in name_cols.items() if data[k] is not None and col in data[k].columns]
+    names = pd.concat(names, ignore_index=True) if names else pd.Series([], dtype=object)
+    try:
+        base = load_country_index(DATA_FILES['countries'])
+        reference = base.known_names
+        countries = base.with_names(names)
+    except (OSError, ValueError) as e:
+        reference = raw['lstm']['Country Name'].unique() if raw['lstm'] is not None else None
+        countries = CountryIndex.from_names(names)
+        data['errors']['countries'] = str(e)
+    for k, col in name_cols.items():
+        if data[k] is not None and col in data[k].columns:
+            countries.attach(data[k], col)
+    data['countries'] = countries
+
+    # 5. Pertumbuhan YoY & elastisitas energi-GDP (butuh Country_ID)
+    if data['dec'] is not None:
+        add_growth_columns(data['dec'])
+
+    # 6. Validasi kualitas CSV mentah (skema, tipe, kunci ganda, celah, nilai <= 0, nama negara),
+    # pada salinan yang diambil saat dibaca, sebelum kolom turunan di atas ditambahkan.
+    data['quality'] = quality_summary(raw, reference)
+
+    return data
+
+def data_fingerprint():
+    """Isi semua CSV yang dibaca load_all_data"""
+    return content_key(*(DATA_FILES[name] for name in DATA_KEYS))
+
+def lstm_data_key():
+    """Isi data_bersih.csv + countries.csv: kunci forecast per negara selain revisi manifest"""
+    return content_key(DATA_FILES['lstm'], DATA_FILES['countries'])
+
+@functools.lru_cache(maxsize=CACHE_MAX_ENTRIES)
+def _memo_data(fingerprint):
+    return load_all_data(fingerprint)
+
+def get_data():
+    """Dataset terkini untuk proses tanpa Streamlit (dimuat ulang jika isi CSV berubah)"""
+    return _memo_data(data_fingerprint())
+
+def country_id_of(country, data=None):
+    """Country_ID untuk nama / alias / ISO-3 (UNKNOWN_ID jika tidak dikenal)"""
+    countries = (data or get_data())['countries']
+    return countries.id_of(country) if countries is not None else UNKNOWN_ID
+
+
+# -------------------------------------------------------------------------
+# FORECASTING (LSTM UNIVARIAT)
+# -------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def load_forecast_engine(signature=None):
+    """Model (backend ENERGY_LSTM_BACKEND) & scaler dimuat sekali per signature (jika model server tidak aktif)"""
+    return load_pair()
+
+_model_info = {}
+
+def clear_memory():
+    """Buang memo proses (dataset, model lokal & info model), mis. dari tombol Refresh Data"""
+    _memo_data.cache_clear()
+    load_forecast_engine.cache_clear()
+    _model_info.clear()
+
+def model_generation(client=None):
+    """
+    Penanda murah (hanya stat, tanpa round-trip) untuk model yang menjawab:
+    generasi proses model server + (mtime, size) semua artefak model. Server
+    memuat ulang model saat artefaknya berubah, jadi info-nya sama selama ini sama.
+    """
+    return client.generation() if client is not None else None, tuple(map(file_stat, MODEL_ARTIFACTS))
+
+def forecast_model_info():
+    """
+    look_back, signature & model_key model univariat yang benar-benar menjawab:
+    milik model server jika aktif (backend & artefak server), selain itu model
+    lokal. Kunci cache forecast memakai nilai ini, sehingga hasil dari backend
+    berbeda tidak pernah berbagi entri cache. Di-memo per model_generation():
+    satu rerun dashboard / request API paling banyak satu round-trip info().
+    """
+    client = get_client()
+    key = model_generation(client)
+    info = _model_info.get(key)
+    if info is not None:
+        return info
+    if client is not None:
+        try:
+            info = client.info()
+            info = {**info, "signature": ("server",) + tuple(info["signature"])}
+        except ConnectionError:
+            pass
+    if info is None:
+        signature = engine_signature()
+        model, _ = load_forecast_engine(signature)
+        info = {"look_back": get_look_back(model), "signature": signature,
+                "model_key": (LSTM_BACKEND, content_key(active_model_path(), SCALER_PATH))}
+        if client is not None:
+            return info  # server tidak terjangkau: jangan di-memo, coba lagi di panggilan berikutnya
+    _model_info.clear()
+    _model_info[key] = info
+    return info
+
+def get_look_back_size():
+    return forecast_model_info()["look_back"]
+
+def model_signature():
+    """Signature model univariat aktif (server atau lokal) untuk kunci cache"""
+    return forecast_model_info()["signature"]
+
+def predict_log_energy(seqs, n_years):
+    """Prediksi recursive lewat model server bersama, fallback ke model lokal"""
+    client = get_client()
+    if client is not None:
+        try:
+            return client.forecast(seqs, n_years)
+        except ConnectionError:
+            pass
+    model, scalers = load_forecast_engine(engine_signature())
+    return recursive_forecast(model, scalers, seqs, n_years)
+
+def get_step_predictor():
+    """Fungsi prediksi satu langkah (untuk job background yang mengalirkan hasil per horizon)"""
+    client = get_client()
+    if client is None:
+        model, scalers = load_forecast_engine(engine_signature())
+        return lambda window: predict_next_step(model, scalers, window)
+
+    def predict_next(window):
+        # Server mati di tengah job: langkah ini & berikutnya dihitung di proses sendiri
+        try:
+            return client.forecast(window, 1)[:, 0]
+        except ConnectionError:
+            model, scalers = load_forecast_engine(engine_signature())
+            return predict_next_step(model, scalers, window)
+    return predict_next
+
+@disk_cached("forecast_window", version=2)
+def forecast_window(window, n_years, model_key):
+    """Cache disk lintas proses & restart: kunci = isi window + horizon + (backend, isi file model)"""
+    return predict_log_energy(np.array(window).reshape(1, -1), n_years)[0]
+
+def country_window(df_lstm, country_id):
+    """(window log_Energy terakhir, model_key) negara tsb; window None jika data terlalu pendek / bercelah"""
+    info = forecast_model_info()
+    _, _, windows = latest_windows(df_lstm[df_lstm["Country_ID"] == country_id], info["look_back"])
+    if len(windows) == 0:
+        return None, info["model_key"]
+    return tuple(map(float, windows[0])), info["model_key"]
+
+def forecast_frame(countries, last_years, preds):
+    """(negara, tahun terakhir, prediksi (n, h)) -> DataFrame panjang negara x horizon, siap diekspor"""
+    preds = np.asarray(preds, dtype=float)
+    c_idx, h_idx = np.indices(preds.shape).reshape(2, -1)
+    return pd.DataFrame({
+        "Country Name": countries[c_idx],
+        "Last_Year": last_years[c_idx],
+        "Horizon": h_idx + 1,
+        "Year": last_years[c_idx] + h_idx + 1,
+        "Predicted_log_Energy": preds.ravel(),
+        "Predicted_Energy_kWh": to_kwh(preds.ravel()),
+    })
+
+def all_country_forecasts(df_lstm, n_years):
+    """Forecast univariat semua negara dalam satu batch (satu panggilan model per horizon)"""
+    countries, last_years, windows = latest_windows(df_lstm, get_look_back_size())
+    return forecast_frame(countries, last_years, predict_log_energy(windows, n_years))
@@ -0,0 +1,339 @@
+"""
+Layanan inferensi lokal (opsional) untuk semua sesi Streamlit.
+
+Satu proses memegang model.h5 dan classifier, sehingga runtime TensorFlow
+dan salinan model hanya dibayar sekali. Request forecast / klasifikasi yang
+datang bersamaan dari berbagai sesi dikumpulkan selama beberapa milidetik
+lalu dijalankan sebagai satu batch (micro-batching).
+
+Cara pakai:
+    python model_server.py
+    ENERGY_MODEL_SERVER=$XDG_RUNTIME_DIR/energy-nexus-$USER/model.sock streamlit run app.py
+
+Keamanan: koneksi membawa pickle, jadi socket & authkey hanya boleh dibaca
+pemiliknya. Socket berada di direktori privat (0700) dengan mode 0600, dan
+authkey diambil dari ENERGY_MODEL_SERVER_KEY atau, jika tidak di-set, dibuat
+acak oleh server ke file 0600 di direktori yang sama (tidak ada kunci bawaan).
+
+Jika ENERGY_MODEL_SERVER tidak di-set, authkey tidak tersedia, atau server
+tidak bisa dihubungi, dashboard otomatis memakai model di proses sendiri.
+"""
+import argparse
+import getpass
+import os
+import queue
+import secrets
+import stat
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+
+RUNTIME_DIR = os.environ.get(
+    "ENERGY_MODEL_SERVER_DIR",
+    os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), f"energy-nexus-{getpass.getuser()}"),
+)
+DEFAULT_SOCKET = os.path.join(RUNTIME_DIR, "model.sock")
+KEY_FILE = os.path.join(RUNTIME_DIR, "authkey")
+
+
+def _check_private(path, mode):
+    """Tolak file / direktori milik user lain atau yang bisa diakses group / other"""
+    st_ = os.stat(path)
+    if hasattr(os, "getuid") and st_.st_uid != os.getuid():
+        raise PermissionError(f"{path} bukan milik user ini")
+    if stat.S_IMODE(st_.st_mode) & ~mode:
+        raise PermissionError(f"{path} harus bermode {oct(mode)}, bukan {oct(stat.S_IMODE(st_.st_mode))}")
+
+
+def ensure_runtime_dir(directory=RUNTIME_DIR):
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_private(directory, 0o700)
+    return directory
+
+
+def get_authkey(create=False, key_file=KEY_FILE):
+    """
+    Authkey dari ENERGY_MODEL_SERVER_KEY atau file kunci 0600.
+    create=True (server) membuat kunci acak jika belum ada; client mendapat None.
+    """
+    key = os.environ.get("ENERGY_MODEL_SERVER_KEY")
+    if key:
+        return key.encode()
+    try:
+        _check_private(key_file, 0o600)
+        with open(key_file, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        if not create:
+            return None
+    ensure_runtime_dir(os.path.dirname(key_file))
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(secrets.token_hex(32).encode())
+    return get_authkey(create=False, key_file=key_file)
+
+
+# -------------------------------------------------------------------------
+# SERVER
+# -------------------------------------------------------------------------
+class _Pending:
+    def __init__(self, request):
+        self.request = request
+        self.reply = None
+        self.done = threading.Event()
+
+
+class ModelServer:
+    def __init__(self, address=DEFAULT_SOCKET, max_batch=256, max_wait_ms=10):
+        self.address = address
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.inbox = queue.Queue()
+        self.model = None
+        self.scalers = None
+        self.clf = None
+        self.clf_status = None
+        self.clf_key = None
+        self.signature = None
+        self.model_key = None
+
+    def load(self):
+        self._load_forecaster()
+        self._load_classifier()
+        print(f"[model_server] model & classifier siap ({self.clf_status})", flush=True)
+
+    def _load_forecaster(self):
+        from data_cache import content_key
+        from forecasting import SCALER_PATH, LSTM_BACKEND, active_model_path, engine_signature, load_pair
+
+        self.signature = engine_signature()
+        self.model, self.scalers = load_pair()
+        # Backend & isi artefak milik server (bukan lingkungan client) untuk kunci cache client
+        self.model_key = (LSTM_BACKEND, content_key(active_model_path(), SCALER_PATH))
+
+    def _load_classifier(self):
+        import pandas as pd
+        from classifier import fit_classifier
+        from data_cache import DATA_FILES, content_key
+
+        key = content_key(DATA_FILES['dec'])
+        self.clf, self.clf_status = fit_classifier(pd.read_csv(DATA_FILES['dec']))
+        self.clf_key = key
+
+    def _reload_if_changed(self):
+        # model.h5 / scalers.pkl baru dari train_lstm.py dimuat tanpa restart server
+        from forecasting import engine_signature
+
+        if engine_signature() != self.signature:
+            self._load_forecaster()
+            print("[model_server] model baru dimuat", flush=True)
+
+    def _refit_if_changed(self):
+        # clustered_data_dec.csv berubah -> fit ulang, sama seperti classifier lokal (kunci content_key)
+        from data_cache import DATA_FILES, content_key
+
+        if content_key(DATA_FILES['dec']) != self.clf_key:
+            self._load_classifier()
+            print("[model_server] classifier di-fit ulang", flush=True)
+
+    # --- Batching ---
+    def _collect_batch(self):
+        batch = [self.inbox.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.inbox.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run_forecasts(self, items):
+        from forecasting import recursive_forecast
+
+        self._reload_if_changed()
+        seqs = [np.atleast_2d(np.asarray(it.request["seqs"], dtype=float)) for it in items]
+        n_years = max(int(it.request["n_years"]) for it in items)
+        preds = recursive_forecast(self.model, self.scalers, np.vstack(seqs), n_years)
+
+        start = 0
+        for it, s in zip(items, seqs):
+            it.reply = {"ok": True, "result": preds[start:start + len(s), :int(it.request["n_years"])]}
+            start += len(s)
+
+    def _run_info(self, items):
+        # Lewat antrean batch agar reload model tidak balapan dengan forecast yang berjalan
+        from forecasting import get_look_back
+
+        self._reload_if_changed()
+        info = {"look_back": get_look_back(self.model), "signature": self.signature, "model_key": self.model_key}
+        for it in items:
+            it.reply = {"ok": True, "result": info}
+
+    def _run_classify(self, items):
+        from classifier import predict_labels
+
+        self._refit_if_changed()
+        Xs = [np.atleast_2d(np.asarray(it.request["X"], dtype=float)) for it in items]
+        X = np.vstack(Xs)
+        labels = predict_labels(self.clf, X)
+        proba = self.clf.predict_proba(X) if any(it.request.get("proba") for it in items) else None
+
+        start = 0
+        for it, x in zip(items, Xs):
+            stop = start + len(x)
+            result = {"labels": labels[start:stop]}
+            if it.request.get("proba"):
+                result["proba"] = proba[start:stop]
+                result["classes"] = np.asarray(self.clf.classes_)
+            it.reply = {"ok": True, "result": result}
+            start = stop
+
+    def _batch_loop(self):
+        handlers = {"forecast": self._run_forecasts, "classify": self._run_classify, "info": self._run_info}
+        while True:
+            batch = self._collect_batch()
+            groups = {}
+            for it in batch:
+                groups.setdefault(it.request.get("op"), []).append(it)
+
+            for op, items in groups.items():
+                try:
+                    if op not in handlers:
+                        raise ValueError(f"Operasi tidak dikenal: {op}")
+                    handlers[op](items)
+                except Exception as e:
+                    for it in items:
+                        it.reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                for it in items:
+                    it.done.set()
+
+    # --- Koneksi ---
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                pending = _Pending(request)
+                self.inbox.put(pending)
+                pending.done.wait()
+                try:
+                    conn.send(pending.reply)
+                except OSError:
+                    return
+
+    def serve_forever(self):
+        authkey = get_authkey(create=True)
+        if os.path.dirname(os.path.abspath(self.address)) == os.path.abspath(RUNTIME_DIR):
+            ensure_runtime_dir()
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+        self.load()
+        threading.Thread(target=self._batch_loop, daemon=True).start()
+
+        # umask sebelum bind: socket tidak pernah sempat bermode lebih longgar dari 0600
+        old_umask = os.umask(0o177)
+        try:
+            listener = Listener(self.address, family="AF_UNIX", authkey=authkey)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.address, 0o600)
+
+        with listener:
+            print(f"[model_server] mendengarkan di {self.address}", flush=True)
+            while True:
+                try:
+                    conn = listener.accept()
+                except OSError:
+                    # Handshake authkey gagal / koneksi putus
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+
+# -------------------------------------------------------------------------
+# CLIENT
+# -------------------------------------------------------------------------
+class ModelClient:
+    """Satu koneksi per thread (sesi Streamlit berjalan di thread berbeda)"""
+
+    def __init__(self, address, authkey):
+        self.address = address
+        self.authkey = authkey
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = Client(self.address, family="AF_UNIX", authkey=self.authkey)
+            self._local.conn = conn
+        return conn
+
+    def _call(self, request):
+        try:
+            conn = self._conn()
+            conn.send(request)
+            reply = conn.recv()
+        except (EOFError, OSError, AuthenticationError):
+            self._local.conn = None
+            raise ConnectionError(f"Model server {self.address} tidak dapat dihubungi")
+        if not reply["ok"]:
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+    def info(self):
+        """look_back, signature & model_key model yang dipegang server (backend server, bukan client)"""
+        return self._call({"op": "info"})
+
+    def generation(self):
+        """(inode, mtime) socket: berubah setiap server start, tanpa round-trip ke server"""
+        try:
+            st_ = os.stat(self.address)
+        except OSError:
+            return None
+        return st_.st_ino, st_.st_mtime_ns
+
+    def look_back(self):
+        return self.info()["look_back"]
+
+    def forecast(self, seqs, n_years):
+        return self._call({"op": "forecast", "seqs": np.asarray(seqs, dtype=float), "n_years": int(n_years)})
+
+    def classify(self, X, proba=False):
+        return self._call({"op": "classify", "X": np.asarray(X, dtype=float), "proba": proba})
+
+
+_clients = {}
+
+
+def get_client():
+    """Client ke model server jika ENERGY_MODEL_SERVER di-set, socket ada, dan authkey tersedia"""
+    address = os.environ.get("ENERGY_MODEL_SERVER")
+    if not address or not os.path.exists(address):
+        return None
+    try:
+        authkey = get_authkey()
+    except PermissionError:
+        return None
+    if authkey is None:
+        return None
+    if address not in _clients:
+        _clients[address] = ModelClient(address, authkey)
+    return _clients[address]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Layanan inferensi bersama untuk dashboard")
+    parser.add_argument("--socket", default=os.environ.get("ENERGY_MODEL_SERVER", DEFAULT_SOCKET))
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    args = parser.parse_args()
+
+    ModelServer(args.socket, args.max_batch, args.max_wait_ms).serve_forever()
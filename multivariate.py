@@ -0,0 +1,214 @@
+"""
+Engine forecasting multivariat: energi, GDP per kapita, dan populasi.
+
+Berbeda dengan model.h5 (satu fitur log_Energy), model ini membaca window
+(look_back, 3) dan memprediksi ketiga fitur sekaligus sehingga bisa dipakai
+secara recursive. Setiap fitur punya MinMaxScaler sendiri.
+
+Training (CPU, batch lintas negara) + benchmark:
+    python multivariate.py --epochs 40 --look-back 5
+Menghasilkan model_multivariate.h5, scalers_multivariate.pkl dan
+model_multivariate.json (metadata + waktu training + latensi forecast).
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from forecasting import BACKEND_KERAS, DEFAULT_LOOK_BACK, load_pair
+from train_lstm import atomic_write, configure_cpu_threads, save_artifacts
+from windowing import build_windows
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+MV_MODEL_PATH = os.path.join(base_path, "model_multivariate.h5")
+MV_SCALER_PATH = os.path.join(base_path, "scalers_multivariate.pkl")
+MV_META_PATH = os.path.join(base_path, "model_multivariate.json")
+
+FEATURES = ["log_Energy", "log_GDP_per_Capita", "log_Population"]
+
+
+# -------------------------------------------------------------------------
+# DATA
+# -------------------------------------------------------------------------
+def prepare_panel(df):
+    """Tambah kolom fitur log dari data_bersih.csv, buang baris yang tidak valid"""
+    df = df.sort_values(["Country Name", "Year"]).copy()
+    df["GDP_per_Capita"] = df["GDP"] / df["Population"]
+    df["log_Energy"] = np.log10(df["Energy_Consumption_kWh"] + 1)
+    # Konvensi dataset (clustered_data_dec.csv, ingest.derive_columns): log10(x + 1)
+    df["log_GDP_per_Capita"] = np.log10(df["GDP_per_Capita"].where(df["GDP_per_Capita"] > 0) + 1)
+    df["log_Population"] = np.log10(df["Population"].where(df["Population"] > 0))
+    return df.dropna(subset=FEATURES).reset_index(drop=True)
+
+
+def fit_scalers(panel):
+    from sklearn.preprocessing import MinMaxScaler
+    return {f: MinMaxScaler().fit(panel[[f]].to_numpy()) for f in FEATURES}
+
+
+def transform(scalers, values):
+    """values (..., n_features) -> skala 0-1 per fitur"""
+    out = np.empty_like(values, dtype=float)
+    for j, f in enumerate(FEATURES):
+        out[..., j] = scalers[f].transform(values[..., j].reshape(-1, 1)).reshape(values.shape[:-1])
+    return out
+
+
+def inverse_transform(scalers, values):
+    out = np.empty_like(values, dtype=float)
+    for j, f in enumerate(FEATURES):
+        out[..., j] = scalers[f].inverse_transform(values[..., j].reshape(-1, 1)).reshape(values.shape[:-1])
+    return out
+
+
+def latest_mv_windows(panel, look_back, require_consecutive=True):
+    """Window terakhir tiap negara: (countries, last_years, windows (n, look_back, 3)); lihat latest_windows"""
+    sizes = panel.groupby("Country Name").size()
+    eligible = sizes.index[sizes >= look_back + 1]
+    tail = panel[panel["Country Name"].isin(eligible)].groupby("Country Name").tail(look_back)
+    windows = tail[FEATURES].to_numpy(dtype=float).reshape(-1, look_back, len(FEATURES))
+    years = tail["Year"].to_numpy().astype(int).reshape(-1, look_back)
+    countries = tail["Country Name"].to_numpy()[look_back - 1::look_back]
+    keep = years[:, -1] - years[:, 0] == look_back - 1 if require_consecutive else slice(None)
+    return countries[keep], years[keep, -1], windows[keep]
+
+
+# -------------------------------------------------------------------------
+# MODEL
+# -------------------------------------------------------------------------
+def build_model(look_back, n_features=len(FEATURES)):
+    from tensorflow.keras import Sequential
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+
+    model = Sequential([
+        Input(shape=(look_back, n_features)),
+        LSTM(64, return_sequences=True),
+        Dropout(0.2),
+        LSTM(32),
+        Dropout(0.2),
+        Dense(16, activation="relu"),
+        Dense(n_features),
+    ])
+    model.compile(optimizer="adam", loss="mse")
+    return model
+
+
+def train(df, look_back=DEFAULT_LOOK_BACK, epochs=40, batch_size=256, validation_split=0.1, verbose=1):
+    """Training batch lintas negara. Mengembalikan (model, scalers, meta)"""
+    panel = prepare_panel(df)
+    scalers = fit_scalers(panel)
+    ws = build_windows(panel, FEATURES, look_back)
+    X, y = ws.X, ws.y[:, 0, :]
+    X_s, y_s = transform(scalers, X), transform(scalers, y)
+
+    # Acak sekali agar validation_split tidak hanya berisi negara terakhir
+    order = np.random.default_rng(42).permutation(len(X_s))
+    X_s, y_s = X_s[order], y_s[order]
+
+    model = build_model(look_back)
+    t0 = time.perf_counter()
+    history = model.fit(X_s, y_s, epochs=epochs, batch_size=batch_size,
+                        validation_split=validation_split, verbose=verbose)
+    train_seconds = time.perf_counter() - t0
+
+    meta = {
+        "features": FEATURES,
+        "look_back": look_back,
+        "epochs": epochs,
+        "batch_size": batch_size,
+        "n_windows": int(len(X_s)),
+        "n_countries": int(panel["Country Name"].nunique()),
+        "train_seconds": round(train_seconds, 2),
+        "final_loss": float(history.history["loss"][-1]),
+        "final_val_loss": float(history.history.get("val_loss", [np.nan])[-1]),
+    }
+    return model, scalers, meta
+
+
+def predict_next_mv(model, scalers, window):
+    """Prediksi satu langkah untuk batch window (n, look_back, 3) -> (n, 3)"""
+    p_scaled = model.predict(transform(scalers, window), verbose=0)
+    return inverse_transform(scalers, np.asarray(p_scaled))
+
+
+def forecast(model, scalers, windows, n_years):
+    """Forecast recursive: (n, look_back, 3) -> (n, n_years, 3)"""
+    from forecasting import iter_forecast
+
+    windows = np.asarray(windows, dtype=float)
+    preds = np.empty((len(windows), n_years, len(FEATURES)))
+    step_fn = lambda w: predict_next_mv(model, scalers, w)
+    for step, p in iter_forecast(step_fn, windows, n_years):
+        preds[:, step] = p
+    return preds
+
+
+def benchmark_latency(model, scalers, windows, n_years=10, repeats=5):
+    """Latensi forecast (ms): satu negara dan semua negara sekaligus"""
+    forecast(model, scalers, windows[:1], n_years)  # warm-up
+    result = {}
+    for name, w in [("single_country_ms", windows[:1]), ("all_countries_ms", windows)]:
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            forecast(model, scalers, w, n_years)
+            times.append((time.perf_counter() - t0) * 1000)
+        result[name] = round(float(np.median(times)), 2)
+    result["horizon"] = n_years
+    result["n_countries_batch"] = int(len(windows))
+    return result
+
+
+# -------------------------------------------------------------------------
+# PERSISTENSI
+# -------------------------------------------------------------------------
+def save_engine(model, scalers, meta, model_path=MV_MODEL_PATH, scaler_path=MV_SCALER_PATH, meta_path=MV_META_PATH):
+    """
+    Penulisan atomik seperti train_lstm: metadata dulu, lalu model + scaler
+    (scaler membawa digest model pasangannya), sehingga proses yang mati di
+    tengah jalan tidak meninggalkan pasangan model / scaler yang tidak cocok.
+    """
+    def dump_meta(p):
+        with open(p, "w") as f:
+            json.dump(meta, f, indent=2)
+
+    atomic_write(meta_path, dump_meta)
+    save_artifacts(model, scalers, model_path, scaler_path)
+
+
+def engine_available(model_path=MV_MODEL_PATH, scaler_path=MV_SCALER_PATH):
+    return os.path.exists(model_path) and os.path.exists(scaler_path)
+
+
+def load_engine(model_path=MV_MODEL_PATH, scaler_path=MV_SCALER_PATH, meta_path=MV_META_PATH):
+    """Mengembalikan (model, scalers, meta); model & scaler dijamin berpasangan (forecasting.load_pair)"""
+    model, scalers = load_pair(model_path, scaler_path, backend=BACKEND_KERAS)
+    meta = {}
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+    return model, scalers, meta
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Training model LSTM multivariat (energi, GDP/kapita, populasi)")
+    parser.add_argument("--data", default=os.path.join(base_path, "data_bersih.csv"))
+    parser.add_argument("--look-back", type=int, default=DEFAULT_LOOK_BACK)
+    parser.add_argument("--epochs", type=int, default=40)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--intra-op", type=int, default=None, help="Thread intra-op TensorFlow")
+    parser.add_argument("--inter-op", type=int, default=None, help="Thread inter-op TensorFlow")
+    args = parser.parse_args()
+
+    configure_cpu_threads(args.intra_op, args.inter_op)
+    df_raw = pd.read_csv(args.data)
+    model, scalers, meta = train(df_raw, args.look_back, args.epochs, args.batch_size)
+
+    _, _, windows = latest_mv_windows(prepare_panel(df_raw), args.look_back)
+    meta["latency"] = benchmark_latency(model, scalers, windows)
+    save_engine(model, scalers, meta)
+
+    print(json.dumps(meta, indent=2))
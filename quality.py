@@ -0,0 +1,165 @@
+"""
+Validasi kualitas data (vektor, tanpa loop per baris).
+
+Dijalankan terhadap CSV mentah saat dimuat (loaders.load_all_data, sebelum
+konversi tipe / log10) dan terhadap file ingestion: skema kolom, tipe data,
+kunci (negara, tahun) ganda, celah tahun per negara, nilai <= 0 sebelum log10,
+dan nama negara yang tidak dikenal dataset acuan. Hasilnya satu tabel laporan
+(satu baris per dataset x cek) untuk halaman admin; invalid_rows() memakai cek
+tingkat baris yang sama untuk menolak baris saat ingestion.
+"""
+import numpy as np
+import pandas as pd
+
+OK, WARNING, ERROR = "ok", "warning", "error"
+
+# kolom -> jenis ("str", "int", "num")
+SCHEMAS = {
+    "lstm": {"Country Name": "str", "Year": "int", "Energy_Consumption_kWh": "num", "GDP": "num",
+             "Population": "num"},
+    "dec": {"Country Name": "str", "Year": "int", "Energy_Consumption_kWh": "num", "GDP": "num",
+            "Population": "num", "GDP_per_Capita": "num", "log_Energy": "num", "log_GDP_per_Capita": "num",
+            "Cluster": "int"},
+    "granger": {"Country": "str", "Hypothesis": "str", "P_Val_Energy_to_GDP": "num", "P_Val_GDP_to_Energy": "num"},
+    "deepforest": {"Country Name": "str", "Year": "int", "GDP_per_Capita": "num", "Energy_Consumption_kWh": "num",
+                   "DeepForest_Predicted_Cluster": "int"},
+}
+
+# Kolom yang masuk log10 / pembagian di pipeline -> harus > 0
+POSITIVE_COLUMNS = {
+    "lstm": ["Energy_Consumption_kWh", "GDP", "Population"],
+    "dec": ["Energy_Consumption_kWh", "GDP_per_Capita"],
+    "deepforest": ["Energy_Consumption_kWh", "GDP_per_Capita"],
+}
+
+# Kolom pembagi GDP per kapita (harus > 0) dan kolom yang masuk log10(x + 1) (harus >= 0):
+# baris yang melanggar tidak bisa dipakai pipeline -> error, ditolak saat ingestion
+REQUIRED_POSITIVE = {"lstm": ["GDP", "Population"]}
+REQUIRED_NON_NEGATIVE = {"lstm": ["Energy_Consumption_kWh"]}
+
+COUNTRY_COLUMN = {"granger": "Country"}
+
+MAX_EXAMPLES = 5
+
+
+def _issue(dataset, check, level, count=0, examples=()):
+    return {"Dataset": dataset, "Cek": check, "Level": level, "Jumlah": int(count),
+            "Contoh": ", ".join(map(str, list(examples)[:MAX_EXAMPLES]))}
+
+
+def _level(count, bad=ERROR):
+    return bad if count else OK
+
+
+def year_gaps(df, country_col="Country Name"):
+    """Celah tahun per negara: DataFrame (country, Year_From, Year_To, Missing)"""
+    df = df[[country_col, "Year"]].dropna().sort_values([country_col, "Year"])
+    years = df["Year"].to_numpy(dtype=float)
+    countries = df[country_col].to_numpy()
+    if len(years) < 2:
+        return pd.DataFrame(columns=[country_col, "Year_From", "Year_To", "Missing"])
+    step = np.diff(years)
+    gap = (countries[1:] == countries[:-1]) & (step > 1)
+    return pd.DataFrame({
+        country_col: countries[1:][gap],
+        "Year_From": years[:-1][gap].astype(int),
+        "Year_To": years[1:][gap].astype(int),
+        "Missing": (step[gap] - 1).astype(int),
+    })
+
+
+def _type_mask(series, kind):
+    """Nilai kosong / non-numerik, atau pecahan di kolom integer"""
+    if kind == "str":
+        return series.isna() | (series.astype(str).str.strip() == "")
+    values = pd.to_numeric(series, errors="coerce")
+    bad = values.isna()
+    if kind == "int":
+        bad |= values.notna() & (values != values.round())
+    return bad
+
+
+def _range_masks(name, df):
+    """{nama cek: mask} untuk nilai yang membuat baris tidak terpakai pipeline"""
+    masks = {}
+    for col in REQUIRED_POSITIVE.get(name, []):
+        masks[f"{col} <= 0"] = pd.to_numeric(df[col], errors="coerce") <= 0
+    for col in REQUIRED_NON_NEGATIVE.get(name, []):
+        masks[f"{col} < 0"] = pd.to_numeric(df[col], errors="coerce") < 0
+    return masks
+
+
+def invalid_rows(name, df):
+    """Mask baris yang gagal cek tingkat baris berlevel error (tipe & rentang nilai wajib)"""
+    bad = pd.Series(False, index=df.index)
+    for col, kind in SCHEMAS[name].items():
+        bad |= _type_mask(df[col], kind)
+    for mask in _range_masks(name, df).values():
+        bad |= mask
+    return bad
+
+
+def validate(name, df, reference_names=None):
+    """Semua cek untuk satu dataset mentah; hasil: list baris laporan"""
+    schema = SCHEMAS[name]
+    country_col = COUNTRY_COLUMN.get(name, "Country Name")
+    issues = []
+
+    missing = [c for c in schema if c not in df.columns]
+    issues.append(_issue(name, "Skema kolom", _level(len(missing)), len(missing), missing))
+    if missing:
+        return issues
+
+    # Tipe data: nilai non-numerik / kosong, dan kolom integer yang disimpan sebagai float
+    for col, kind in schema.items():
+        bad = _type_mask(df[col], kind)
+        if kind == "str":
+            issues.append(_issue(name, f"Tipe {col}", _level(bad.sum()), bad.sum(), df.index[bad]))
+            continue
+        if kind == "int" and not bad.any() and not pd.api.types.is_integer_dtype(df[col]):
+            issues.append(_issue(name, f"Tipe {col}", WARNING, len(df), [f"disimpan sebagai {df[col].dtype}"]))
+            continue
+        issues.append(_issue(name, f"Tipe {col}", _level(bad.sum()), bad.sum(), df.loc[bad, col]))
+
+    # Kunci ganda
+    key = [country_col, "Year"] if "Year" in schema else [country_col]
+    dup = df.duplicated(key, keep=False)
+    examples = df.loc[dup, key].drop_duplicates().astype(str).agg(" ".join, axis=1) if dup.any() else []
+    issues.append(_issue(name, "Kunci ganda " + "/".join(key), _level(dup.sum()), dup.sum(), examples))
+
+    # Celah tahun (deret tidak kontinu -> window LSTM melompati tahun)
+    if "Year" in schema:
+        gaps = year_gaps(df.assign(Year=pd.to_numeric(df["Year"], errors="coerce")), country_col)
+        examples = gaps[country_col].astype(str) + " " + gaps["Year_From"].astype(str) + "→" + gaps["Year_To"].astype(str)
+        issues.append(_issue(name, "Celah tahun", _level(len(gaps), WARNING), len(gaps), examples))
+
+    # Nilai yang membuat baris tidak terpakai (pembagi nol, log10 dari nilai negatif)
+    for check, mask in _range_masks(name, df).items():
+        issues.append(_issue(name, check, _level(mask.sum()), mask.sum(), df.loc[mask, country_col].unique()))
+
+    # Nilai <= 0 sebelum log10 (masih terhitung, tapi mencurigakan)
+    for col in POSITIVE_COLUMNS.get(name, []):
+        if col in REQUIRED_POSITIVE.get(name, []):
+            continue
+        non_pos = pd.to_numeric(df[col], errors="coerce") <= 0
+        issues.append(_issue(name, f"{col} <= 0", _level(non_pos.sum(), WARNING), non_pos.sum(),
+                             df.loc[non_pos, country_col].unique()))
+
+    # Nama negara yang tidak dikenal dataset acuan (hilang dari peta / join)
+    if reference_names is not None:
+        names = pd.Series(df[country_col].dropna().unique())
+        unknown = names[~names.isin(reference_names)]
+        issues.append(_issue(name, "Nama negara tidak dikenal", _level(len(unknown), WARNING), len(unknown), unknown))
+
+    return issues
+
+
+def build_report(frames, reference_names=None):
+    """frames: {nama dataset: DataFrame mentah atau None} -> DataFrame laporan"""
+    rows = []
+    for name, df in frames.items():
+        if df is None:
+            rows.append(_issue(name, "File", ERROR, 1, ["tidak ditemukan / gagal dibaca"]))
+            continue
+        rows.extend(validate(name, df, reference_names))
+    return pd.DataFrame(rows, columns=["Dataset", "Cek", "Level", "Jumlah", "Contoh"])
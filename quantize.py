@@ -0,0 +1,225 @@
+"""
+Ekspor model.h5 ke TFLite terkuantisasi untuk inferensi CPU yang lebih ringan.
+
+    python quantize.py --mode dynamic      # bobot int8, aktivasi float (dynamic-range)
+    python quantize.py --mode float16      # bobot float16
+
+Setelah konversi, model TFLite dibandingkan dengan model Keras pada data
+bawaan (data_bersih.csv): selisih prediksi satu langkah, selisih forecast
+recursive, dan galat backtest keduanya terhadap data asli. File .tflite hanya
+disimpan jika lolos batas paritas (atau --force). Hasil paritas, latensi, dan
+memori ditulis ke model_quant.json.
+
+File .tflite & laporan ditulis di folder model sumber (mis. models/v2/ untuk
+--model models/v2/model.h5), jadi mengkuantisasi versi arsip tidak menimpa
+model_*.tflite di root yang dipasangkan dengan model.h5 root; --out untuk path lain.
+
+Aktifkan di dashboard / model server / API:
+    ENERGY_LSTM_BACKEND=tflite-dynamic streamlit run app.py
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from forecasting import (MODEL_PATH, SCALER_PATH, BACKEND_KERAS, TFLITE_PATHS, TFLiteModel, load_pair,
+                         get_look_back, predict_next_step, recursive_forecast, latest_windows)
+from windowing import build_windows
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(base_path, "data_bersih.csv")
+REPORT_NAME = "model_quant.json"
+REPORT_PATH = os.path.join(base_path, REPORT_NAME)
+
+MODES = ("dynamic", "float16")
+
+# Batas paritas (log10 kWh): 0.005 ~ 1,2% pada kWh untuk rata-rata selisih satu langkah,
+# dan galat backtest TFLite boleh memburuk paling banyak 0.002 dibanding Keras.
+# Galat kuantisasi menumpuk pada forecast recursive (yang ditampilkan dashboard),
+# jadi selisih forecast PARITY_HORIZON tahun punya batas rata-rata & maksimum sendiri.
+MAX_MEAN_ABS_DIFF = 0.005
+MAX_BACKTEST_DEGRADATION = 0.002
+PARITY_HORIZON = 10
+MAX_FORECAST_MEAN_ABS_DIFF = 0.01
+MAX_FORECAST_MAX_ABS_DIFF = 0.05
+
+
+def unrolled(model):
+    """
+    Salinan model dengan setiap layer RNN di-unroll (bobot sama). LSTM Keras 3
+    dikonversi menjadi while-loop TensorList yang butuh op Select TF (Flex);
+    dengan look_back tetap, unroll menghasilkan op builtin saja (MatMul, Sigmoid, Tanh, ...).
+    """
+    import tensorflow as tf
+
+    def clone(layer):
+        config = layer.get_config()
+        if "unroll" in config:
+            config["unroll"] = True
+        return layer.__class__.from_config(config)
+
+    copy = tf.keras.models.clone_model(model, clone_function=clone)
+    copy.set_weights(model.get_weights())
+    return copy
+
+
+def convert(model, mode):
+    """Model Keras -> bytes flatbuffer TFLite (hanya op builtin, tanpa runtime Flex)"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(unrolled(model))
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if mode == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+    return converter.convert()
+
+
+def rss_mb():
+    """Resident memory proses (MB) dari /proc; None jika tidak tersedia"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        return None
+
+
+def timed_load(load_fn):
+    """(model, waktu muat ms, kenaikan RSS MB)"""
+    before, t0 = rss_mb(), time.perf_counter()
+    model = load_fn()
+    load_ms, after = (time.perf_counter() - t0) * 1000, rss_mb()
+    return model, load_ms, None if before is None or after is None else after - before
+
+
+def benchmark_latency(model, scalers, windows, n_years=PARITY_HORIZON, repeats=5):
+    """Median ms forecast recursive untuk 1 negara dan semua negara sekaligus"""
+    result = {"n_countries_batch": int(len(windows))}
+    for label, seqs in (("single_country_ms", windows[:1]), ("all_countries_ms", windows)):
+        recursive_forecast(model, scalers, seqs, 1)  # pemanasan (alokasi tensor)
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            recursive_forecast(model, scalers, seqs, n_years)
+            times.append((time.perf_counter() - t0) * 1000)
+        result[label] = round(float(np.median(times)), 2)
+    return result
+
+
+def parity(reference, candidate, scalers, df, look_back):
+    """Selisih TFLite vs Keras + galat backtest keduanya terhadap data asli (log10 kWh)"""
+    ws = build_windows(df, "log_Energy", look_back, horizon=1, require_consecutive=True)
+    X, y = ws.X[..., 0], ws.y[:, 0, 0]
+    ref_step = predict_next_step(reference, scalers, X)
+    cand_step = predict_next_step(candidate, scalers, X)
+    step_diff = np.abs(cand_step - ref_step)
+
+    _, _, windows = latest_windows(df, look_back)
+    fc_diff = np.abs(recursive_forecast(candidate, scalers, windows, PARITY_HORIZON)
+                     - recursive_forecast(reference, scalers, windows, PARITY_HORIZON))
+
+    mae_ref, mae_cand = float(np.abs(ref_step - y).mean()), float(np.abs(cand_step - y).mean())
+    return {
+        "n_windows": int(len(X)),
+        "step_mean_abs_diff": float(step_diff.mean()),
+        "step_max_abs_diff": float(step_diff.max()),
+        f"forecast_{PARITY_HORIZON}y_mean_abs_diff": float(fc_diff.mean()),
+        f"forecast_{PARITY_HORIZON}y_max_abs_diff": float(fc_diff.max()),
+        "backtest_mae_keras": mae_ref,
+        "backtest_mae_tflite": mae_cand,
+        "passed": bool(step_diff.mean() <= MAX_MEAN_ABS_DIFF
+                       and mae_cand - mae_ref <= MAX_BACKTEST_DEGRADATION
+                       and fc_diff.mean() <= MAX_FORECAST_MEAN_ABS_DIFF
+                       and fc_diff.max() <= MAX_FORECAST_MAX_ABS_DIFF),
+    }
+
+
+def output_path(backend, model_path=MODEL_PATH):
+    """model_<mode>.tflite di folder yang sama dengan model sumber"""
+    return os.path.join(os.path.dirname(os.path.abspath(model_path)), os.path.basename(TFLITE_PATHS[backend]))
+
+
+def quantize(mode, model_path=MODEL_PATH, scaler_path=SCALER_PATH, data_path=DATA_PATH, force=False, out_path=None):
+    """Konversi + uji paritas + benchmark. Mengembalikan laporan (dict); .tflite disimpan jika lolos"""
+    backend = f"tflite-{mode}"
+    out_path = out_path or output_path(backend, model_path)
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    (keras_model, scalers), keras_load_ms, keras_rss = timed_load(
+        lambda: load_pair(model_path, scaler_path, backend=BACKEND_KERAS))
+    look_back = get_look_back(keras_model)
+
+    t0 = time.perf_counter()
+    flatbuffer = convert(keras_model, mode)
+    convert_seconds = time.perf_counter() - t0
+
+    fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tflite")
+    with os.fdopen(fd, "wb") as f:
+        f.write(flatbuffer)
+    try:
+        tflite_model, tflite_load_ms, tflite_rss = timed_load(lambda: TFLiteModel(tmp))
+
+        df = pd.read_csv(data_path)
+        df["log_Energy"] = np.log10(df["Energy_Consumption_kWh"] + 1)
+        _, _, windows = latest_windows(df, look_back)
+
+        report = {
+            "backend": backend,
+            "source_model": os.path.relpath(os.path.abspath(model_path), base_path),
+            "output": os.path.relpath(os.path.abspath(out_path), base_path),
+            "look_back": look_back,
+            "convert_seconds": round(convert_seconds, 2),
+            "parity": parity(keras_model, tflite_model, scalers, df, look_back),
+            "latency": {"keras": benchmark_latency(keras_model, scalers, windows),
+                        "tflite": benchmark_latency(tflite_model, scalers, windows)},
+            "memory": {
+                "file_mb_keras": round(os.path.getsize(model_path) / 1024 ** 2, 3),
+                "file_mb_tflite": round(len(flatbuffer) / 1024 ** 2, 3),
+                "load_ms_keras": round(keras_load_ms, 1),
+                "load_ms_tflite": round(tflite_load_ms, 1),
+                "rss_mb_keras": None if keras_rss is None else round(keras_rss, 1),
+                "rss_mb_tflite": None if tflite_rss is None else round(tflite_rss, 1),
+            },
+        }
+        report["saved"] = report["parity"]["passed"] or force
+        if report["saved"]:
+            os.replace(tmp, out_path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+    report_path = os.path.join(out_dir, REPORT_NAME)
+    reports = load_report(report_path)
+    reports[backend] = report
+    with open(report_path, "w") as f:
+        json.dump(reports, f, indent=2)
+    return report
+
+
+def load_report(path=REPORT_PATH):
+    """Laporan per backend dari model_quant.json ({} jika belum ada)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ekspor model.h5 ke TFLite terkuantisasi + uji paritas")
+    parser.add_argument("--mode", choices=MODES, default="dynamic")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--scalers", help="Default: scalers.pkl di folder --model")
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--out", help="Path .tflite (default: model_<mode>.tflite di folder --model)")
+    parser.add_argument("--force", action="store_true", help="Simpan .tflite walau tidak lolos paritas")
+    args = parser.parse_args()
+
+    scalers = args.scalers or os.path.join(os.path.dirname(os.path.abspath(args.model)), "scalers.pkl")
+    report = quantize(args.mode, args.model, scalers, args.data, args.force, args.out)
+    print(json.dumps(report, indent=2))
+    if not report["saved"]:
+        raise SystemExit(f"Paritas tidak lolos; {report['output']} tidak disimpan")
@@ -0,0 +1,164 @@
+"""
+Registry versi model LSTM univariat (pasangan model + scaler).
+
+    models/<versi>/model.h5, scalers.pkl, meta.json   (ditulis: train_lstm.py --register)
+
+Versi "current" selalu = model.h5 + scalers.pkl di root (yang dipakai
+dashboard & model server). Model dimuat malas saat pertama diminta dan hanya
+REGISTRY_MAX_LOADED versi terakhir dipakai yang ditahan di memori (LRU).
+
+compare_versions menjalankan semua versi terpilih untuk satu negara: per
+versi, window forecast + semua window backtest diprediksi dalam satu batch
+recursive, lalu galat backtest per horizon dipakai sebagai lebar "fan".
+Backtest memakai window dengan tahun target setelah train_end_year (meta.json)
+jika ada (out-of-sample); selain itu window historis terakhir yang ikut
+dipakai training, dan galatnya ditandai in-sample (optimistis).
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from forecasting import (MODEL_PATH, SCALER_PATH, BACKEND_KERAS, engine_signature, load_pair, get_look_back,
+                         recursive_forecast, to_kwh)
+from windowing import build_windows
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+REGISTRY_DIR = os.path.join(base_path, "models")
+CURRENT = "current"
+REGISTRY_MAX_LOADED = 3
+
+# Horizon (tahun) tempat galat backtest dilaporkan; di antaranya lebar fan diinterpolasi
+BACKTEST_HORIZONS = (1, 2, 3, 5, 10)
+BACKTEST_ORIGINS = 15
+IN_SAMPLE, OUT_OF_SAMPLE = "in-sample", "out-of-sample"
+
+
+def list_versions(root=REGISTRY_DIR):
+    """[{name, model_path, scaler_path, meta}] — "current" dulu, lalu folder registry terurut nama"""
+    versions = []
+    if os.path.exists(MODEL_PATH) and os.path.exists(SCALER_PATH):
+        versions.append({"name": CURRENT, "model_path": MODEL_PATH, "scaler_path": SCALER_PATH, "meta": {}})
+    if os.path.isdir(root):
+        for name in sorted(os.listdir(root)):
+            folder = os.path.join(root, name)
+            model_path, scaler_path = os.path.join(folder, "model.h5"), os.path.join(folder, "scalers.pkl")
+            if not (os.path.exists(model_path) and os.path.exists(scaler_path)):
+                continue
+            try:
+                with open(os.path.join(folder, "meta.json")) as f:
+                    meta = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                meta = {}
+            versions.append({"name": name, "model_path": model_path, "scaler_path": scaler_path, "meta": meta})
+    return versions
+
+
+def versions_signature(versions):
+    """Kunci cache: nama + (mtime, size) artefak tiap versi"""
+    return tuple((v["name"], engine_signature(v["model_path"], v["scaler_path"])) for v in versions)
+
+
+class ModelRegistry:
+    """Pemuat malas model per versi dengan batas jumlah model di memori (LRU)"""
+
+    def __init__(self, max_loaded=REGISTRY_MAX_LOADED):
+        self.max_loaded = max_loaded
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version):
+        """(model, scalers, look_back) untuk dict versi dari list_versions"""
+        key = (version["name"], engine_signature(version["model_path"], version["scaler_path"]))
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key]
+
+        model, scalers = load_pair(version["model_path"], version["scaler_path"], backend=BACKEND_KERAS)
+        entry = (model, scalers, get_look_back(model))
+
+        with self._lock:
+            self._loaded[key] = entry
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return entry
+
+    def loaded(self):
+        with self._lock:
+            return [name for name, _ in self._loaded]
+
+
+def backtest_windows(ws, train_end_year=None):
+    """(window backtest, IN_SAMPLE / OUT_OF_SAMPLE): tahun target > train_end_year jika ada"""
+    if train_end_year is not None:
+        _, held_out = ws.split_by_year(int(train_end_year) + 1)
+        if len(held_out):
+            return held_out.subset(np.arange(len(held_out)) >= len(held_out) - BACKTEST_ORIGINS), OUT_OF_SAMPLE
+    return ws.subset(np.arange(len(ws)) >= len(ws) - BACKTEST_ORIGINS), IN_SAMPLE
+
+
+def mape_per_horizon(pred_log, actual_log):
+    """MAPE (%) per kolom horizon di skala kWh; aktual 0 kWh (mis. Tuvalu) tidak punya galat relatif -> dilewati"""
+    actual = to_kwh(actual_log)
+    valid = actual > 0
+    ape = np.abs(to_kwh(pred_log) / np.where(valid, actual, 1.0) - 1) * 100
+    n_valid = valid.sum(axis=0)
+    return np.where(n_valid > 0, np.where(valid, ape, 0.0).sum(axis=0) / np.maximum(n_valid, 1), np.nan)
+
+
+def compare_versions(registry, versions, df_country, n_years):
+    """
+    Forecast + backtest semua versi untuk satu negara (df_country: Year, log_Energy).
+    Hasil: (forecast DataFrame panjang Version x Horizon dengan batas fan,
+            galat DataFrame Version x Horizon pada BACKTEST_HORIZONS, kolom Sample = in/out-of-sample)
+    """
+    df_country = df_country.sort_values("Year")
+    values = df_country["log_Energy"].to_numpy(dtype=float)
+    last_year = int(df_country["Year"].max())
+    bt_horizon = max(h for h in BACKTEST_HORIZONS if h <= max(n_years, 1))
+    steps = np.arange(1, n_years + 1)
+
+    forecasts, errors = [], []
+    for version in versions:
+        model, scalers, look_back = registry.get(version)
+        if len(values) < look_back + 1:
+            continue
+
+        ws = build_windows(df_country, "log_Energy", look_back, horizon=bt_horizon, require_consecutive=True)
+        ws, sample = backtest_windows(ws, version.get("meta", {}).get("train_end_year"))
+        X_bt, y_bt = ws.X[..., 0], ws.y[..., 0]
+
+        # Satu batch: window backtest + window forecast terakhir
+        seqs = np.vstack([X_bt, values[-look_back:][None, :]])
+        preds = recursive_forecast(model, scalers, seqs, max(n_years, bt_horizon))
+        pred_bt, pred_fc = preds[:-1, :bt_horizon], preds[-1, :n_years]
+
+        # RMSE log per horizon; horizon tanpa backtest memakai galat horizon terjauh yang ada
+        if len(X_bt):
+            rmse = np.sqrt(((pred_bt - y_bt) ** 2).mean(axis=0))
+            mape = mape_per_horizon(pred_bt, y_bt)
+            band = np.interp(steps, np.arange(1, bt_horizon + 1), rmse)
+            for h in BACKTEST_HORIZONS:
+                if h <= bt_horizon:
+                    errors.append({"Version": version["name"], "Horizon": h, "RMSE_log": rmse[h - 1],
+                                   "MAPE_%": mape[h - 1], "Backtest_Windows": len(X_bt), "Sample": sample})
+        else:
+            band = np.full(n_years, np.nan)
+
+        forecasts.append(pd.DataFrame({
+            "Version": version["name"],
+            "Horizon": steps,
+            "Year": last_year + steps,
+            "Predicted_Energy_kWh": to_kwh(pred_fc),
+            "Lower_kWh": to_kwh(pred_fc - band),
+            "Upper_kWh": to_kwh(pred_fc + band),
+        }))
+
+    columns = ["Version", "Horizon", "RMSE_log", "MAPE_%", "Backtest_Windows", "Sample"]
+    return (pd.concat(forecasts, ignore_index=True) if forecasts else pd.DataFrame(),
+            pd.DataFrame(errors, columns=columns))
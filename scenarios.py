@@ -0,0 +1,87 @@
+"""
+Mesin skenario what-if untuk forecasting energi.
+
+Satu skenario = pertumbuhan tambahan per tahun (%) terhadap jalur prediksi
+model, ditambah shock satu kali (%) pada horizon tertentu. Semua skenario
+untuk semua negara dihitung dalam satu tensor (skenario x negara x look_back),
+sehingga tiap langkah horizon hanya butuh satu panggilan model.
+"""
+import numpy as np
+import pandas as pd
+
+from forecasting import to_kwh
+
+SCENARIO_FIELDS = ["Skenario", "Pertumbuhan (%/thn)", "Horizon Shock", "Shock (%)"]
+
+DEFAULT_SCENARIOS = pd.DataFrame([
+    ["Baseline", 0.0, 0, 0.0],
+    ["Efisiensi Energi", -2.0, 0, 0.0],
+    ["Ekspansi Industri", 3.0, 0, 0.0],
+    ["Krisis Pasokan", 0.0, 3, -15.0],
+], columns=SCENARIO_FIELDS)
+
+
+def normalize_scenarios(df):
+    """
+    Tabel skenario -> tuple of tuples (hashable, dipakai sebagai kunci cache).
+    Baris tanpa nama dibuang; nama ganda ditolak.
+    """
+    df = df.dropna(subset=["Skenario"]).fillna({"Pertumbuhan (%/thn)": 0.0, "Horizon Shock": 0, "Shock (%)": 0.0})
+    df = df[df["Skenario"].astype(str).str.strip() != ""]
+    names = df["Skenario"].astype(str).str.strip()
+    if names.duplicated().any():
+        raise ValueError("Nama skenario harus unik.")
+    return tuple(
+        (name, float(g), int(k), float(sh))
+        for name, g, k, sh in zip(names, df["Pertumbuhan (%/thn)"], df["Horizon Shock"], df["Shock (%)"])
+    )
+
+
+def _adjust(log_values, factor):
+    # log_Energy = log10(kWh + 1): pengali diterapkan di skala kWh
+    return np.log10(np.maximum(to_kwh(log_values) * factor, 0.0) + 1)
+
+
+def run_scenarios(predict_next, windows, scenarios, n_years):
+    """
+    windows   : array (C, look_back) log_Energy terakhir tiap negara
+    scenarios : tuple hasil normalize_scenarios (S skenario)
+    Hasil     : array (S, C, n_years) prediksi log_Energy
+    """
+    windows = np.atleast_2d(np.asarray(windows, dtype=float))
+    n_countries, look_back = windows.shape
+    n_scen = len(scenarios)
+
+    growth = np.array([1 + s[1] / 100.0 for s in scenarios])
+    shock_step = np.array([s[2] for s in scenarios])
+    shock = np.array([1 + s[3] / 100.0 for s in scenarios])
+
+    # Tensor (S, C, look_back) diratakan menjadi batch (S*C, look_back)
+    batch = np.broadcast_to(windows, (n_scen, n_countries, look_back)).reshape(-1, look_back).copy()
+    row_growth = np.repeat(growth, n_countries)
+    row_shock_step = np.repeat(shock_step, n_countries)
+    row_shock = np.repeat(shock, n_countries)
+
+    preds = np.empty((n_scen * n_countries, n_years))
+    for step in range(n_years):
+        p = np.asarray(predict_next(batch), dtype=float)
+        factor = row_growth * np.where(row_shock_step == step + 1, row_shock, 1.0)
+        # Nilai yang disesuaikan ikut masuk ke window berikutnya (jalur what-if)
+        p = _adjust(p, factor)
+        preds[:, step] = p
+        batch[:, :-1] = batch[:, 1:]
+        batch[:, -1] = p
+    return preds.reshape(n_scen, n_countries, n_years)
+
+
+def scenarios_to_frame(preds, scenarios, countries, last_years):
+    """Array (S, C, H) -> DataFrame panjang untuk plot & unduhan"""
+    n_scen, n_countries, n_years = preds.shape
+    s_idx, c_idx, h_idx = np.indices(preds.shape).reshape(3, -1)
+    return pd.DataFrame({
+        "Skenario": np.array([s[0] for s in scenarios])[s_idx],
+        "Country Name": np.asarray(countries)[c_idx],
+        "Year": np.asarray(last_years)[c_idx] + h_idx + 1,
+        "Predicted_log_Energy": preds.ravel(),
+        "Predicted_Energy_kWh": to_kwh(preds.ravel()),
+    })
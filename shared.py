@@ -0,0 +1,310 @@
+"""
+Lapisan data & model bersama untuk semua halaman dashboard.
+
+Satu-satunya tempat dataset dimuat, label cluster ditetapkan, model LSTM /
+classifier dimuat dan forecast dihitung. Semua halaman (views/) memanggil
+fungsi di sini, sehingga cache Streamlit, cache disk dan model server dipakai
+bersama, bukan diduplikasi per halaman. TensorFlow & scikit-learn baru
+di-import saat model benar-benar dibutuhkan.
+
+Pemuatan dataset & forecast univariat sendiri ada di loaders.py (tanpa
+Streamlit, dipakai juga oleh api.py); modul ini menambahkan st.cache_* di atasnya.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import loaders
+from classifier import fit_classifier, predict_labels
+from countries import CountryIndex, load_country_index
+from cube import build_cube, slice_cube
+from data_cache import DATA_FILES, CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES, content_key
+from disk_cache import disk_cached
+from forecasting import engine_signature, get_look_back, iter_forecast, latest_windows
+from ingest import read_manifest, country_revision
+from labels import rank_clusters
+from loaders import (lstm_data_key, get_look_back_size, model_signature, get_step_predictor, forecast_window,
+                     forecast_frame)
+from model_server import get_client
+from multivariate import (MV_MODEL_PATH, MV_SCALER_PATH, load_engine as load_mv_files, predict_next_mv,
+                          prepare_panel, latest_mv_windows)
+from registry import ModelRegistry, list_versions, versions_signature, compare_versions
+from scenarios import run_scenarios, scenarios_to_frame
+from similarity import SimilarityIndex
+from transitions import ClusterTransitions
+
+DEEPFOREST_COLUMNS = ["Country Name", "Year", "GDP_per_Capita", "Energy_Consumption_kWh", "DeepForest_Predicted_Cluster"]
+
+ENGINE_UNI = "Univariat (Energi)"
+ENGINE_MV = "Multivariat (Energi + GDP + Populasi)"
+
+
+# -------------------------------------------------------------------------
+# DATA
+# -------------------------------------------------------------------------
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES)
+def load_all_data(fingerprint=None):
+    """Semua dataset (loaders.load_all_data: cache disk) dengan salinan per rerun dari st.cache_data"""
+    return loaders.load_all_data(fingerprint)
+
+def get_data():
+    """Dataset terkini (dimuat ulang otomatis jika isi CSV di disk berubah)"""
+    return load_all_data(loaders.data_fingerprint())
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES)
+@disk_cached("load_deepforest_data", version=3)
+def load_deepforest_data(fingerprint=None):
+    """(hasil klasifikasi Deep Forest berlabel, ClusterTiers); None jika file tidak ada"""
+    try:
+        df = pd.read_csv(DATA_FILES['deepforest'])
+    except FileNotFoundError:
+        return None
+
+    missing = [c for c in DEEPFOREST_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom {missing} tidak ada di klasifikasi_deepforest.csv")
+
+    df["Year"] = df["Year"].astype(int)
+    try:
+        countries = load_country_index(DATA_FILES['countries']).with_names(df["Country Name"])
+    except (OSError, ValueError):
+        countries = CountryIndex.from_names(df["Country Name"])
+    countries.attach(df)
+    tiers = rank_clusters(df, "DeepForest_Predicted_Cluster")
+    df["Cluster Label"] = tiers.labels(df["DeepForest_Predicted_Cluster"])
+    return df, tiers
+
+@st.cache_resource(max_entries=1)
+def deepforest_slices(fingerprint=None):
+    """
+    Potongan per tahun dan daftar tahun per negara, dibangun sekali per isi file.
+    Disimpan sebagai resource (tanpa salinan per rerun), jadi jangan dimodifikasi.
+    """
+    loaded = load_deepforest_data(fingerprint)
+    if loaded is None:
+        return None
+    df, tiers = loaded
+    by_year = {int(year): g.reset_index(drop=True) for year, g in df.groupby("Year", sort=True)}
+    years_by_country = {c: sorted(g.unique().tolist()) for c, g in df.groupby("Country Name")["Year"]}
+    ids = dict(zip(df["Country Name"], df["Country_ID"]))
+    return SimpleNamespace(frame=df, by_year=by_year, years_by_country=years_by_country, ids=ids,
+                           countries=sorted(years_by_country), tiers=tiers, fingerprint=fingerprint)
+
+def get_deepforest():
+    return deepforest_slices(content_key(DATA_FILES['deepforest'], DATA_FILES['countries']))
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES)
+@disk_cached("deepforest_quality", version=1)
+def deepforest_quality(fingerprint=None):
+    """Validasi klasifikasi_deepforest.csv mentah (file opsional, tidak dimuat load_all_data)"""
+    try:
+        df = pd.read_csv(DATA_FILES['deepforest'])
+    except (OSError, ValueError):
+        df = None
+    try:
+        reference = load_country_index(DATA_FILES['countries']).known_names
+    except (OSError, ValueError):
+        reference = None
+    return loaders.quality_summary({'deepforest': df}, reference)
+
+def get_quality_report():
+    """Laporan validasi dari load_all_data (lstm, dec, granger) + Deep Forest"""
+    main = get_data()['quality']
+    extra = deepforest_quality(content_key(DATA_FILES['deepforest'], DATA_FILES['countries']))
+    return SimpleNamespace(report=pd.concat([main.report, extra.report], ignore_index=True),
+                           validate_ms=main.validate_ms + extra.validate_ms, rows={**main.rows, **extra.rows})
+
+@st.cache_resource(max_entries=1)
+def region_cube(fingerprint=None):
+    """
+    Kubus agregasi region x kelompok pendapatan x tahun beserta potongan
+    lookup-nya, dibangun sekali per isi file (resource: jangan dimodifikasi).
+    """
+    df_dec = get_data()['dec']
+    return None if df_dec is None else slice_cube(build_cube(df_dec))
+
+def get_region_cube():
+    return region_cube(content_key(DATA_FILES['dec'], DATA_FILES['countries']))
+
+@st.cache_resource(max_entries=1)
+def cluster_transitions(fingerprint=None):
+    """Transisi cluster DEC seluruh panel (lintasan, matriks, kejadian naik/turun), sekali per isi file"""
+    data = get_data()
+    return None if data['dec'] is None else ClusterTransitions(data['dec'], data['dec_tiers'])
+
+def get_transitions():
+    return cluster_transitions(content_key(DATA_FILES['dec'], DATA_FILES['countries']))
+
+@st.cache_resource(max_entries=1)
+def similarity_index(fingerprint=None):
+    """KDTree negara serupa per tahun, dibangun sekali per isi file"""
+    df_dec = get_data()['dec']
+    return None if df_dec is None else SimilarityIndex(df_dec)
+
+def get_similarity_index():
+    return similarity_index(content_key(DATA_FILES['dec'], DATA_FILES['countries']))
+
+def get_manifest():
+    return read_manifest()
+
+def country_id_of(country):
+    """Country_ID untuk nama / alias / ISO-3 (UNKNOWN_ID jika tidak dikenal)"""
+    return loaders.country_id_of(country, get_data())
+
+def get_country_metrics(country, year=None):
+    df = get_data()['dec']
+    if df is None: return None
+
+    # Filter Negara (kunci integer)
+    df_c = df[df['Country_ID'] == country_id_of(country)]
+    if df_c.empty: return None
+
+    # Filter Tahun (Strict)
+    if year is not None:
+        df_year = df_c[df_c['Year'] == year]
+        if df_year.empty:
+            return None
+        return df_year.iloc[0]
+
+    # Default
+    return df_c.sort_values('Year').iloc[-1]
+
+
+# -------------------------------------------------------------------------
+# FORECASTING (LSTM)
+# -------------------------------------------------------------------------
+@st.cache_resource(max_entries=1)
+def load_mv_engine(signature=None):
+    """Model multivariat + scaler per fitur + metadata benchmark"""
+    return load_mv_files()
+
+def get_engine(name):
+    """(look_back, predict_next, fungsi window terakhir per negara) untuk engine terpilih"""
+    if name == ENGINE_MV:
+        model, scalers, meta = load_mv_engine(engine_signature(MV_MODEL_PATH, MV_SCALER_PATH))
+        look_back = int(meta.get("look_back") or get_look_back(model))
+        return (look_back,
+                lambda window: predict_next_mv(model, scalers, window),
+                lambda df: latest_mv_windows(prepare_panel(df), look_back))
+    look_back = get_look_back_size()
+    return look_back, get_step_predictor(), lambda df: latest_windows(df, look_back)
+
+def energy_of(step_pred):
+    """Hasil per langkah: (n,) univariat, (n, 3) multivariat dengan kolom 0 = log_Energy"""
+    step_pred = np.asarray(step_pred)
+    return step_pred if step_pred.ndim == 1 else step_pred[:, 0]
+
+def _country_window(country):
+    """(window log_Energy terakhir, model_key) negara tsb; window None jika data terlalu pendek / bercelah"""
+    return loaders.country_window(get_data()['lstm'], country_id_of(country))
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=1000)
+def cached_country_forecast(country, n_years, country_rev, model_sig):
+    """
+    Forecast per negara. Kunci cache memuat revisi data negara tsb (ingestion
+    hanya membatalkan cache negara yang berubah) dan signature model. CSV yang
+    diganti langsung tanpa ingest.py terbaca setelah TTL / tombol Refresh Data;
+    cache disk forecast_window tetap berkunci isi window.
+    """
+    window, model_key = _country_window(country)
+    if window is None:
+        return None
+    return forecast_window(window, n_years, model_key)
+
+def country_forecast(country, n_years):
+    return cached_country_forecast(country, n_years, country_revision(get_manifest(), country), model_signature())
+
+def peek_country_forecast(country, n_years):
+    """Forecast univariat yang sudah ada di cache disk, tanpa menghitung (None jika belum ada)"""
+    window, model_key = _country_window(country)
+    return None if window is None else forecast_window.peek(window, n_years, model_key)
+
+def remember_country_forecast(country, n_years, preds):
+    """Simpan hasil job background ke cache yang sama dengan country_forecast"""
+    window, model_key = _country_window(country)
+    if window is not None:
+        forecast_window.store(np.asarray(preds, dtype=float), window, n_years, model_key)
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=32)
+def cached_all_forecasts(n_years, data_key, model_sig, engine_name=ENGINE_UNI):
+    """
+    Forecast semua negara dalam satu batch (satu panggilan model per horizon).
+    Hasil: DataFrame panjang negara x horizon, siap diekspor.
+    """
+    df_lstm = get_data()['lstm']
+    if engine_name == ENGINE_MV:
+        _, predict_next, windows_of = get_engine(engine_name)
+        countries, last_years, windows = windows_of(df_lstm)
+        preds = np.column_stack([energy_of(p) for _, p in iter_forecast(predict_next, windows, n_years)])
+        return forecast_frame(countries, last_years, preds)
+    return loaders.all_country_forecasts(df_lstm, n_years)
+
+def forecast_inputs_key(engine_name=ENGINE_UNI):
+    """(isi data LSTM, signature model) yang menentukan hasil forecast engine tsb"""
+    sig = engine_signature(MV_MODEL_PATH, MV_SCALER_PATH) if engine_name == ENGINE_MV else model_signature()
+    return lstm_data_key(), sig
+
+def all_country_forecasts(n_years, engine_name=ENGINE_UNI):
+    return cached_all_forecasts(n_years, *forecast_inputs_key(engine_name), engine_name)
+
+@st.cache_resource
+def get_model_registry():
+    """Satu registry per proses: model tiap versi dimuat malas, maksimal REGISTRY_MAX_LOADED di memori"""
+    return ModelRegistry()
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=256)
+def cached_version_comparison(country, n_years, country_rev, versions_sig):
+    """Forecast + galat backtest semua versi terpilih untuk satu negara (lokal, tanpa model server)"""
+    names = [name for name, _ in versions_sig]
+    versions = [v for v in list_versions() if v["name"] in names]
+    df_lstm = get_data()['lstm']
+    df_c = df_lstm[df_lstm["Country_ID"] == country_id_of(country)]
+    return compare_versions(get_model_registry(), versions, df_c, n_years)
+
+def compare_model_versions(country, n_years, names):
+    versions = [v for v in list_versions() if v["name"] in names]
+    return cached_version_comparison(country, n_years, country_revision(get_manifest(), country),
+                                     versions_signature(versions))
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES, show_spinner="Menghitung skenario...")
+def compute_scenarios(scenarios, countries, n_years, revisions, model_sig):
+    """
+    Semua skenario x negara dalam satu batch. Kunci cache: definisi skenario,
+    negara + revisi datanya, dan signature model aktif (retrain / ganti backend).
+    """
+    df_lstm = get_data()['lstm']
+    look_back = get_look_back_size()
+    ids = [country_id_of(c) for c in countries]
+    names, last_years, windows = latest_windows(df_lstm[df_lstm["Country_ID"].isin(ids)], look_back)
+    preds = run_scenarios(get_step_predictor(), windows, scenarios, n_years)
+    return scenarios_to_frame(preds, scenarios, names, last_years)
+
+
+# -------------------------------------------------------------------------
+# KLASIFIKASI (DEEP FOREST / RANDOM FOREST)
+# -------------------------------------------------------------------------
+@st.cache_resource(max_entries=1)
+def load_classifier(fingerprint=None):
+    return fit_classifier_cached(fingerprint)
+
+@disk_cached("fit_classifier", version=1)
+def fit_classifier_cached(fingerprint):
+    # Classifier hasil fit disimpan di disk: proses lain / setelah restart tidak perlu fit ulang
+    return fit_classifier(get_data()['dec'])
+
+def classify_points(X, proba=False):
+    """Klasifikasi batch lewat model server bersama, fallback ke classifier lokal"""
+    client = get_client()
+    if client is not None:
+        try:
+            return client.classify(X, proba=proba)
+        except ConnectionError:
+            pass
+    clf, _ = load_classifier(content_key(DATA_FILES['dec']))
+    result = {"labels": predict_labels(clf, X)}
+    if proba:
+        result["proba"] = clf.predict_proba(X)
+        result["classes"] = np.asarray(clf.classes_)
+    return result
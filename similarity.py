@@ -0,0 +1,55 @@
+"""
+Pencarian "negara serupa" (k tetangga terdekat) per tahun.
+
+Ruang fitur: log GDP per kapita, log energi, dan pertumbuhan YoY keduanya
+(kolom hasil growth.py), distandardisasi per tahun agar skala setara. Satu
+KDTree per tahun dibangun sekali per isi data; query k tetangga hanya
+beberapa mikrodetik. scikit-learn baru di-import saat index dibangun.
+"""
+import numpy as np
+import pandas as pd
+
+from growth import GDP_GROWTH, ENERGY_GROWTH
+
+FEATURES = ["log_GDP_per_Capita", "log_Energy", GDP_GROWTH, ENERGY_GROWTH]
+
+# Pertumbuhan ekstrem (krisis, data rusak) dipotong agar tidak mendominasi jarak
+GROWTH_CLIP = 50.0
+
+
+class SimilarityIndex:
+    """KDTree per tahun atas FEATURES terstandardisasi; negara tanpa pertumbuhan dianggap 0%"""
+
+    def __init__(self, df):
+        from sklearn.neighbors import KDTree
+
+        df = df[df["Country_ID"] >= 0]
+        X_all = df[FEATURES].to_numpy(dtype=float, copy=True)  # copy-on-write: view bisa read-only
+        X_all[:, 2:] = np.nan_to_num(X_all[:, 2:]).clip(-GROWTH_CLIP, GROWTH_CLIP)
+        valid = ~np.isnan(X_all).any(axis=1)
+        df, X_all = df[valid], X_all[valid]
+
+        self._years = {}
+        for year, idx in df.groupby("Year").indices.items():
+            X = X_all[idx]
+            X = (X - X.mean(axis=0)) / np.where(X.std(axis=0) > 0, X.std(axis=0), 1)
+            ids = df["Country_ID"].to_numpy()[idx]
+            self._years[int(year)] = (KDTree(X), X, ids, df["Country Name"].to_numpy()[idx],
+                                      {cid: i for i, cid in enumerate(ids)})
+
+    @property
+    def years(self):
+        return sorted(self._years)
+
+    def similar(self, country_id, year, k=5):
+        """k negara terdekat (tanpa negara itu sendiri): DataFrame Country_ID, Country Name, Distance"""
+        entry = self._years.get(int(year))
+        if entry is None or country_id not in entry[4]:
+            return None
+        tree, X, ids, names, pos = entry
+        k = min(k + 1, len(ids))
+        dist, idx = tree.query(X[pos[country_id]][None, :], k=k)
+        dist, idx = dist[0], idx[0]
+        others = ids[idx] != country_id
+        return pd.DataFrame({"Country_ID": ids[idx][others], "Country Name": names[idx][others],
+                             "Distance": dist[others]})
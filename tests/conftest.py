@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+# Modul proyek berada di root repo (tanpa package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Identity:
+    def transform(self, x):
+        return x
+
+    def inverse_transform(self, x):
+        return x
+
+
+class Persistence:
+    """Model palsu tanpa TensorFlow: prediksi = nilai terakhir window (+ bias per langkah)"""
+
+    def __init__(self, bias=0.0, look_back=3):
+        self.bias = bias
+        self.input_shape = (None, look_back, 1)
+
+    def predict(self, seq, verbose=0):
+        return seq[:, -1, :] + self.bias
+
+
+@pytest.fixture
+def identity_scalers():
+    """scaler_X / scaler_y identitas: model palsu bekerja langsung pada log10 kWh"""
+    return {"scaler_X": Identity(), "scaler_y": Identity()}
+
+
+@pytest.fixture
+def persistence():
+    """Pabrik model Persistence(bias=0.0, look_back=3)"""
+    return Persistence
@@ -0,0 +1,140 @@
+"""api: resolusi rute, negosiasi format, aplikasi ASGI (data palsu lewat loaders), tanpa runtime Streamlit."""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import api
+import loaders
+from countries import CountryIndex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def fake_data(monkeypatch):
+    lstm = pd.DataFrame({"Country Name": ["Indonesia"] * 6 + ["Tuvalu"] * 2,
+                         "Year": list(range(2010, 2016)) + [2014, 2015],
+                         "log_Energy": np.linspace(11, 11.5, 8)})
+    dec = pd.DataFrame({"Country Name": ["Indonesia", "Tuvalu"], "Year": [2015, 2015], "Cluster": [1, 0],
+                        "Cluster Label": pd.Categorical(["High", "Low"]),
+                        "GDP_per_Capita": [3500.0, 3000.0], "Energy_Consumption_kWh": [1e11, 0.0]})
+    granger = pd.DataFrame({"Country": ["Indonesia"], "Hypothesis": ["Growth Hypothesis"]})
+    countries = CountryIndex.from_names(pd.concat([lstm["Country Name"], dec["Country Name"]]))
+    for df in (lstm, dec):
+        countries.attach(df)
+    data = {"lstm": lstm, "dec": dec, "granger": granger, "countries": countries, "errors": {}}
+    monkeypatch.setattr(loaders, "get_data", lambda: data)
+    monkeypatch.setattr(loaders, "forecast_model_info", lambda: {"look_back": 3, "signature": ("t",), "model_key": "m1"})
+    calls = []
+
+    def fake_forecast(window, n_years, model_key):
+        calls.append((window, n_years, model_key))
+        return np.full(n_years, window[-1])
+
+    monkeypatch.setattr(loaders, "forecast_window", fake_forecast)
+    monkeypatch.setattr(api, "response_cache", api.ResponseCache())
+    monkeypatch.setattr(api, "_inputs_keys", {})
+    return calls
+
+
+def call(path, query=b"", method="GET", headers=()):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "query_string": query, "headers": list(headers)}
+    asyncio.run(api.app(scope, receive, send))
+    return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+
+def test_resolve_routes_and_parameters():
+    handler, args, _, uses_model = api.resolve("/forecast/IDN", {"h": ["5"]})
+    assert handler is api.forecast_country and args == ("IDN", 5) and uses_model
+    handler, args, _, uses_model = api.resolve("/cluster/2015/", {})
+    assert handler is api.cluster_year and args == (2015,) and not uses_model
+    for path, query in [("/nope", {}), ("/forecast", {"h": ["0"]}), ("/forecast", {"h": ["x"]}), ("/cluster/abc", {})]:
+        with pytest.raises(api.HTTPError):
+            api.resolve(path, query)
+
+
+def test_negotiate_format():
+    assert api.negotiate({}, {}) == "json"
+    assert api.negotiate({}, {"accept": api.ARROW_MIME}) == "arrow"
+    assert api.negotiate({"format": ["json"]}, {"accept": api.ARROW_MIME}) == "json"
+    with pytest.raises(api.HTTPError) as e:
+        api.negotiate({"format": ["xml"]}, {})
+    assert e.value.status == 400
+
+
+def test_cluster_and_granger_routes(fake_data):
+    status, headers, body = call("/cluster/2015")
+    assert status == 200 and headers[b"content-type"] == api.JSON_MIME.encode()
+    rows = json.loads(body)
+    assert [r["Cluster Label"] for r in rows] == ["High", "Low"]
+    assert call("/cluster/1990")[0] == 404
+    assert json.loads(call("/granger")[2])[0]["Country"] == "Indonesia"
+
+
+def test_forecast_route_uses_window_and_model_key(fake_data):
+    status, _, body = call("/forecast/Indonesia", b"h=4")
+    rows = json.loads(body)
+    assert status == 200 and [r["Year"] for r in rows] == [2016, 2017, 2018, 2019]
+    assert fake_data[0][1:] == (4, "m1") and len(fake_data[0][0]) == 3
+    # Data terlalu pendek untuk look_back -> 422, negara tak dikenal -> 404
+    assert call("/forecast/Tuvalu")[0] == 422
+    assert call("/forecast/Atlantis")[0] == 404
+
+
+def test_responses_cached_per_model_key(fake_data, monkeypatch):
+    call("/forecast/Indonesia", b"h=2")
+    call("/forecast/Indonesia", b"h=2")
+    assert len(fake_data) == 1
+    # Model baru (generasi berubah) -> model_key baru -> dihitung ulang
+    monkeypatch.setattr(loaders, "forecast_model_info", lambda: {"look_back": 3, "signature": ("t",), "model_key": "m2"})
+    monkeypatch.setattr(loaders, "model_generation", lambda client=None: "model baru")
+    call("/forecast/Indonesia", b"h=2")
+    assert len(fake_data) == 2 and fake_data[1][2] == "m2"
+
+
+def test_inputs_key_computed_once_per_signature(fake_data, monkeypatch):
+    hashed = []
+    monkeypatch.setattr(api, "content_key", lambda *files: hashed.append(files) or files)
+    files = (api.DATA_FILES['lstm'],)
+    assert api.inputs_key(files, True) == api.inputs_key(files, True) == (files, "m1")
+    call("/forecast/Indonesia", b"h=2")
+    call("/forecast/Indonesia", b"h=3")
+    # Satu kali per himpunan file (rute forecast memakai data_bersih.csv + countries.csv)
+    assert len(hashed) == 2
+
+
+def test_internal_error_hides_details(fake_data, monkeypatch, caplog):
+    def broken():
+        raise OSError("/rahasia/path/granger.csv rusak")
+
+    monkeypatch.setattr(api, "ROUTES", [(api.re.compile(r"^/granger/?$"), lambda m, q: (broken, ()), (), False)])
+    status, _, body = call("/granger")
+    error = json.loads(body)
+    assert status == 500 and "rahasia" not in body.decode() and error["request_id"]
+    assert error["request_id"] in caplog.text and "rahasia" in caplog.text
+
+
+def test_method_not_allowed_and_head(fake_data):
+    assert call("/granger", method="POST")[0] == 405
+    status, headers, body = call("/granger", method="HEAD")
+    assert status == 200 and body == b"" and int(headers[b"content-length"]) > 0
+
+
+def test_api_does_not_import_streamlit():
+    out = subprocess.run([sys.executable, "-c", "import sys, api; print('streamlit' in sys.modules)"],
+                         cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
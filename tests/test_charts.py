@@ -0,0 +1,65 @@
+"""views.charts: pemangkasan figure (customdata tetap ada untuk grafik seleksi), cache figure, hexbin, jalur render."""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from views import charts
+from views.charts import cached_figure, hexbin, point_traces, trim_figure
+
+
+def _fig():
+    return go.Figure([
+        go.Scatter(x=[0.123456789, 1.0], y=[2.0, 3.0], customdata=[[1], [2]], hovertemplate="%{x}"),
+        go.Scatter(x=[0.0], y=[1.0], customdata=[[7]], hovertemplate="%{customdata[0]}"),
+    ])
+
+
+def test_trim_rounds_and_drops_unreferenced_customdata():
+    fig = trim_figure(_fig())
+    assert fig.data[0].x[0] == pytest.approx(0.1235)
+    assert fig.data[0].customdata is None
+    assert fig.data[1].customdata is not None
+
+
+def test_trim_keeps_customdata_for_selection():
+    fig = trim_figure(_fig(), keep_customdata=True)
+    assert fig.data[0].customdata is not None and fig.data[1].customdata is not None
+
+
+def test_cached_figure_reuses_by_input_and_selection_mode(monkeypatch):
+    monkeypatch.setattr(charts, "_figures", type(charts._figures)())
+    calls = []
+
+    def build():
+        calls.append(1)
+        return _fig()
+
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    _, _, reused = cached_figure("t", build, df)
+    _, _, reused_again = cached_figure("t", build, df.copy())
+    fig_sel, _, reused_sel = cached_figure("t", build, df, keep_customdata=True)
+    assert (reused, reused_again, reused_sel) == (False, True, False)
+    assert fig_sel.data[0].customdata is not None
+    _, _, reused_other = cached_figure("t", build, df.set_axis([5, 6]))
+    assert not reused_other and len(calls) == 3
+
+
+def test_hexbin_conserves_points_and_dominant_code():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 1, 5000), rng.uniform(0, 1, 5000)
+    codes = (x > 0.5).astype(int)
+    cx, cy, count, dominant = hexbin(x, y, codes, 2, gridsize=10)
+    assert count.sum() == 5000
+    assert (dominant[cx < 0.3] == 0).all() and (dominant[cx > 0.7] == 1).all()
+
+
+@pytest.mark.parametrize("n, mode", [(100, "svg"), (5000, "webgl"), (25000, "hexbin")])
+def test_point_traces_path_by_size(n, mode):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.normal(size=n), "y": rng.normal(size=n),
+                       "c": np.where(rng.random(n) > 0.5, "A", "B")})
+    traces, got = point_traces(df, "x", "y", "c", {"A": "#f00", "B": "#0f0"})
+    assert got == mode
+    if mode != "hexbin":
+        assert sum(len(t.x) for t in traces) == n
@@ -0,0 +1,45 @@
+"""Mode skenario classifier: parsing tabel, fitur log10(x + 1) seperti dataset DEC, penggabungan hasil."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from classifier import read_scenarios, scenario_features, scenario_results, to_features
+from data_cache import DATA_FILES
+from labels import ClusterTiers
+
+
+def test_read_scenarios_accepts_pasted_tsv():
+    df = read_scenarios(io.StringIO("GDP_per_Capita\tEnergy_Consumption_kWh\n5000\t2000\n45000\t9000\n"))
+    assert df["GDP_per_Capita"].tolist() == [5000, 45000]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("GDP_per_Capita\n5000\n", "Kolom"),
+    ("GDP_per_Capita,Energy_Consumption_kWh\n5000,0\n100,abc\n", "baris: 1, 2"),
+])
+def test_read_scenarios_rejects_invalid_tables(text, message):
+    with pytest.raises(ValueError, match=message):
+        read_scenarios(io.StringIO(text))
+
+
+def test_features_match_dataset_convention():
+    # clustered_data_dec.csv: log_GDP_per_Capita = log10(GDP_per_Capita + 1)
+    dec = pd.read_csv(DATA_FILES["dec"], nrows=50)
+    np.testing.assert_allclose(to_features(dec["GDP_per_Capita"], dec["Energy_Consumption_kWh"]),
+                               dec[["log_GDP_per_Capita", "log_Energy"]].to_numpy(), atol=1e-9)
+
+    scn = pd.DataFrame({"GDP_per_Capita": [99.0], "Energy_Consumption_kWh": [9.0]})
+    np.testing.assert_allclose(scenario_features(scn), [[2.0, 1.0]])
+
+
+def test_scenario_results_adds_labels_and_probabilities():
+    scn = pd.DataFrame({"GDP_per_Capita": [100.0, 50000.0], "Energy_Consumption_kWh": [50.0, 9000.0]})
+    tiers = ClusterTiers([1, 0], ["Low Economy - Low Energy", "High Economy - High Energy"])
+    result = {"labels": np.array([1, 0]), "proba": np.array([[0.2, 0.8], [0.9, 0.1]]), "classes": np.array([0, 1])}
+
+    out = scenario_results(scn, result, tiers)
+    assert list(out["Predicted_Label"]) == ["Low Economy - Low Energy", "High Economy - High Energy"]
+    assert out["Prob_Cluster_1"].tolist() == [0.8, 0.1]
+    assert "Predicted_Cluster" not in scn.columns
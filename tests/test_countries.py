@@ -0,0 +1,52 @@
+"""CountryIndex: lookup nama / alias / ISO-3 ternormalisasi, nama baru, attach vektor."""
+import pandas as pd
+import pytest
+
+from countries import UNKNOWN_ID, CountryIndex, load_country_index, normalize_name
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "countries.csv"
+    path.write_text("Country Name,ISO3,Region,Income_Group,Aliases\n"
+                    "Czechia,CZE,Europe & Central Asia,High income,Czech Republic\n"
+                    "Côte d'Ivoire,CIV,Sub-Saharan Africa,Lower middle income,Cote d`Ivoire|Ivory Coast\n"
+                    "World,WLD,Aggregate,,\n")
+    return load_country_index(str(path))
+
+
+def test_normalize_name():
+    assert normalize_name("  Côte  d`Ivoire ") == "cote d'ivoire"
+    assert normalize_name("Trinidad & Tobago") == normalize_name("trinidad and tobago")
+
+
+def test_lookup_by_name_alias_and_iso3(index):
+    assert index.id_of("Czechia") == index.id_of("czech republic") == index.id_of("CZE") == 0
+    assert index.id_of("Ivory Coast") == index.id_of("Cote d'Ivoire") == 1
+    assert index.id_of("Atlantis") == UNKNOWN_ID
+    assert index.name_of(1) == "Côte d'Ivoire" and index.name_of(99) is None
+    assert "Czech Republic" in index.known_names
+
+
+def test_with_names_adds_unknown_countries_only(index):
+    extended = index.with_names(["Czech Republic", "Atlantis", None, "Atlantis"])
+    assert len(extended.table) == 4 and extended.id_of("Atlantis") == 3
+    assert index.with_names(["Czechia"]) is index
+
+
+def test_attach_adds_ids_and_attributes(index):
+    df = pd.DataFrame({"Country Name": ["Czech Republic", "Atlantis", None, "World"]})
+    index.attach(df)
+    assert df["Country_ID"].tolist() == [0, UNKNOWN_ID, UNKNOWN_ID, 2]
+    assert df["ISO3"].isna().tolist() == [False, True, True, False]
+    assert df["ISO3"].iat[0] == "CZE"
+    assert df["Region"].iat[3] == "Aggregate"
+
+
+def test_from_names_fallback_and_missing_columns(tmp_path):
+    index = CountryIndex.from_names(["B", "A", "B"])
+    assert index.id_of("A") == 0 and index.id_of("B") == 1
+    bad = tmp_path / "bad.csv"
+    bad.write_text("Country Name,ISO3\nA,AAA\n")
+    with pytest.raises(ValueError):
+        load_country_index(str(bad))
@@ -0,0 +1,52 @@
+"""build_cube / slice_cube: agregat tertimbang populasi, total "Semua", baris agregat dibuang, lookup per potongan."""
+import pandas as pd
+import pytest
+
+from cube import ALL, MEASURES, build_cube, slice_cube
+
+
+@pytest.fixture
+def panel():
+    rows = [
+        # Country_ID, region, income, year, energy/kapita, GDP, populasi
+        (0, "Asia", "Low income", 2000, 100.0, 1e9, 1e6),
+        (1, "Asia", "High income", 2000, 1000.0, 3e10, 3e6),
+        (2, "Europe", "High income", 2000, 500.0, 2e10, 1e6),
+        (3, "Aggregate", "", 2000, 9e9, 9e15, 9e9),   # World: tidak ikut
+        (4, "", "", 2000, 9e9, 9e15, 9e9),            # tanpa region
+        (0, "Asia", "Low income", 2001, 200.0, 2e9, 1e6),
+    ]
+    return pd.DataFrame(rows, columns=["Country_ID", "Region", "Income_Group", "Year", "Energy_Consumption_kWh",
+                                       "GDP", "Population"]).assign(GDP_per_Capita=lambda d: d["GDP"] / d["Population"])
+
+
+def _cell(cube, region, income, year):
+    return slice_cube(cube).by_year[year].loc[(region, income)]
+
+
+def test_population_weighted_measures(panel):
+    cube = build_cube(panel)
+    asia = _cell(cube, "Asia", ALL, 2000)
+    assert asia["Countries"] == 2
+    assert asia["Energy_per_Capita_kWh"] == pytest.approx((100 * 1e6 + 1000 * 3e6) / 4e6)
+    assert asia["GDP_per_Capita_Weighted"] == pytest.approx(3.1e10 / 4e6)
+    assert asia["Energy_Consumption_kWh_mean"] == pytest.approx(550.0)
+    assert asia["Energy_Consumption_kWh_p50"] == pytest.approx(550.0)
+
+
+def test_rollups_exclude_aggregates(panel):
+    cube = build_cube(panel)
+    total = _cell(cube, ALL, ALL, 2000)
+    assert total["Countries"] == 3
+    assert total["Population_Total_Million"] == pytest.approx(5.0)
+    assert _cell(cube, ALL, "High income", 2000)["Countries"] == 2
+    assert list(cube.columns) == ["Region", "Income_Group", "Year"] + list(MEASURES)
+
+
+def test_slices_and_dimension_order(panel):
+    cubes = slice_cube(build_cube(panel))
+    assert cubes.years == [2000, 2001]
+    assert cubes.regions == [ALL, "Asia", "Europe"]
+    assert cubes.incomes == [ALL, "Low income", "High income"]
+    series = cubes.by_group[("Asia", "Low income")]["Energy_per_Capita_kWh"]
+    assert series.to_dict() == {2000: pytest.approx(100.0), 2001: pytest.approx(200.0)}
@@ -0,0 +1,49 @@
+"""Fingerprint file data: touch tanpa perubahan isi tidak mengubah kunci, perubahan isi selalu mengubahnya."""
+import os
+
+import data_cache
+from data_cache import content_key, describe, file_fingerprint
+
+
+def test_missing_file_has_no_fingerprint(tmp_path):
+    assert file_fingerprint(str(tmp_path / "tidak_ada.csv")) is None
+    assert content_key(str(tmp_path / "tidak_ada.csv")) == (None,)
+
+
+def test_touch_keeps_content_key(tmp_path):
+    p = tmp_path / "a.csv"
+    p.write_text("x,y\n1,2\n")
+    before = content_key(str(p))
+    st_ = os.stat(p)
+    os.utime(p, ns=(st_.st_atime_ns, st_.st_mtime_ns + 10**9))
+    assert file_fingerprint(str(p))[1] != st_.st_mtime_ns
+    assert content_key(str(p)) == before
+
+
+def test_content_change_changes_key(tmp_path):
+    p = tmp_path / "a.csv"
+    p.write_text("x,y\n1,2\n")
+    before = content_key(str(p))
+    st_ = os.stat(p)
+    # ukuran dan mtime sama, isi berbeda
+    p.write_text("x,y\n1,3\n")
+    os.utime(p, ns=(st_.st_atime_ns, st_.st_mtime_ns + 1))
+    assert content_key(str(p)) != before
+
+
+def test_hash_memo_keeps_one_entry_per_path(tmp_path):
+    p = tmp_path / "a.csv"
+    for i in range(3):
+        p.write_text(f"x\n{i}\n")
+        st_ = os.stat(p)
+        os.utime(p, ns=(st_.st_atime_ns, st_.st_mtime_ns + i + 1))
+        file_fingerprint(str(p))
+    assert sum(1 for k in data_cache._hash_memo if k[0] == str(p)) == 1
+
+
+def test_describe_reports_missing_files(tmp_path):
+    p = tmp_path / "a.csv"
+    p.write_text("x\n1\n")
+    rows = describe({"ada": str(p), "hilang": str(tmp_path / "b.csv")})
+    assert rows[0]["Dataset"] == "ada" and rows[0]["Hash"] != "-"
+    assert rows[1]["Diubah"] == "tidak ada" and rows[1]["Ukuran (KB)"] is None
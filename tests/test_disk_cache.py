@@ -0,0 +1,104 @@
+"""DiskCache: get/set, blob basi, LRU dengan batas ukuran yang berlaku untuk semua proses, peek/store."""
+import os
+import pickle
+import time
+
+import disk_cache
+from disk_cache import DiskCache, disk_cached, make_key
+
+BLOB = b"x" * 1000
+
+
+def _blob_size(tmp_path):
+    c = DiskCache(str(tmp_path / "probe"))
+    c.set("00probe", BLOB)
+    return c.stats()["bytes"]
+
+
+def _age(cache, key, seconds_ago):
+    t = time.time() - seconds_ago
+    os.utime(cache._path(key), (t, t))
+
+
+def test_get_set_and_missing(tmp_path):
+    c = DiskCache(str(tmp_path))
+    assert c.get("aa1", default=None) is None
+    c.set("aa1", {"v": 1})
+    assert c.get("aa1") == {"v": 1}
+    assert c.stats()["entries"] == 1
+
+
+def test_stale_pickle_is_a_miss_and_removed(tmp_path):
+    c = DiskCache(str(tmp_path))
+    path = c._path("bb1")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(pickle.dumps([1, 2])[:-3])
+    assert c.get("bb1", default="miss") == "miss"
+    assert not os.path.exists(path)
+
+
+def test_lru_eviction_within_one_process(tmp_path):
+    size = _blob_size(tmp_path)
+    c = DiskCache(str(tmp_path / "c"), max_bytes=2 * size)
+    c.set("k1", BLOB)
+    c.set("k2", BLOB)
+    _age(c, "k1", 100)
+    _age(c, "k2", 50)
+    c.rescan()
+    c.get("k1")  # k1 baru dipakai -> k2 yang dihapus
+    c.set("k3", BLOB)
+    assert c.get("k1") == BLOB and c.get("k3") == BLOB
+    assert c.get("k2", default=None) is None
+
+
+def test_cap_holds_across_processes(tmp_path):
+    size = _blob_size(tmp_path)
+    d = str(tmp_path / "c")
+    a, b = DiskCache(d, max_bytes=3 * size), DiskCache(d, max_bytes=3 * size)
+    a.set("a1", BLOB)
+    a.set("a2", BLOB)
+    _age(a, "a1", 300)
+    _age(a, "a2", 200)
+    # b menulis tanpa sepengetahuan index a; a tetap harus menegakkan batas
+    b.set("b1", BLOB)
+    b.set("b2", BLOB)
+    a.set("a3", BLOB)
+    total = sum(os.path.getsize(os.path.join(r, n)) for r, _, fs in os.walk(d) for n in fs if n.endswith(".pkl"))
+    assert total <= 3 * size
+    assert a.get("a1", default=None) is None
+
+
+def test_blob_read_by_other_process_is_spared(tmp_path):
+    size = _blob_size(tmp_path)
+    d = str(tmp_path / "c")
+    a, b = DiskCache(d, max_bytes=2 * size), DiskCache(d, max_bytes=2 * size)
+    a.set("k1", BLOB)
+    a.set("k2", BLOB)
+    _age(a, "k1", 100)
+    _age(a, "k2", 50)
+    a.rescan()
+    # Index a masih menganggap k1 paling lama; b baru saja membacanya
+    assert b.get("k1") == BLOB
+    a.set("k3", BLOB)
+    assert os.path.exists(a._path("k1"))
+    assert not os.path.exists(a._path("k2"))
+
+
+def test_disk_cached_peek_and_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "ENABLED", True)
+    c = DiskCache(str(tmp_path))
+    calls = []
+
+    @disk_cached("kuadrat", version=1, cache=c)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square.peek(3) is None
+    assert square(3) == 9 and square(3) == 9
+    assert calls == [3]
+    square.store(-1, 4)
+    assert square.peek(4) == -1 and square(4) == -1
+    assert calls == [3]
+    assert make_key("kuadrat", 1, (4,), {}) != make_key("kuadrat", 2, (4,), {})
@@ -0,0 +1,31 @@
+"""add_growth_columns: YoY hanya untuk tahun berurutan, elastisitas dengan ambang GDP, urutan baris dipertahankan."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from growth import ELASTICITY, ENERGY_GROWTH, GDP_GROWTH, add_growth_columns
+
+
+def _panel(rows):
+    return pd.DataFrame(rows, columns=["Country_ID", "Year", "GDP_per_Capita", "Energy_Consumption_kWh"])
+
+
+def test_yoy_and_elasticity_per_country():
+    df = _panel([(0, 2001, 110.0, 105.0), (1, 2000, 50.0, 10.0), (0, 2000, 100.0, 100.0), (1, 2001, 50.2, 12.0)])
+    add_growth_columns(df)
+    a = df[df["Country_ID"] == 0].set_index("Year")
+    assert np.isnan(a.loc[2000, GDP_GROWTH])
+    assert a.loc[2001, GDP_GROWTH] == pytest.approx(10.0)
+    assert a.loc[2001, ENERGY_GROWTH] == pytest.approx(5.0)
+    assert a.loc[2001, ELASTICITY] == pytest.approx(0.5)
+    # Pertumbuhan GDP 0.4% < ambang -> elastisitas tidak dihitung
+    b = df[(df["Country_ID"] == 1) & (df["Year"] == 2001)].iloc[0]
+    assert b[GDP_GROWTH] == pytest.approx(0.4) and np.isnan(b[ELASTICITY])
+
+
+def test_year_gap_and_zero_base_give_nan():
+    df = _panel([(0, 2000, 100.0, 0.0), (0, 2001, 120.0, 10.0), (0, 2005, 150.0, 20.0)])
+    out = add_growth_columns(df)
+    assert out is df
+    assert np.isnan(df.loc[1, ENERGY_GROWTH]) and df.loc[1, GDP_GROWTH] == pytest.approx(20.0)
+    assert df.loc[2, [GDP_GROWTH, ENERGY_GROWTH, ELASTICITY]].isna().all()
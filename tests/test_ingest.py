@@ -0,0 +1,100 @@
+"""Ingestion append-only: baris baru per file tujuan, kolom turunan, cluster terdekat, manifest revisi."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingest import country_revision, ingest, read_drop, read_manifest
+
+LSTM_COLUMNS = ["Country Name", "Year", "Energy_Consumption_kWh", "GDP", "Population"]
+
+
+def _row(country, year, energy=1000.0, gdp=1e10, pop=1e6):
+    return {"Country Name": country, "Year": year, "Energy_Consumption_kWh": energy, "GDP": gdp, "Population": pop}
+
+
+@pytest.fixture
+def stores(tmp_path):
+    lstm = pd.DataFrame([_row("A", 2000), _row("A", 2001), _row("B", 2000, energy=9000, gdp=5e10)])
+    dec = lstm.iloc[:2].assign(GDP_per_Capita=lambda d: d["GDP"] / d["Population"])
+    dec = dec.assign(log_Energy=np.log10(dec["Energy_Consumption_kWh"] + 1),
+                     log_GDP_per_Capita=np.log10(dec["GDP_per_Capita"] + 1), Cluster=0)
+    high = dec.iloc[:1].assign(**{"Country Name": "C", "Energy_Consumption_kWh": 20000.0, "GDP": 8e10,
+                                 "GDP_per_Capita": 8e4, "log_Energy": np.log10(20001), "log_GDP_per_Capita": np.log10(80001),
+                                 "Cluster": 1})
+    paths = {"lstm_path": tmp_path / "lstm.csv", "dec_path": tmp_path / "dec.csv", "manifest_path": tmp_path / "m.json"}
+    lstm.to_csv(paths["lstm_path"], index=False)
+    pd.concat([dec, high]).to_csv(paths["dec_path"], index=False)
+    return {k: str(v) for k, v in paths.items()}
+
+
+def _drop(tmp_path, rows, name="drop.csv"):
+    path = tmp_path / name
+    pd.DataFrame(rows, columns=LSTM_COLUMNS).to_csv(path, index=False)
+    return str(path)
+
+
+def test_only_missing_keys_are_appended_to_each_store(tmp_path, stores):
+    # A/2001 ada di kedua store, B/2000 hanya di LSTM, A/2002 baru di keduanya
+    drop = _drop(tmp_path, [_row("A", 2001), _row("B", 2000, energy=9000, gdp=5e10), _row("A", 2002)])
+    report = ingest(drop, **stores)
+
+    assert report["rows_new"] == 1 and report["rows_new_dec"] == 2
+    assert report["countries"] == ["A", "B"]
+    lstm, dec = pd.read_csv(stores["lstm_path"]), pd.read_csv(stores["dec_path"])
+    assert not lstm.duplicated(["Country Name", "Year"]).any()
+    assert not dec.duplicated(["Country Name", "Year"]).any()
+    assert len(lstm) == 4 and len(dec) == 5
+
+    # Kolom turunan hanya dihitung untuk baris baru, cluster = centroid terdekat
+    b = dec[dec["Country Name"] == "B"].iloc[0]
+    assert b["log_Energy"] == pytest.approx(np.log10(9001))
+    assert b["log_GDP_per_Capita"] == pytest.approx(np.log10(5e4 + 1))
+    assert b["Cluster"] == 1
+
+    # Drop yang sama lagi: tidak ada yang berubah, revisi tidak naik
+    again = ingest(drop, **stores)
+    assert again["rows_new"] == again["rows_new_dec"] == 0 and "revision" not in again
+    assert len(pd.read_csv(stores["lstm_path"])) == 4
+
+
+def test_manifest_revisions_per_country(tmp_path, stores):
+    ingest(_drop(tmp_path, [_row("A", 2002)], "d1.csv"), **stores)
+    ingest(_drop(tmp_path, [_row("D", 2000)], "d2.csv"), **stores)
+    manifest = read_manifest(stores["manifest_path"])
+    assert manifest["revision"] == 2
+    assert country_revision(manifest, "A") == 1 and country_revision(manifest, "D") == 2
+    assert country_revision(manifest, "B") == 0
+    assert [h["source"] for h in manifest["history"]] == ["d1.csv", "d2.csv"]
+
+
+def test_dry_run_writes_nothing(tmp_path, stores):
+    report = ingest(_drop(tmp_path, [_row("A", 2002)]), dry_run=True, **stores)
+    assert report["rows_new"] == 1
+    assert len(pd.read_csv(stores["lstm_path"])) == 3
+    assert read_manifest(stores["manifest_path"])["revision"] == 0
+
+
+def test_wide_world_bank_export(tmp_path):
+    path = tmp_path / "wide.csv"
+    pd.DataFrame({
+        "Country Name": ["A", "A", "A", "A"],
+        "Indicator Code": ["EG.USE.ELEC.KH.PC", "NY.GDP.MKTP.CD", "SP.POP.TOTL", "XX.OTHER"],
+        "2000": [100.0, 1e9, 1e6, 5.0],
+        "2001": [110.0, 1.1e9, 1.01e6, None],
+    }).to_csv(path, index=False)
+    df = read_drop(str(path), chunksize=2)
+    assert list(df.columns) == LSTM_COLUMNS
+    assert df["Year"].tolist() == [2000, 2001]
+    assert df["Energy_Consumption_kWh"].tolist() == [100.0, 110.0]
+
+
+def test_rows_failing_quality_checks_are_rejected(tmp_path, stores):
+    # Energi 0 sah (peringatan), energi negatif / populasi 0 / tahun kosong / nama kosong ditolak
+    rows = [_row("A", 2002, energy=0.0), _row("A", 2003, energy=-1.0), _row("A", 2004, pop=0.0),
+            _row("A", None), _row("  ", 2005), _row(" E ", 2000)]
+    report = ingest(_drop(tmp_path, rows), dry_run=True, **stores)
+    assert report["rows_invalid"] == 4
+    assert report["rows_new"] == 2 and report["countries"] == ["A", "E"]
+    assert report["issues"]["Energy_Consumption_kWh < 0 (error)"] == 1
+    assert report["issues"]["Population <= 0 (error)"] == 1
+    assert report["issues"]["Energy_Consumption_kWh <= 0 (warning)"] == 2
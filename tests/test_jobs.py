@@ -0,0 +1,102 @@
+"""JobManager: hasil parsial per langkah, pembatalan, kegagalan, dan job training dengan progres per epoch."""
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from jobs import CANCELLED, DONE, FAILED, JobCancelled, JobManager, forecast_job, training_job
+
+
+def wait(job, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if not job.active:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job.id} masih {job.status}")
+
+
+def test_forecast_job_streams_each_horizon():
+    manager = JobManager(max_workers=1)
+    seqs = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    job = wait(manager.submit("forecast_job", forecast_job, predict_next=lambda w: w[:, -1] + 1, seqs=seqs, n_years=4))
+
+    assert job.status == DONE and job.progress == 1.0
+    partial, _ = job.snapshot()
+    assert len(partial) == 4
+    np.testing.assert_allclose(job.result, [[4, 5, 6, 7], [7, 8, 9, 10]])
+
+
+def test_cancel_stops_between_steps():
+    manager = JobManager(max_workers=1)
+    gate, started = threading.Event(), threading.Event()
+
+    def slow_step(window):
+        started.set()
+        gate.wait(5)
+        return window[:, -1]
+
+    job = manager.submit("forecast_job", forecast_job, predict_next=slow_step, seqs=np.ones((1, 3)), n_years=50)
+    started.wait(5)
+    job.cancel()
+    gate.set()
+    assert wait(job).status == CANCELLED
+    assert len(job.snapshot()[0]) == 0
+
+
+def test_failure_is_reported():
+    manager = JobManager(max_workers=1)
+
+    def boom(job):
+        raise ValueError("rusak")
+
+    job = wait(manager.submit("x", boom))
+    assert job.status == FAILED and job.error == "ValueError: rusak" and job.finished is not None
+
+
+def test_active_job_and_purge():
+    manager = JobManager(max_workers=1, keep_seconds=0)
+    gate = threading.Event()
+    running = manager.submit("train_job", lambda job: gate.wait(5))
+    assert manager.active_job("train_job") is running
+    assert manager.active_job("forecast_job") is None
+
+    gate.set()
+    wait(running)
+    assert manager.active_job("train_job") is None
+    manager.submit("other", lambda job: None)  # submit membuang job selesai yang kedaluwarsa
+    assert manager.get(running.id) is None
+
+
+@pytest.fixture
+def fake_train_lstm(monkeypatch):
+    saved = []
+
+    def train(epochs, on_epoch, verbose, **kwargs):
+        for epoch in range(epochs):
+            on_epoch(epoch, {"loss": 1.0 / (epoch + 1)})
+        return "model", {"scaler_X": None}, {"epochs_run": epochs, **kwargs}
+
+    module = types.SimpleNamespace(train=train, save_artifacts=lambda model, scalers: saved.append(model))
+    monkeypatch.setitem(sys.modules, "train_lstm", module)
+    return saved
+
+
+def test_training_job_publishes_epochs_and_saves(fake_train_lstm):
+    manager = JobManager(max_workers=1)
+    job = wait(manager.submit("train_job", training_job, epochs=3, batch_size=64))
+
+    assert job.status == DONE
+    assert [p["epoch"] for p in job.snapshot()[0]] == [1, 2, 3]
+    assert job.result == {"epochs_run": 3, "batch_size": 64}
+    assert fake_train_lstm == ["model"]
+
+
+def test_cancelled_training_does_not_save(fake_train_lstm):
+    job = JobManager().submit("train_job", lambda job: None)  # hanya untuk objek Job
+    wait(job)
+    job.cancel()
+    with pytest.raises(JobCancelled):
+        training_job(job, epochs=3)
+    assert fake_train_lstm == []
@@ -0,0 +1,41 @@
+"""rank_clusters / ClusterTiers: urutan tier dari centroid, label kategorikal berurutan, id tak dikenal."""
+import pandas as pd
+
+from labels import PALETTE, rank_clusters, tier_names
+
+
+def _frame(groups):
+    rows = [(cid, gdp, energy) for cid, gdp, energy, n in groups for _ in range(n)]
+    return pd.DataFrame(rows, columns=["Cluster", "GDP_per_Capita", "Energy_Consumption_kWh"])
+
+
+def test_tiers_ordered_by_gdp_and_energy_centroids():
+    df = _frame([(7, 40000, 9e10, 2), (2, 500, 1e8, 3), (5, 5000, 5e9, 2)])
+    tiers = rank_clusters(df)
+    assert list(tiers.ids) == [2, 5, 7]
+    assert tiers.names == tier_names(3)
+    assert tiers.label_of(7) == "High Economy - High Energy"
+    assert tiers.colors[tiers.names[0]] == PALETTE[0] and tiers.colors[tiers.names[-1]] == PALETTE[-1]
+
+
+def test_labels_are_ordered_categorical_with_unknown_as_nan():
+    df = _frame([(0, 40000, 9e10, 1), (1, 500, 1e8, 1)])
+    tiers = rank_clusters(df)
+    lab = tiers.labels([0, 1, 9, 1])
+    assert lab.ordered and list(lab.categories) == tier_names(2)
+    assert list(lab.codes) == [1, 0, -1, 0]
+    assert lab.min() == "Low Economy - Low Energy" and lab.max() == "High Economy - High Energy"
+    assert tiers.label_of(9) is None
+
+
+def test_rank_ties_broken_by_gdp():
+    # Cluster 0: GDP tinggi/energi rendah, cluster 1 kebalikannya -> skor seri
+    df = _frame([(0, 40000, 1e8, 1), (1, 500, 9e10, 1)])
+    assert list(rank_clusters(df).ids) == [1, 0]
+
+
+def test_many_clusters_and_empty_frame():
+    assert tier_names(6)[0] == "Tier 1 (Low)" and tier_names(6)[-1] == "Tier 6 (High)"
+    empty = rank_clusters(_frame([]))
+    assert len(empty) == 0
+    assert list(empty.tier_of([1, 2])) == [-1, -1]
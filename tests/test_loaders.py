@@ -0,0 +1,59 @@
+"""loaders.forecast_model_info: satu round-trip info() per generasi model server / artefak model."""
+import os
+
+import pytest
+
+import loaders
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.gen = (1, 1)
+        self.down = False
+
+    def info(self):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("mati")
+        return {"look_back": 5, "signature": ((1, 2), (3, 4)), "model_key": ("keras", self.calls)}
+
+    def generation(self):
+        return self.gen
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    artifact = tmp_path / "model.h5"
+    artifact.write_bytes(b"v1")
+    fake = FakeClient()
+    monkeypatch.setattr(loaders, "MODEL_ARTIFACTS", (str(artifact),))
+    monkeypatch.setattr(loaders, "get_client", lambda: fake)
+    loaders.clear_memory()
+    yield fake, artifact
+    loaders.clear_memory()
+
+
+def test_info_is_memoized_per_generation(client):
+    fake, artifact = client
+    first = loaders.forecast_model_info()
+    assert loaders.forecast_model_info() is first and loaders.model_signature() == ("server", (1, 2), (3, 4))
+    assert fake.calls == 1
+
+    fake.gen = (2, 2)  # server di-restart
+    assert loaders.forecast_model_info()["model_key"] == ("keras", 2)
+
+    artifact.write_bytes(b"model baru")  # retrain: server memuat ulang artefak
+    os.utime(artifact, ns=(0, 10 ** 9))
+    loaders.get_look_back_size()
+    assert fake.calls == 3
+
+
+def test_unreachable_server_is_not_memoized(client, monkeypatch):
+    fake, _ = client
+    fake.down = True
+    monkeypatch.setattr(loaders, "load_pair", lambda: (None, None))
+    assert loaders.forecast_model_info()["signature"][0] != "server"  # model lokal (look_back bawaan)
+    fake.down = False
+    assert loaders.forecast_model_info()["signature"][0] == "server"
+    assert fake.calls == 2
@@ -0,0 +1,57 @@
+"""
+Model server: classifier di-fit ulang saat clustered_data_dec.csv berubah
+(sama dengan jalur lokal yang dikunci content_key), dan authkey dibuat privat.
+"""
+import os
+import stat
+
+import numpy as np
+import pandas as pd
+
+import data_cache
+from model_server import ModelServer, _Pending, get_authkey
+
+
+def _dec_frame(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.random((n, 2)) * 4
+    return pd.DataFrame({"log_GDP_per_Capita": x[:, 0], "log_Energy": x[:, 1],
+                         "Cluster": (x.sum(axis=1) > 4).astype(int)})
+
+
+def _classify(server, X):
+    item = _Pending({"op": "classify", "X": np.asarray(X, dtype=float)})
+    server._run_classify([item])
+    return item.reply["result"]["labels"]
+
+
+def test_classifier_refits_when_csv_changes(tmp_path, monkeypatch):
+    path = tmp_path / "clustered_data_dec.csv"
+    monkeypatch.setitem(data_cache.DATA_FILES, "dec", str(path))
+    _dec_frame().to_csv(path, index=False)
+
+    server = ModelServer(str(tmp_path / "model.sock"))
+    server._load_classifier()
+    first_key, first_clf = server.clf_key, server.clf
+    _classify(server, [[1.0, 1.0]])
+    assert server.clf is first_clf  # isi sama -> tidak fit ulang
+
+    # Label dibalik: classifier lama akan salah untuk semua titik
+    df = _dec_frame()
+    df["Cluster"] = 1 - df["Cluster"]
+    df.to_csv(path, index=False)
+
+    labels = _classify(server, [[0.1, 0.1], [3.9, 3.9]])
+    assert server.clf_key != first_key
+    assert list(labels) == [1, 0]
+
+
+def test_authkey_file_is_created_private(tmp_path, monkeypatch):
+    monkeypatch.delenv("ENERGY_MODEL_SERVER_KEY", raising=False)
+    key_file = tmp_path / "rt" / "authkey"
+    assert get_authkey(key_file=str(key_file)) is None
+
+    key = get_authkey(create=True, key_file=str(key_file))
+    assert key and get_authkey(key_file=str(key_file)) == key
+    assert stat.S_IMODE(os.stat(key_file).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(key_file.parent).st_mode) == 0o700
@@ -0,0 +1,63 @@
+"""Engine multivariat: fitur mengikuti konvensi dataset, window terakhir per negara, simpan/muat berpasangan."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingest import derive_columns
+from multivariate import (FEATURES, fit_scalers, inverse_transform, latest_mv_windows, prepare_panel,
+                          transform)
+
+
+@pytest.fixture
+def raw():
+    rows = [(c, y, 100.0 * (i + 1) + y - 2000, 1e9 * (i + 1), 1e6) for i, c in enumerate(["A", "B"])
+            for y in range(2000, 2008)]
+    df = pd.DataFrame(rows, columns=["Country Name", "Year", "Energy_Consumption_kWh", "GDP", "Population"])
+    return df.sample(frac=1, random_state=0)
+
+
+def test_log_features_match_ingest_convention(raw):
+    panel = prepare_panel(raw)
+    derived = derive_columns(raw).sort_values(["Country Name", "Year"]).reset_index(drop=True)
+    np.testing.assert_allclose(panel["log_GDP_per_Capita"], derived["log_GDP_per_Capita"])
+    np.testing.assert_allclose(panel["log_Energy"], derived["log_Energy"])
+
+
+def test_invalid_rows_are_dropped(raw):
+    raw.loc[raw.index[0], "Population"] = 0
+    assert len(prepare_panel(raw)) == len(raw) - 1
+
+
+def test_latest_windows_and_scaling_roundtrip(raw):
+    panel = prepare_panel(raw)
+    countries, last_years, windows = latest_mv_windows(panel, 3)
+    assert list(countries) == ["A", "B"] and list(last_years) == [2007, 2007]
+    assert windows.shape == (2, 3, len(FEATURES))
+    np.testing.assert_allclose(windows[0, -1], panel[panel["Country Name"] == "A"][FEATURES].iloc[-1])
+
+    scalers = fit_scalers(panel)
+    np.testing.assert_allclose(inverse_transform(scalers, transform(scalers, windows)), windows)
+
+
+def test_latest_windows_skip_gaps(raw):
+    panel = prepare_panel(raw[~((raw["Country Name"] == "B") & (raw["Year"] == 2006))])
+    assert list(latest_mv_windows(panel, 3)[0]) == ["A"]
+    assert list(latest_mv_windows(panel, 3, require_consecutive=False)[0]) == ["A", "B"]
+
+
+def test_save_engine_writes_a_matching_pair(tmp_path, raw):
+    import tensorflow as tf
+    from forecasting import PAIR_KEY, file_digest
+    from multivariate import build_model, load_engine, save_engine
+
+    model, scalers = build_model(3), fit_scalers(prepare_panel(raw))
+    paths = {name: str(tmp_path / name) for name in ("m.h5", "s.pkl", "m.json")}
+    save_engine(model, scalers, {"look_back": 3}, *paths.values())
+
+    loaded, loaded_scalers, meta = load_engine(*paths.values())
+    assert meta == {"look_back": 3}
+    assert loaded_scalers[PAIR_KEY] == file_digest(paths["m.h5"])
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(paths)  # tidak ada file sementara tersisa
+    x = np.zeros((1, 3, len(FEATURES)), dtype=np.float32)
+    np.testing.assert_allclose(loaded.predict(x, verbose=0), model.predict(x, verbose=0), atol=1e-6)
+    assert isinstance(loaded, tf.keras.Model)
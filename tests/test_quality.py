@@ -0,0 +1,78 @@
+"""quality: cek skema / tipe / kunci / celah / rentang nilai, mask baris ingestion, laporan saat load_all_data."""
+import pandas as pd
+
+import disk_cache
+import loaders
+from data_cache import DATA_FILES
+from quality import ERROR, OK, WARNING, build_report, invalid_rows, validate, year_gaps
+
+
+def _lstm(rows):
+    return pd.DataFrame(rows, columns=["Country Name", "Year", "Energy_Consumption_kWh", "GDP", "Population"])
+
+
+def _checks(issues):
+    return {row["Cek"]: (row["Level"], row["Jumlah"]) for row in issues}
+
+
+def test_clean_frame_passes_every_check():
+    df = _lstm([("A", 2000, 10.0, 1e9, 1e6), ("A", 2001, 11.0, 1e9, 1e6)])
+    issues = validate("lstm", df, reference_names=["A"])
+    assert {row["Level"] for row in issues} == {OK}
+
+
+def test_missing_columns_stop_validation():
+    issues = validate("lstm", pd.DataFrame({"Country Name": ["A"], "Year": [2000]}))
+    assert len(issues) == 1 and issues[0]["Level"] == ERROR and issues[0]["Jumlah"] == 3
+
+
+def test_type_key_gap_range_and_name_checks():
+    df = _lstm([("A", 2000, 0.0, 1e9, 1e6), ("A", 2000, 5.0, 1e9, 1e6), ("A", 2003, "x", 1e9, 1e6),
+                ("B", 2000.5, -2.0, 0.0, 1e6), (None, 2001, 1.0, 1e9, 1e6)])
+    checks = _checks(validate("lstm", df, reference_names=["A"]))
+    assert checks["Tipe Country Name"] == (ERROR, 1)
+    assert checks["Tipe Year"] == (ERROR, 1)
+    assert checks["Tipe Energy_Consumption_kWh"] == (ERROR, 1)
+    assert checks["Kunci ganda Country Name/Year"] == (ERROR, 2)
+    assert checks["Celah tahun"] == (WARNING, 1)
+    assert checks["GDP <= 0"] == (ERROR, 1) and "Population <= 0" in checks
+    assert checks["Energy_Consumption_kWh < 0"] == (ERROR, 1)
+    assert checks["Energy_Consumption_kWh <= 0"] == (WARNING, 2)
+    assert checks["Nama negara tidak dikenal"] == (WARNING, 1)
+    assert invalid_rows("lstm", df).tolist() == [False, False, True, True, True]
+
+
+def test_integer_column_stored_as_float_is_a_warning():
+    df = _lstm([("A", 2000.0, 1.0, 1.0, 1.0)])
+    assert _checks(validate("lstm", df))["Tipe Year"] == (WARNING, 1)
+
+
+def test_year_gaps_per_country():
+    df = pd.DataFrame({"Country Name": ["A", "A", "B", "B", "A"], "Year": [2000, 2001, 2000, 2004, 2005]})
+    gaps = year_gaps(df)
+    assert gaps.to_dict("records") == [{"Country Name": "A", "Year_From": 2001, "Year_To": 2005, "Missing": 3},
+                                       {"Country Name": "B", "Year_From": 2000, "Year_To": 2004, "Missing": 3}]
+
+
+def test_missing_file_is_reported():
+    report = build_report({"granger": None})
+    assert report.iloc[0].to_dict()["Level"] == ERROR and list(report.columns)[:2] == ["Dataset", "Cek"]
+
+
+def test_load_all_data_attaches_report(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "ENABLED", False)
+    lstm = _lstm([("A", 2000, 10.0, 1e9, 1e6), ("A", 2002, 11.0, 1e9, 1e6)])
+    lstm.to_csv(tmp_path / "lstm.csv", index=False)
+    monkeypatch.setitem(DATA_FILES, "lstm", str(tmp_path / "lstm.csv"))
+    for name in ("dec", "granger"):
+        monkeypatch.setitem(DATA_FILES, name, str(tmp_path / f"{name}.csv"))
+    validated, summary = {}, loaders.quality_summary
+    monkeypatch.setattr(loaders, "quality_summary", lambda frames, ref: validated.update(frames) or summary(frames, ref))
+    data = loaders.load_all_data("test")
+    report = data["quality"].report
+    assert set(report["Dataset"]) == {"lstm", "dec", "granger"}
+    assert data["quality"].rows == {"lstm": 2, "dec": 0, "granger": 0}
+    assert report.loc[(report["Dataset"] == "lstm") & (report["Cek"] == "Celah tahun"), "Level"].item() == WARNING
+    assert "log_Energy" in data["lstm"].columns
+    # Validasi berjalan pada CSV seperti dibaca, bukan frame yang sudah diperkaya
+    assert list(validated["lstm"].columns) == list(lstm.columns)
@@ -0,0 +1,53 @@
+"""quantize tanpa TensorFlow: gerbang paritas dengan model palsu, path output per folder model, laporan."""
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import quantize
+from quantize import load_report, output_path, parity
+
+LOOK_BACK = 3
+
+
+@pytest.fixture
+def panel():
+    rows = [(c, y, 2.0 + 0.01 * (y - 2000) + i) for i, c in enumerate("ABC") for y in range(2000, 2012)]
+    return pd.DataFrame(rows, columns=["Country Name", "Year", "log_Energy"])
+
+
+def test_identical_models_pass(panel, persistence, identity_scalers):
+    report = parity(persistence(), persistence(), identity_scalers, panel, LOOK_BACK)
+    assert report["passed"] and report["step_max_abs_diff"] == 0.0
+    assert report["n_windows"] == 3 * (12 - LOOK_BACK)
+    assert report["backtest_mae_keras"] == pytest.approx(0.01)
+
+
+def test_drift_beyond_limits_fails(panel, persistence, identity_scalers):
+    small = parity(persistence(), persistence(bias=quantize.MAX_MEAN_ABS_DIFF / 10), identity_scalers, panel, LOOK_BACK)
+    assert small["passed"]
+    # Bias kecil per langkah menumpuk di forecast recursive -> batas forecast yang menolak
+    drift = parity(persistence(), persistence(bias=0.004), identity_scalers, panel, LOOK_BACK)
+    assert drift["step_mean_abs_diff"] <= quantize.MAX_MEAN_ABS_DIFF
+    assert drift[f"forecast_{quantize.PARITY_HORIZON}y_mean_abs_diff"] > quantize.MAX_FORECAST_MEAN_ABS_DIFF
+    assert not drift["passed"]
+    assert not parity(persistence(), persistence(bias=0.1), identity_scalers, panel, LOOK_BACK)["passed"]
+
+
+def test_output_path_follows_source_model_folder(tmp_path):
+    archived = tmp_path / "models" / "v2" / "model.h5"
+    assert output_path("tflite-dynamic", str(archived)) == str(tmp_path / "models" / "v2" / "model_dynamic.tflite")
+    assert os.path.basename(output_path("tflite-float16")) == "model_float16.tflite"
+    with pytest.raises(KeyError):
+        output_path("tflite-int4")
+
+
+def test_load_report_missing_or_corrupt(tmp_path):
+    assert load_report(str(tmp_path / "none.json")) == {}
+    bad = tmp_path / "bad.json"
+    bad.write_text("{")
+    assert load_report(str(bad)) == {}
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"tflite-dynamic": {"saved": True}}))
+    assert load_report(str(good))["tflite-dynamic"]["saved"]
@@ -0,0 +1,73 @@
+"""compare_versions: backtest in/out-of-sample, MAPE tanpa pembagi nol, fan dari RMSE; model palsu tanpa TensorFlow."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import registry
+from registry import IN_SAMPLE, OUT_OF_SAMPLE, compare_versions, list_versions, mape_per_horizon
+
+
+class FakeRegistry:
+    def __init__(self, models, scalers):
+        self.models = models
+        self.scalers = scalers
+
+    def get(self, version):
+        model = self.models[version["name"]]
+        return model, self.scalers, model.input_shape[1]
+
+
+def _country(values, start=1990):
+    return pd.DataFrame({"Country Name": "A", "Year": np.arange(start, start + len(values)), "log_Energy": values})
+
+
+def test_mape_skips_zero_actuals():
+    actual = np.log10(np.array([[0.0, 100.0], [0.0, 200.0]]) + 1)
+    pred = np.log10(np.array([[50.0, 110.0], [10.0, 180.0]]) + 1)
+    mape = mape_per_horizon(pred, actual)
+    assert np.isnan(mape[0]) and mape[1] == pytest.approx(10.0)
+
+
+def test_in_sample_without_train_end_year(persistence, identity_scalers):
+    df = _country(np.linspace(2, 3, 20))
+    fake = FakeRegistry({"v1": persistence(), "v2": persistence(bias=0.1)}, identity_scalers)
+    versions = [{"name": "v1", "meta": {}}, {"name": "v2", "meta": {}}]
+    df_fc, df_err = compare_versions(fake, versions, df, n_years=3)
+    assert set(df_err["Sample"]) == {IN_SAMPLE}
+    assert df_err.groupby("Version")["Backtest_Windows"].first().tolist() == [registry.BACKTEST_ORIGINS] * 2
+    err = df_err.set_index(["Version", "Horizon"])["RMSE_log"]
+    assert err[("v2", 1)] != err[("v1", 1)]
+    fc = df_fc[df_fc["Version"] == "v1"]
+    assert fc["Year"].tolist() == [2010, 2011, 2012]
+    assert (fc["Lower_kWh"] <= fc["Predicted_Energy_kWh"]).all() and (fc["Predicted_Energy_kWh"] <= fc["Upper_kWh"]).all()
+
+
+def test_out_of_sample_after_train_end_year_and_zero_energy_country(persistence, identity_scalers):
+    # Energi 0 kWh (log 0) di tahun backtest tidak membuat MAPE inf / NaN
+    values = np.linspace(2, 3, 20)
+    values[[15, 16]] = 0.0
+    df = _country(values)
+    fake = FakeRegistry({"v1": persistence()}, identity_scalers)
+    _, df_err = compare_versions(fake, [{"name": "v1", "meta": {"train_end_year": 2003}}], df, n_years=2)
+    assert set(df_err["Sample"]) == {OUT_OF_SAMPLE}
+    assert np.isfinite(df_err["MAPE_%"]).all()
+    # Data 1990-2009, horizon backtest 2 tahun: target pertama 2004..2008
+    assert df_err["Backtest_Windows"].iat[0] == 5
+
+
+def test_short_history_skipped_and_versions_listed(tmp_path, monkeypatch, persistence, identity_scalers):
+    fake = FakeRegistry({"v1": persistence()}, identity_scalers)
+    df_fc, df_err = compare_versions(fake, [{"name": "v1", "meta": {}}], _country([1.0, 2.0]), n_years=2)
+    assert df_fc.empty and df_err.empty
+
+    monkeypatch.setattr(registry, "MODEL_PATH", str(tmp_path / "missing.h5"))
+    folder = tmp_path / "models" / "v1"
+    folder.mkdir(parents=True)
+    (folder / "model.h5").write_bytes(b"")
+    (folder / "scalers.pkl").write_bytes(b"")
+    (folder / "meta.json").write_text(json.dumps({"train_end_year": 2010}))
+    (tmp_path / "models" / "incomplete").mkdir()
+    versions = list_versions(str(tmp_path / "models"))
+    assert [v["name"] for v in versions] == ["v1"] and versions[0]["meta"]["train_end_year"] == 2010
@@ -0,0 +1,30 @@
+"""Cache forecast per negara di dashboard: ingestion satu negara tidak membatalkan cache negara lain."""
+import pandas as pd
+
+import shared
+from data_cache import DATA_FILES
+from ingest import ingest, read_manifest
+
+COLUMNS = ["Country Name", "Year", "Energy_Consumption_kWh", "GDP", "Population"]
+
+
+def test_ingest_only_invalidates_changed_country(tmp_path, monkeypatch):
+    lstm, manifest = tmp_path / "lstm.csv", tmp_path / "m.json"
+    pd.DataFrame([(c, y, 1000.0, 1e10, 1e6) for c in "AB" for y in (2000, 2001)], columns=COLUMNS).to_csv(lstm, index=False)
+    drop = tmp_path / "drop.csv"
+    pd.DataFrame([("A", 2002, 1100.0, 1e10, 1e6)], columns=COLUMNS).to_csv(drop, index=False)
+
+    computed = []
+    monkeypatch.setitem(DATA_FILES, "lstm", str(lstm))
+    monkeypatch.setattr(shared, "get_manifest", lambda: read_manifest(str(manifest)))
+    monkeypatch.setattr(shared, "model_signature", lambda: ("model",))
+    monkeypatch.setattr(shared, "_country_window", lambda country: computed.append(country) or (None, None))
+    shared.cached_country_forecast.clear()
+
+    for country in "AB":
+        shared.country_forecast(country, 3)
+    ingest(str(drop), lstm_path=str(lstm), dec_path=str(tmp_path / "dec.csv"), manifest_path=str(manifest))
+    for country in "AB":
+        shared.country_forecast(country, 3)
+
+    assert computed == ["A", "B", "A"]
@@ -0,0 +1,39 @@
+"""SimilarityIndex: tetangga terdekat per tahun tanpa negara itu sendiri, baris tak valid dibuang."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from growth import ENERGY_GROWTH, GDP_GROWTH
+from similarity import SimilarityIndex
+
+
+@pytest.fixture
+def index():
+    rows = [
+        # id, nama, tahun, log GDP/kapita, log energi, YoY GDP, YoY energi
+        (0, "A", 2000, 3.0, 3.0, 1.0, 1.0),
+        (1, "B", 2000, 3.1, 3.05, 1.2, np.nan),   # pertumbuhan kosong -> 0%
+        (2, "C", 2000, 4.5, 4.4, 2.0, 2.0),
+        (3, "D", 2000, 4.6, 4.5, 900.0, 2.0),     # pertumbuhan ekstrem dipotong
+        (4, "E", 2000, np.nan, 3.0, 0.0, 0.0),    # fitur log kosong -> dibuang
+        (-1, "World", 2000, 3.0, 3.0, 1.0, 1.0),  # tanpa Country_ID -> dibuang
+        (0, "A", 2001, 3.0, 3.0, 0.0, 0.0),
+    ]
+    df = pd.DataFrame(rows, columns=["Country_ID", "Country Name", "Year", "log_GDP_per_Capita", "log_Energy",
+                                     GDP_GROWTH, ENERGY_GROWTH])
+    return SimilarityIndex(df)
+
+
+def test_nearest_neighbours_exclude_self(index):
+    result = index.similar(0, 2000, k=2)
+    assert result["Country Name"].tolist() == ["B", "C"]
+    assert (np.diff(result["Distance"]) >= 0).all()
+    assert 0 not in result["Country_ID"].tolist()
+
+
+def test_invalid_rows_and_unknown_queries(index):
+    assert index.years == [2000, 2001]
+    names = index.similar(2, 2000, k=10)["Country Name"].tolist()
+    assert set(names) == {"A", "B", "D"}
+    assert index.similar(4, 2000) is None and index.similar(0, 1999) is None
+    assert index.similar(0, 2001, k=3).empty
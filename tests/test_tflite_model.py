@@ -0,0 +1,86 @@
+"""
+TFLiteModel harus memberi hasil yang sama untuk satu window, baik diprediksi
+sendiri (batch 1) maupun di dalam batch N, dan tidak membawa state LSTM dari
+panggilan sebelumnya setelah resize_tensor_input / allocate_tensors.
+quantize() dijalankan penuh pada LSTM kecil: .tflite & laporan paritas harus tertulis.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+import tensorflow as tf
+
+from forecasting import TFLiteModel
+from quantize import REPORT_NAME, convert, quantize
+
+LOOK_BACK = 5
+
+
+@pytest.fixture(scope="module", params=["dynamic", "float16"])
+def models(request, tmp_path_factory):
+    tf.keras.utils.set_random_seed(0)
+    keras_model = tf.keras.Sequential([
+        tf.keras.Input(shape=(LOOK_BACK, 1)),
+        tf.keras.layers.LSTM(16),
+        tf.keras.layers.Dense(1),
+    ])
+    path = tmp_path_factory.mktemp("tflite") / f"model_{request.param}.tflite"
+    path.write_bytes(convert(keras_model, request.param))
+    tflite_model = TFLiteModel(str(path))
+    return keras_model, tflite_model
+
+
+def test_batch_one_matches_batch_n(models):
+    _, tflite_model = models
+    X = np.random.default_rng(0).random((32, LOOK_BACK, 1)).astype(np.float32)
+
+    batched = tflite_model.predict(X)
+    singles = np.vstack([tflite_model.predict(X[i:i + 1]) for i in range(len(X))])
+    batched_again = tflite_model.predict(X)
+
+    np.testing.assert_allclose(singles, batched, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(batched_again, batched, rtol=1e-5, atol=1e-6)
+
+
+def test_repeated_window_has_no_carried_state(models):
+    _, tflite_model = models
+    x = np.random.default_rng(1).random((1, LOOK_BACK, 1)).astype(np.float32)
+    np.testing.assert_allclose(tflite_model.predict(x), tflite_model.predict(x), rtol=1e-6, atol=1e-7)
+
+
+def test_close_to_keras(models):
+    keras_model, tflite_model = models
+    X = np.random.default_rng(2).random((8, LOOK_BACK, 1)).astype(np.float32)
+    np.testing.assert_allclose(tflite_model.predict(X), keras_model.predict(X, verbose=0), atol=0.05)
+
+
+def test_input_shape_exposes_look_back(models):
+    _, tflite_model = models
+    assert tflite_model.input_shape[1] == LOOK_BACK
+
+
+@pytest.mark.parametrize("mode", ["dynamic", "float16"])
+def test_quantize_end_to_end(mode, tmp_path):
+    from train_lstm import build_model, fit_scalers, save_artifacts, training_windows
+
+    tf.keras.utils.set_random_seed(0)
+    rng = np.random.default_rng(0)
+    panel = pd.DataFrame([(c, y, 10 ** (6 + i + 0.02 * (y - 1990) + 0.01 * rng.random()))
+                          for i, c in enumerate("ABC") for y in range(1990, 2010)],
+                         columns=["Country Name", "Year", "Energy_Consumption_kWh"])
+    data_path = tmp_path / "data.csv"
+    panel.to_csv(data_path, index=False)
+    model_path, scaler_path = tmp_path / "model.h5", tmp_path / "scalers.pkl"
+    scalers = fit_scalers(training_windows(panel.assign(log_Energy=np.log10(panel["Energy_Consumption_kWh"] + 1)),
+                                           LOOK_BACK))
+    save_artifacts(build_model(LOOK_BACK), scalers, str(model_path), str(scaler_path))
+
+    report = quantize(mode, str(model_path), str(scaler_path), str(data_path))
+
+    assert report["parity"]["passed"] and report["saved"]
+    out = tmp_path / f"model_{mode}.tflite"
+    assert out.exists() and report["memory"]["file_mb_tflite"] > 0
+    with open(tmp_path / REPORT_NAME) as f:
+        assert json.load(f)[f"tflite-{mode}"]["parity"]["passed"]
+    assert TFLiteModel(str(out)).predict(np.zeros((3, LOOK_BACK, 1), dtype=np.float32)).shape == (3, 1)
@@ -0,0 +1,84 @@
+"""Pipeline training streaming: scaler partial_fit per potongan, tf.data dari generator, callback per epoch."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import DEFAULT_LOOK_BACK
+from train_lstm import checkpoint_run_dir, fit_scalers, training_windows
+
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(0)
+    rows = [(c, y, rng.random() * 4) for c in ["A", "B", "C"] for y in range(1990, 2010)]
+    return pd.DataFrame(rows, columns=["Country Name", "Year", "log_Energy"])
+
+
+def test_streaming_scalers_match_a_full_fit(panel):
+    from sklearn.preprocessing import MinMaxScaler
+
+    ws = training_windows(panel, 3)
+    scalers = fit_scalers(ws, chunk_size=7)
+    full_X = MinMaxScaler().fit(ws.X[..., 0])
+    np.testing.assert_allclose(scalers["scaler_X"].data_min_, full_X.data_min_)
+    np.testing.assert_allclose(scalers["scaler_X"].data_max_, full_X.data_max_)
+    np.testing.assert_allclose(scalers["scaler_y"].data_max_, [ws.y[:, 0, 0].max()])
+
+
+def test_windows_skip_year_gaps(panel):
+    gapped = panel[~((panel["Country Name"] == "A") & (panel["Year"] == 2000))]
+    gapped = gapped[~((gapped["Country Name"] == "B") & (gapped["Year"] == 2005))]
+    ws = training_windows(gapped, 3)
+    # Window (3 tahun + target) yang memuat lompatan 1999 -> 2001 (A) / 2004 -> 2006 (B) dibuang
+    assert [int((ws.country == c).sum()) for c in "ABC"] == [7 + 6, 12 + 1, 17]
+    assert not set(ws.year[ws.country == "B"]) & {2005, 2006, 2007, 2008}
+
+
+def test_checkpoint_dir_follows_data_and_config(panel, tmp_path):
+    data = tmp_path / "data.csv"
+    panel.to_csv(data, index=False)
+    root = tmp_path / "ckpt"
+    root.mkdir()
+    (root / "catatan.txt").write_text("bukan checkpoint")
+
+    first = checkpoint_run_dir(str(root), str(data), 3, 32)
+    (tmp_path / "ckpt" / os.path.basename(first) / "latest.weights.h5").write_bytes(b"x")
+    assert checkpoint_run_dir(str(root), str(data), 3, 32) == first
+    assert os.path.exists(os.path.join(first, "latest.weights.h5"))  # run sama -> dilanjutkan
+
+    other = checkpoint_run_dir(str(root), str(data), 5, 32)
+    assert other != first and not os.path.exists(first)  # konfigurasi lain -> checkpoint lama dibuang
+    panel.assign(log_Energy=panel["log_Energy"] + 1).to_csv(data, index=False)
+    assert checkpoint_run_dir(str(root), str(data), 5, 32) != other
+    assert sorted(os.listdir(root))[0] == "catatan.txt" and len(os.listdir(root)) == 2
+
+
+def test_dataset_streams_every_window_scaled(panel):
+    from train_lstm import make_dataset
+
+    ws = training_windows(panel, 3)
+    scalers = fit_scalers(ws)
+    batches = list(make_dataset(ws, scalers, batch_size=16, chunk_size=10).as_numpy_iterator())
+
+    X = np.concatenate([b[0] for b in batches])
+    y = np.concatenate([b[1] for b in batches])
+    assert X.shape == (len(ws), 3, 1) and y.shape == (len(ws), 1)
+    expected = scalers["scaler_X"].transform(ws.X[..., 0])
+    # Urutan diacak: bandingkan sebagai himpunan baris
+    np.testing.assert_allclose(np.sort(X[..., 0], axis=0), np.sort(expected, axis=0), rtol=1e-6)
+
+
+def test_train_reports_each_epoch(panel, tmp_path):
+    from train_lstm import train
+
+    data = tmp_path / "data.csv"
+    panel.assign(Energy_Consumption_kWh=10 ** panel["log_Energy"] - 1).drop(columns="log_Energy").to_csv(data, index=False)
+
+    epochs = []
+    model, scalers, info = train(str(data), epochs=2, batch_size=32, checkpoint_dir=str(tmp_path / "ckpt"),
+                                 verbose=0, on_epoch=lambda epoch, logs: epochs.append((epoch, logs["loss"])))
+    assert [e for e, _ in epochs] == [0, 1]
+    assert info["look_back"] == DEFAULT_LOOK_BACK == model.input_shape[1]
+    assert info["n_windows"] == 3 * (20 - DEFAULT_LOOK_BACK)
@@ -0,0 +1,44 @@
+"""ClusterTransitions: transisi per pasangan observasi berurutan, matriks rentang tahun, aliran antar dua tahun."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from labels import ClusterTiers
+from transitions import DOWNGRADE, STAY, UPGRADE, ClusterTransitions
+
+
+@pytest.fixture
+def tr():
+    # Cluster 7 = tier rendah, 3 = tier tinggi; cluster 9 tidak dikenal (dibuang)
+    tiers = ClusterTiers([7, 3], ["Low", "High"])
+    rows = [("A", 0, 2000, 7), ("A", 0, 2001, 3), ("A", 0, 2002, 3), ("A", 0, 2003, 7),
+            ("B", 1, 2000, 3), ("B", 1, 2002, 3), ("B", 1, 2001, 9),
+            ("C", 2, 2003, 7)]
+    df = pd.DataFrame(rows, columns=["Country Name", "Country_ID", "Year", "Cluster"]).sample(frac=1, random_state=0)
+    return ClusterTransitions(df, tiers)
+
+
+def test_events_follow_consecutive_observations(tr):
+    a = tr.events_of("A")
+    assert a["Event"].tolist() == [UPGRADE, STAY, DOWNGRADE]
+    assert a[["Year_From", "Year_To"]].values.tolist() == [[2000, 2001], [2001, 2002], [2002, 2003]]
+    # Observasi B 2001 tidak dikenal -> transisi langsung 2000 -> 2002
+    assert tr.events_of("B")[["Year_From", "Year_To", "Event"]].values.tolist() == [[2000, 2002, STAY]]
+    assert tr.events_of("C").empty and tr.events_of("Atlantis").empty
+
+
+def test_matrix_between_uses_origin_year_range(tr):
+    np.testing.assert_array_equal(tr.matrix_between(2000, 2004), [[0, 1], [1, 2]])
+    np.testing.assert_array_equal(tr.matrix_between(2000, 2001), [[0, 1], [0, 1]])
+    np.testing.assert_array_equal(tr.matrix_between(2002, 2003), [[0, 0], [1, 0]])
+    np.testing.assert_array_equal(tr.matrix_between(1990, 2100), tr.matrices.sum(axis=0))
+
+
+def test_flow_between_and_summary(tr):
+    # Hanya A yang punya data di 2000 & 2003 (Low -> Low)
+    np.testing.assert_array_equal(tr.flow_between(2000, 2003), [[1, 0], [0, 0]])
+    np.testing.assert_array_equal(tr.flow_between(2000, 2001), [[0, 1], [0, 0]])  # B 2001 tidak dikenal
+    np.testing.assert_array_equal(tr.flow_between(2000, 1800), np.zeros((2, 2)))
+    assert tr.summary.loc["A", [UPGRADE, DOWNGRADE]].tolist() == [1, 1]
+    assert tr.summary.loc["A", "Tier Awal"] == "Low" and tr.summary.loc["B", "Tier Akhir"] == "High"
+    assert np.isnan(tr.trajectory.loc["B", 2001])
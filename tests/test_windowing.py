@@ -0,0 +1,69 @@
+"""build_windows & latest_windows: window tidak melintasi negara / celah tahun, metadata per window, potongan streaming."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import latest_windows
+from windowing import build_windows
+
+
+@pytest.fixture
+def panel():
+    # B punya celah 2003 -> 2005; urutan baris diacak
+    rows = [("A", y, float(y - 2000)) for y in range(2000, 2006)]
+    rows += [("B", y, 100.0 + y - 2000) for y in (2000, 2001, 2002, 2005, 2006)]
+    return pd.DataFrame(rows, columns=["Country Name", "Year", "v"]).sample(frac=1, random_state=1)
+
+
+def test_windows_stay_within_each_country(panel):
+    ws = build_windows(panel, "v", look_back=2)
+    assert len(ws) == (6 - 2) + (5 - 2)
+    assert ws.X.shape == (7, 2, 1) and ws.y.shape == (7, 1, 1)
+    np.testing.assert_allclose(ws.X[0, :, 0], [0, 1])
+    np.testing.assert_allclose(ws.y[0, 0], [2])
+    assert list(ws.country) == ["A"] * 4 + ["B"] * 3
+    assert list(ws.year[:4]) == [2002, 2003, 2004, 2005]
+    # Tidak ada window yang mencampur nilai A (< 100) dan B (>= 100)
+    mixed = (ws.X[..., 0] >= 100).any(axis=1) != (ws.X[..., 0] >= 100).all(axis=1)
+    assert not mixed.any()
+
+
+def test_require_consecutive_drops_windows_across_gaps(panel):
+    ws = build_windows(panel, "v", look_back=2, require_consecutive=True)
+    assert list(ws.country) == ["A"] * 4 + ["B"]
+    assert list(ws.year[ws.country == "B"]) == [2002]
+
+
+def test_latest_windows_skip_gaps(panel):
+    # Window terakhir B (look_back 3) = 2002, 2005, 2006 -> dilewati; look_back 2 = 2005, 2006 -> dipakai
+    countries, last_years, windows = latest_windows(panel, 3, "v")
+    assert list(countries) == ["A"] and list(last_years) == [2005]
+    np.testing.assert_allclose(windows, [[3, 4, 5]])
+    assert list(latest_windows(panel, 2, "v")[0]) == ["A", "B"]
+    assert list(latest_windows(panel, 3, "v", require_consecutive=False)[0]) == ["A", "B"]
+
+
+def test_multi_feature_multi_horizon(panel):
+    panel = panel.assign(w=-panel["v"])
+    ws = build_windows(panel, ["v", "w"], look_back=2, horizon=2)
+    assert ws.X.shape == (5, 2, 2) and ws.y.shape == (5, 2, 2)
+    np.testing.assert_allclose(ws.y[0], [[2, -2], [3, -3]])
+
+
+def test_split_and_chunks(panel):
+    ws = build_windows(panel, "v", look_back=2)
+    train, test = ws.split_by_year(2005)
+    assert len(train) + len(test) == len(ws)
+    assert (test.year >= 2005).all() and (train.year < 2005).all()
+    np.testing.assert_allclose(test.y[:, 0, 0], ws.y[ws.year >= 2005, 0, 0])
+
+    chunks = list(ws.chunks(3))
+    assert [len(X) for X, _ in chunks] == [3, 3, 1]
+    np.testing.assert_allclose(np.concatenate([X for X, _ in chunks]), ws.X)
+    np.testing.assert_allclose(np.concatenate([y for _, y in chunks]), ws.y)
+
+
+def test_short_panel_gives_empty_set():
+    df = pd.DataFrame({"Country Name": ["A"], "Year": [2000], "v": [1.0]})
+    ws = build_windows(df, "v", look_back=3)
+    assert len(ws) == 0 and ws.X.shape == (0, 3, 1)
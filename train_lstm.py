@@ -0,0 +1,252 @@
+"""
+Training ulang model LSTM univariat (model.h5 + scalers.pkl).
+
+Window seluruh negara ditandai vektoris (windowing.py) tanpa menyalin data,
+lalu dialirkan per potongan: scaler di-fit dengan partial_fit dalam satu
+lintasan, dan tf.data.Dataset.from_generator menskalakan tiap potongan saat
+dibaca (unbatch -> shuffle -> batch -> prefetch). Training memakai semua
+core CPU dengan pengaturan thread intra/inter-op, dan checkpoint disimpan
+berkala sehingga training yang terputus bisa dilanjutkan dengan perintah yang sama
+(checkpoint dipisah per isi data + look_back + batch size). Window yang
+melintasi celah tahun tidak ikut dilatih.
+
+    python train_lstm.py --epochs 60 --checkpoint-every 5
+    # terputus? jalankan lagi perintah yang sama -> lanjut dari checkpoint terakhir
+
+Hasil ditulis secara atomik ke model.h5 dan scalers.pkl (format sama dengan
+artefak lama), sehingga dashboard dan model server memuat model baru otomatis.
+Dengan --register NAMA, pasangan yang sama juga diarsipkan ke registry versi
+(models/NAMA/) untuk dibandingkan di halaman forecasting.
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_cache import content_key
+from forecasting import MODEL_PATH, SCALER_PATH, PAIR_KEY, DEFAULT_LOOK_BACK, file_digest
+from registry import REGISTRY_DIR
+from windowing import build_windows
+
+base_path = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(base_path, "data_bersih.csv")
+CHECKPOINT_DIR = os.path.join(base_path, "checkpoints", "lstm")
+CHUNK_SIZE = 4096  # window per potongan streaming (scaler & tf.data)
+
+
+def configure_cpu_threads(intra_op=None, inter_op=None):
+    """Atur thread TensorFlow (harus sebelum model dibuat). None = otomatis"""
+    import tensorflow as tf
+    if intra_op:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op)
+    if inter_op:
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op)
+
+
+# -------------------------------------------------------------------------
+# DATASET
+# -------------------------------------------------------------------------
+def load_panel(path=DATA_PATH):
+    df = pd.read_csv(path)
+    df["log_Energy"] = np.log10(df["Energy_Consumption_kWh"] + 1)
+    return df
+
+
+def training_windows(df, look_back):
+    """WindowSet log_Energy semua negara tanpa window yang melintasi celah tahun (view; dibaca per potongan)"""
+    return build_windows(df, "log_Energy", look_back, require_consecutive=True)
+
+
+def fit_scalers(ws, chunk_size=CHUNK_SIZE):
+    """scaler_X (satu kolom per posisi window) dan scaler_y, di-fit per potongan dengan partial_fit"""
+    from sklearn.preprocessing import MinMaxScaler
+
+    scaler_X, scaler_y = MinMaxScaler(), MinMaxScaler()
+    for X, y in ws.chunks(chunk_size):
+        scaler_X.partial_fit(X[..., 0])
+        scaler_y.partial_fit(y[:, 0, :])
+    return {"scaler_X": scaler_X, "scaler_y": scaler_y}
+
+
+def make_dataset(ws, scalers, batch_size, chunk_size=CHUNK_SIZE, shuffle_buffer=10000, seed=42):
+    """Pipeline tf.data streaming: potongan window diskalakan di generator, lalu unbatch -> shuffle -> batch"""
+    import tensorflow as tf
+
+    look_back = ws.look_back
+
+    def generate():
+        for X, y in ws.chunks(chunk_size):
+            X_s = scalers["scaler_X"].transform(X[..., 0]).astype(np.float32)
+            y_s = scalers["scaler_y"].transform(y[:, 0, :]).astype(np.float32)
+            yield X_s.reshape(len(X_s), look_back, 1), y_s
+
+    ds = tf.data.Dataset.from_generator(generate, output_signature=(
+        tf.TensorSpec((None, look_back, 1), tf.float32), tf.TensorSpec((None, 1), tf.float32)))
+    return ds.unbatch().shuffle(shuffle_buffer, seed=seed).batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+
+# -------------------------------------------------------------------------
+# MODEL
+# -------------------------------------------------------------------------
+def build_model(look_back):
+    """Arsitektur sama dengan model.h5 bawaan"""
+    from tensorflow.keras import Sequential
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+
+    model = Sequential([
+        Input(shape=(look_back, 1)),
+        LSTM(64, return_sequences=True),
+        Dropout(0.2),
+        LSTM(32),
+        Dropout(0.2),
+        Dense(16, activation="relu"),
+        Dense(1),
+    ])
+    model.compile(optimizer="adam", loss="mse")
+    return model
+
+
+def _temp_path(path):
+    # File sementara di folder yang sama agar os.replace atomik
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    return tmp
+
+
+def atomic_write(path, write_fn):
+    # Tulis ke file sementara di folder yang sama lalu rename, agar pembaca
+    # (dashboard / model server) tidak pernah melihat file setengah jadi
+    tmp = _temp_path(path)
+    try:
+        write_fn(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def save_artifacts(model, scalers, model_path=MODEL_PATH, scaler_path=SCALER_PATH):
+    """
+    Tulis kedua file ke path sementara dulu, lalu rename berurutan. scalers.pkl
+    membawa digest model.h5 pasangannya (PAIR_KEY), sehingga pembaca yang
+    kebetulan melihat model baru + scaler lama di antara dua rename menolak
+    pasangan itu dan mencoba lagi (forecasting.load_pair).
+    """
+    tmp_model, tmp_scalers = _temp_path(model_path), _temp_path(scaler_path)
+    try:
+        model.save(tmp_model)
+        with open(tmp_scalers, "wb") as f:
+            pickle.dump({**scalers, PAIR_KEY: file_digest(tmp_model)}, f)
+        os.replace(tmp_model, model_path)
+        os.replace(tmp_scalers, scaler_path)
+    finally:
+        for tmp in (tmp_model, tmp_scalers):
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+def register_version(model, scalers, info, name, root=REGISTRY_DIR):
+    """Arsipkan model + scaler + info training sebagai models/<name>/ (nama yang sudah ada ditimpa)"""
+    folder = os.path.join(root, name)
+    os.makedirs(folder, exist_ok=True)
+
+    def dump_meta(p):
+        with open(p, "w") as f:
+            json.dump({**info, "registered_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+
+    atomic_write(os.path.join(folder, "meta.json"), dump_meta)
+    save_artifacts(model, scalers, os.path.join(folder, "model.h5"), os.path.join(folder, "scalers.pkl"))
+    return folder
+
+
+def checkpoint_run_dir(checkpoint_dir, data_path, look_back, batch_size):
+    """
+    Folder checkpoint untuk run ini: run-<fingerprint isi data + look_back + batch_size>.
+    Run yang terputus hanya dilanjutkan oleh run dengan data & konfigurasi yang sama;
+    checkpoint run lain (run-* lainnya) dibuang agar tidak pernah dilanjutkan diam-diam.
+    """
+    config = json.dumps([content_key(data_path), look_back, batch_size], default=str)
+    run_dir = os.path.join(checkpoint_dir, "run-" + hashlib.blake2b(config.encode(), digest_size=6).hexdigest())
+    if os.path.isdir(checkpoint_dir):
+        for name in os.listdir(checkpoint_dir):
+            path = os.path.join(checkpoint_dir, name)
+            if name.startswith("run-") and path != run_dir:
+                shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(run_dir, exist_ok=True)
+    return run_dir
+
+
+def train(data_path=DATA_PATH, look_back=DEFAULT_LOOK_BACK, epochs=60, batch_size=128,
+          checkpoint_dir=CHECKPOINT_DIR, checkpoint_every=5, verbose=1, on_epoch=None):
+    """
+    Training dengan checkpoint berkala. Mengembalikan (model, scalers, info).
+    on_epoch(epoch, logs) dipanggil di akhir setiap epoch (progres job background);
+    exception dari on_epoch menghentikan training, checkpoint terakhir tetap ada.
+    """
+    import tensorflow as tf
+
+    ws = training_windows(load_panel(data_path), look_back)
+    scalers = fit_scalers(ws)
+    ds = make_dataset(ws, scalers, batch_size)
+    n_windows = len(ws)
+    steps_per_epoch = int(np.ceil(n_windows / batch_size))
+
+    model = build_model(look_back)
+    # BackupAndRestore: jika proses mati, run berikutnya (data & konfigurasi sama) melanjutkan dari epoch terakhir
+    backup = tf.keras.callbacks.BackupAndRestore(
+        backup_dir=checkpoint_run_dir(checkpoint_dir, data_path, look_back, batch_size),
+        save_freq=checkpoint_every * steps_per_epoch
+    )
+
+    callbacks = [backup]
+    if on_epoch is not None:
+        callbacks.append(tf.keras.callbacks.LambdaCallback(on_epoch_end=on_epoch))
+
+    t0 = time.perf_counter()
+    history = model.fit(ds.repeat(), epochs=epochs, steps_per_epoch=steps_per_epoch,
+                        callbacks=callbacks, verbose=verbose)
+    info = {
+        "look_back": look_back,
+        "n_windows": n_windows,
+        "n_countries": int(len(np.unique(ws.country))),
+        # Backtest registry hanya out-of-sample untuk tahun target setelah ini
+        "train_end_year": int(ws.year.max()) if n_windows else None,
+        "epochs_run": len(history.history.get("loss", [])),
+        "train_seconds": round(time.perf_counter() - t0, 2),
+        "final_loss": float(history.history["loss"][-1]) if history.history.get("loss") else None,
+    }
+    return model, scalers, info
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Training ulang LSTM univariat dari data_bersih.csv")
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--look-back", type=int, default=DEFAULT_LOOK_BACK)
+    parser.add_argument("--epochs", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR)
+    parser.add_argument("--checkpoint-every", type=int, default=5, help="Checkpoint setiap N epoch")
+    parser.add_argument("--intra-op", type=int, default=os.cpu_count(), help="Thread intra-op TensorFlow")
+    parser.add_argument("--inter-op", type=int, default=2, help="Thread inter-op TensorFlow")
+    parser.add_argument("--output-model", default=MODEL_PATH)
+    parser.add_argument("--output-scalers", default=SCALER_PATH)
+    parser.add_argument("--register", metavar="NAMA", help="Arsipkan juga ke registry versi (models/NAMA/)")
+    args = parser.parse_args()
+
+    configure_cpu_threads(args.intra_op, args.inter_op)
+    model, scalers, info = train(args.data, args.look_back, args.epochs, args.batch_size,
+                                 args.checkpoint_dir, args.checkpoint_every)
+    save_artifacts(model, scalers, args.output_model, args.output_scalers)
+
+    print(f"Model disimpan ke {args.output_model} dan {args.output_scalers}")
+    if args.register:
+        print(f"Versi '{args.register}' diarsipkan ke {register_version(model, scalers, info, args.register)}")
+    for k, v in info.items():
+        print(f"  {k}: {v}")
@@ -0,0 +1,91 @@
+"""
+Analitik transisi cluster DEC lintas tahun, dihitung sekali untuk seluruh panel.
+
+Panel (negara, tahun) diurutkan satu kali, lalu setiap pasangan observasi
+berurutan per negara menjadi satu transisi (shift vektor, tanpa loop per
+tahun). Matriks transisi per tahun disimpan sebagai array (tahun, k, k) beserta
+prefix sum-nya, sehingga matriks untuk rentang tahun mana pun cukup satu
+pengurangan array.
+
+    tr = ClusterTransitions(df_dec, tiers)
+    tr.matrix_between(2000, 2010), tr.flow_between(2000, 2020), tr.events_of("Indonesia")
+"""
+import numpy as np
+import pandas as pd
+
+UPGRADE, DOWNGRADE, STAY = "Naik", "Turun", "Tetap"
+
+
+class ClusterTransitions:
+    """
+    events     transisi per negara: Year_From, Year_To, From, To (indeks tier), Change, Event
+    trajectory tier per negara x tahun (NaN jika tidak ada data)
+    summary    jumlah naik/turun, tier awal & akhir per negara
+    """
+
+    def __init__(self, df, tiers, cluster_col="Cluster"):
+        self.tier_names = list(tiers.names)
+        self.colors = tiers.colors
+        k = len(self.tier_names)
+
+        panel = pd.DataFrame({
+            "Country_ID": df["Country_ID"].to_numpy(),
+            "Country Name": df["Country Name"].to_numpy(),
+            "Year": df["Year"].to_numpy(dtype=int),
+            "Tier": tiers.tier_of(df[cluster_col].to_numpy()),
+        })
+        panel = (panel[panel["Tier"] >= 0]
+                 .sort_values(["Country_ID", "Year"], kind="stable")
+                 .drop_duplicates(["Country_ID", "Year"], keep="last"))
+
+        cid, years = panel["Country_ID"].to_numpy(), panel["Year"].to_numpy()
+        tier, names = panel["Tier"].to_numpy(), panel["Country Name"].to_numpy()
+        same = cid[1:] == cid[:-1]
+        events = pd.DataFrame({
+            "Country_ID": cid[1:][same],
+            "Country Name": names[1:][same],
+            "Year_From": years[:-1][same],
+            "Year_To": years[1:][same],
+            "From": tier[:-1][same],
+            "To": tier[1:][same],
+        })
+        events["Change"] = events["To"] - events["From"]
+        events["Event"] = np.select([events["Change"] > 0, events["Change"] < 0], [UPGRADE, DOWNGRADE], STAY)
+        self.events = events
+
+        # Matriks transisi per tahun asal + prefix sum untuk rentang tahun O(1)
+        self.years = np.arange(years.min(), years.max() + 1) if len(years) else np.arange(0)
+        n_years = len(self.years)
+        flat = ((events["Year_From"].to_numpy() - (self.years[0] if n_years else 0)) * k
+                + events["From"].to_numpy()) * k + events["To"].to_numpy()
+        self.matrices = np.bincount(flat, minlength=n_years * k * k).reshape(n_years, k, k)
+        self._cumulative = np.concatenate([np.zeros((1, k, k), dtype=int), self.matrices.cumsum(axis=0)])
+
+        self.trajectory = panel.pivot(index="Country Name", columns="Year", values="Tier")
+
+        moves = events.assign(**{UPGRADE: events["Change"] > 0, DOWNGRADE: events["Change"] < 0})
+        summary = moves.groupby("Country Name")[[UPGRADE, DOWNGRADE]].sum()
+        ends = panel.groupby("Country Name")["Tier"].agg(["first", "last"])
+        summary["Tier Awal"] = np.asarray(self.tier_names, dtype=object)[ends["first"].reindex(summary.index)]
+        summary["Tier Akhir"] = np.asarray(self.tier_names, dtype=object)[ends["last"].reindex(summary.index)]
+        self.summary = summary.sort_values([UPGRADE, DOWNGRADE], ascending=False)
+
+        self._events_by_country = {c: g.reset_index(drop=True) for c, g in events.groupby("Country Name")}
+
+    def _year_index(self, year):
+        return int(np.clip(year - self.years[0], 0, len(self.years))) if len(self.years) else 0
+
+    def matrix_between(self, year_from, year_to):
+        """Jumlah transisi (k, k) dengan tahun asal di [year_from, year_to)"""
+        return self._cumulative[self._year_index(year_to)] - self._cumulative[self._year_index(year_from)]
+
+    def flow_between(self, year_a, year_b):
+        """Perpindahan tier (k, k) negara yang punya data di kedua tahun: baris = tier di year_a"""
+        k = len(self.tier_names)
+        if year_a not in self.trajectory.columns or year_b not in self.trajectory.columns:
+            return np.zeros((k, k), dtype=int)
+        pair = self.trajectory[[year_a, year_b]].dropna().to_numpy(dtype=int)
+        return np.bincount(pair[:, 0] * k + pair[:, 1], minlength=k * k).reshape(k, k)
+
+    def events_of(self, country):
+        return self._events_by_country.get(country, self.events.iloc[:0])
@@ -0,0 +1,26 @@
+"""
+Halaman dashboard. Setiap halaman adalah modul dengan fungsi `render(ctx)`
+dan baru di-import saat pertama kali dibuka, sehingga dependensi berat
+(plotly, scikit-learn, TensorFlow) tidak dimuat saat startup.
+"""
+import importlib
+
+# Label menu -> nama modul di paket views
+PAGES = {
+    "📊 Executive Dashboard": "dashboard",
+    "📈 Detail: Forecasting": "forecast",
+    "🧪 Skenario What-If": "scenario",
+    "🧩 Detail: Clustering": "clustering",
+    "🔀 Transisi Cluster": "transitions",
+    "🌐 Agregasi Regional": "regional",
+    "🤖 Deep Forest Classification": "deep_forest",
+    "🌲 Validasi & Simulator Klasifikasi": "classifier_lab",
+    "🔗 Detail: Kausalitas": "causality",
+    "🩺 Kualitas Data": "data_quality",
+    "🏠 Tentang Sistem": "home",
+}
+
+
+def render_page(label, ctx):
+    module = importlib.import_module(f"{__name__}.{PAGES[label]}")
+    module.render(ctx)
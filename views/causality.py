@@ -0,0 +1,80 @@
+"""
+Halaman detail kausalitas (Granger): kartu hasil per negara + peta global.
+"""
+import streamlit as st
+
+from shared import get_data
+from views.charts import category_choropleth, plot
+
+HYPOTHESIS_COLORS = {
+    'Neutrality': 'lightgrey',
+    'Growth Hypothesis': 'green',
+    'Conservation Hypothesis': 'orange',
+    'Feedback Hypothesis': 'purple'
+}
+
+
+def render(ctx):
+    selected_country = ctx.country
+    st.header("🔗 Analisis Kausalitas Energi & Ekonomi")
+    st.subheader("Metode: Granger Causality Test")
+    st.markdown("Menentukan arah hubungan: **Apakah Energi mendorong Ekonomi, atau sebaliknya?**")
+
+    # Penjelasan Metodologi
+    st.info("""
+    ℹ️ **Catatan:** Hasil Granger menggunakan seluruh data historis (Time Series) jangka panjang.
+    Filter 'Tahun' di sidebar tidak mempengaruhi hasil analisis ini.
+    """)
+
+    df_granger = get_data()['granger']
+
+    if df_granger is None:
+        st.error("⚠️ File 'granger_result_final.csv' tidak ditemukan.")
+        st.warning("Harap jalankan script analisis Granger terlebih dahulu.")
+        return
+
+    # Filter Negara (Menggunakan Global State 'selected_country')
+    country_data_df = df_granger[df_granger['Country_ID'] == ctx.country_id]
+
+    # Layout 1:2 (Kiri: Info, Kanan: Peta)
+    col_kiri, col_kanan = st.columns([1, 2])
+
+    with col_kiri:
+        st.markdown(f"### 🔍 Hasil: {selected_country}")
+        st.divider()
+
+        if not country_data_df.empty:
+            country_data = country_data_df.iloc[0]
+            hasil = country_data['Hypothesis']
+
+            # Tampilan Kartu Hasil
+            if hasil == 'Neutrality':
+                st.info(f"🟦 **{hasil}**")
+                st.caption("Tidak ada hubungan sebab-akibat langsung dalam jangka pendek.")
+            elif hasil == 'Growth Hypothesis':
+                st.success(f"🟩 **{hasil}**")
+                st.caption("Energi mendorong Pertumbuhan Ekonomi.")
+            elif hasil == 'Conservation Hypothesis':
+                st.warning(f"🟨 **{hasil}**")
+                st.caption("Pertumbuhan Ekonomi mendorong Konsumsi Energi.")
+            else:
+                st.error(f"🟪 **{hasil}**")
+                st.caption("Saling mempengaruhi (Feedback).")
+
+            st.markdown("---")
+            st.write("**Statistik (P-Value):**")
+            st.write(f"Energi → GDP: `{country_data['P_Val_Energy_to_GDP']:.4f}`")
+            st.write(f"GDP → Energi: `{country_data['P_Val_GDP_to_Energy']:.4f}`")
+        else:
+            st.warning(f"""
+            ⚠️ **Data Tidak Ditemukan:** Tidak ada hasil uji Granger untuk negara **{selected_country}**.
+            Mungkin data historis terlalu pendek.
+            """)
+
+    with col_kanan:
+        st.markdown("### 🗺️ Peta Persebaran Global")
+        p_cols = ['P_Val_Energy_to_GDP', 'P_Val_GDP_to_Energy']
+        plot("granger_map", lambda: category_choropleth(
+            df_granger, "ISO3", "Hypothesis", HYPOTHESIS_COLORS, hover_cols=p_cols, decimals=4, height=500,
+            hover_name="Country"
+        ), df_granger[["ISO3", "Hypothesis"] + p_cols])
@@ -0,0 +1,331 @@
+"""
+Scatter yang tetap ringan untuk populasi besar (mis. data sub-nasional).
+
+Jalur render dipilih otomatis dari jumlah titik:
+  n <= SVG_MAX_POINTS     : go.Scatter biasa (SVG)
+  n <= DETAIL_MAX_POINTS  : go.Scattergl (WebGL)
+  lebih besar             : agregasi hexbin di server, satu marker per heksagon
+                            terisi (warna = kategori dominan, ukuran = jumlah titik)
+
+Pada mode agregasi, memilih area dengan box select memicu rerun yang memuat
+ulang area tersebut secara detail (titik asli, atau hexbin yang lebih halus
+jika masih terlalu banyak).
+
+Semua grafik dikirim lewat `plot()`: figure dipangkas (float dibulatkan,
+customdata yang tidak dipakai hover dibuang kecuali grafik memakai on_select,
+karena titik terpilih dikembalikan beserta customdata-nya; template diganti "none" karena
+tema Streamlit diterapkan di browser), dibangun ulang hanya jika hash
+inputnya berubah, dan ukuran payload JSON-nya bisa ditampilkan per grafik.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.basedatatypes import BaseTraceType
+
+SVG_MAX_POINTS = 2000
+DETAIL_MAX_POINTS = 20000
+HEX_GRIDSIZE = 40
+
+FIGURE_DECIMALS = 4
+FIGURE_CACHE_MAX = 64
+
+# Lapisan dasar peta yang sama untuk semua choropleth (topojson dunia yang sama, di-cache browser)
+GEO_BASE = dict(showframe=False, showcoastlines=False, projection_type="natural earth", resolution=110)
+
+_figures = OrderedDict()
+_figures_lock = threading.Lock()
+payload_sizes = {}
+
+
+# -------------------------------------------------------------------------
+# PAYLOAD FIGURE
+# -------------------------------------------------------------------------
+def trim_figure(fig, decimals=FIGURE_DECIMALS, keep_customdata=False):
+    """
+    Bulatkan array float, buang customdata yang tidak dirujuk hover, pakai template kosong.
+    keep_customdata=True untuk grafik dengan seleksi (on_select): event seleksi membawa customdata titik.
+    """
+    for trace in fig.data:
+        for attr in ("x", "y", "z", "lat", "lon", "customdata"):
+            value = getattr(trace, attr, None)
+            if value is None:
+                continue
+            arr = np.asarray(value)
+            if arr.dtype.kind == "f":
+                setattr(trace, attr, np.round(arr, decimals))
+        if keep_customdata:
+            continue
+        if getattr(trace, "customdata", None) is not None and "customdata" not in (getattr(trace, "hovertemplate", None) or ""):
+            trace.customdata = None
+    fig.update_layout(template="none")
+    return fig
+
+
+def input_hash(*inputs):
+    """Hash isi input figure (DataFrame, array, trace, atau nilai biasa)"""
+    h = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            # Index ikut di-hash: frame bernilai sama dengan label negara / tahun berbeda
+            # tidak boleh berbagi figure (cache dipakai bersama antar sesi)
+            h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            h.update(repr(list(value.columns) if isinstance(value, pd.DataFrame) else value.name).encode())
+            h.update(repr(list(value.index.names)).encode())
+        elif isinstance(value, np.ndarray):
+            h.update(np.ascontiguousarray(value).tobytes())
+            h.update(f"{value.dtype}{value.shape}".encode())
+        elif isinstance(value, BaseTraceType):
+            h.update(repr(value.to_plotly_json()).encode())
+        elif isinstance(value, (list, tuple)) and any(isinstance(v, BaseTraceType) for v in value):
+            h.update(input_hash(*value).encode())
+        else:
+            h.update(repr(value).encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+def cached_figure(name, build, *inputs, keep_customdata=False):
+    """
+    (figure, ukuran payload, dipakai ulang?) — build() hanya dipanggil jika
+    hash input belum pernah dilihat. Figure dipakai bersama antar sesi, jadi
+    jangan dimodifikasi setelah dikembalikan.
+    """
+    key = (name, input_hash(*inputs), keep_customdata)
+    with _figures_lock:
+        if key in _figures:
+            _figures.move_to_end(key)
+            fig, nbytes = _figures[key]
+            return fig, nbytes, True
+
+    fig = trim_figure(build(), keep_customdata=keep_customdata)
+    nbytes = len(fig.to_json().encode("utf-8"))
+    with _figures_lock:
+        _figures[key] = (fig, nbytes)
+        while len(_figures) > FIGURE_CACHE_MAX:
+            _figures.popitem(last=False)
+    return fig, nbytes, False
+
+
+def plot(name, build, *inputs, **chart_kwargs):
+    """st.plotly_chart untuk figure yang dipangkas & di-cache per hash input"""
+    selectable = chart_kwargs.get("on_select", "ignore") != "ignore"
+    fig, nbytes, reused = cached_figure(name, build, *inputs, keep_customdata=selectable)
+    payload_sizes[name] = nbytes
+    chart_kwargs.setdefault("use_container_width", True)
+    result = st.plotly_chart(fig, **chart_kwargs)
+    if st.session_state.get("show_payload"):
+        st.caption(f"📦 `{name}`: {nbytes / 1024:,.1f} KB" + (" (figure dipakai ulang)" if reused else ""))
+    return result
+
+
+def category_choropleth(df, locations, color, color_map, hover_cols=(), title=None, show_scale=True,
+                        locationmode="ISO-3", decimals=2, height=None, hover_name="Country Name"):
+    """
+    Choropleth kategori sebagai SATU trace (kode integer + colorscale bertingkat),
+    bukan satu trace per kategori dengan seluruh kolom hover seperti px.choropleth.
+    Lokasi default = kolom ISO3 dari dimensi negara; baris tanpa kode (agregat
+    seperti "World") tidak digambar.
+    """
+    values = df[color].astype(object)
+    present = set(values.dropna())
+    categories = [c for c in color_map if c in present] + sorted(present - set(color_map), key=str)
+    codes = pd.Categorical(values, categories=categories).codes
+    locs = df[locations].to_numpy(dtype=object)
+    keep = (codes >= 0) & pd.notna(locs) & (locs != "")
+    k = max(len(categories), 1)
+
+    colorscale = []
+    for i, cat in enumerate(categories):
+        colorscale += [[i / k, color_map.get(cat, "#CCCCCC")], [(i + 1) / k, color_map.get(cat, "#CCCCCC")]]
+
+    hover_cols = list(hover_cols)
+    names = df[hover_name].to_numpy()[keep] if hover_name in df.columns else None
+    hover = ("<b>%{hovertext}</b>" if names is not None else "<b>%{location}</b>") + "<br>%{text}" + "".join(
+        f"<br>{col}: %{{customdata[{i}]:,.{decimals}f}}" for i, col in enumerate(hover_cols)
+    ) + "<extra></extra>"
+
+    fig = go.Figure(go.Choropleth(
+        locations=locs[keep], locationmode=locationmode, hovertext=names,
+        z=codes[keep], zmin=-0.5, zmax=k - 0.5, colorscale=colorscale or [[0, "#CCCCCC"], [1, "#CCCCCC"]],
+        text=values.to_numpy()[keep],
+        customdata=np.round(df[hover_cols].to_numpy(dtype=float)[keep], decimals) if hover_cols else None,
+        hovertemplate=hover, marker_line_width=0.3, showscale=show_scale,
+        colorbar=dict(title=color, tickvals=list(range(len(categories))), ticktext=categories),
+    ))
+    fig.update_layout(title=title, geo=GEO_BASE, margin=dict(l=0, r=0, t=40 if title else 0, b=0))
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+def value_choropleth(df, locations, value, title=None, colorscale="RdBu_r", zmid=None, zrange=None,
+                     locationmode="ISO-3", decimals=2, height=None, hover_name="Country Name", colorbar_title=None):
+    """Choropleth nilai kontinu sebagai satu trace; baris tanpa nilai / kode lokasi tidak digambar"""
+    locs = df[locations].to_numpy(dtype=object)
+    z = df[value].to_numpy(dtype=float)
+    keep = ~np.isnan(z) & pd.notna(locs) & (locs != "")
+    names = df[hover_name].to_numpy()[keep] if hover_name in df.columns else None
+    label = colorbar_title or value
+
+    fig = go.Figure(go.Choropleth(
+        locations=locs[keep], locationmode=locationmode, hovertext=names,
+        z=np.round(z[keep], decimals), zmid=zmid, colorscale=colorscale,
+        zmin=zrange[0] if zrange else None, zmax=zrange[1] if zrange else None,
+        hovertemplate=("<b>%{hovertext}</b>" if names is not None else "<b>%{location}</b>")
+                      + f"<br>{label}: %{{z:,.{decimals}f}}<extra></extra>",
+        marker_line_width=0.3, colorbar=dict(title=label),
+    ))
+    fig.update_layout(title=title, geo=GEO_BASE, margin=dict(l=0, r=0, t=40 if title else 0, b=0))
+    if height:
+        fig.update_layout(height=height)
+    return fig
+
+
+# -------------------------------------------------------------------------
+# SCATTER
+# -------------------------------------------------------------------------
+def hexbin(x, y, codes, n_codes, gridsize=HEX_GRIDSIZE, extent=None):
+    """
+    Binning heksagonal vektoris (dua kisi persegi yang digeser setengah sel).
+    Mengembalikan (cx, cy, jumlah, kode dominan) per heksagon terisi.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xmin, xmax, ymin, ymax = extent or (x.min(), x.max(), y.min(), y.max())
+    nx = gridsize
+    ny = max(1, int(round(gridsize / np.sqrt(3))))
+    sx = (xmax - xmin) / nx or 1.0
+    sy = (ymax - ymin) / ny or 1.0
+
+    gx, gy = (x - xmin) / sx, (y - ymin) / sy
+    i1, j1 = np.round(gx), np.round(gy)
+    i2, j2 = np.floor(gx), np.floor(gy)
+    on_second = (gx - i2 - 0.5) ** 2 + 3 * (gy - j2 - 0.5) ** 2 < (gx - i1) ** 2 + 3 * (gy - j1) ** 2
+
+    keys = np.column_stack([on_second, np.where(on_second, i2, i1), np.where(on_second, j2, j1)]).astype(int)
+    cells, inverse = np.unique(keys, axis=0, return_inverse=True)
+    counts = np.zeros((len(cells), n_codes), dtype=int)
+    np.add.at(counts, (inverse.ravel(), codes), 1)
+
+    cx = xmin + (cells[:, 1] + 0.5 * cells[:, 0]) * sx
+    cy = ymin + (cells[:, 2] + 0.5 * cells[:, 0]) * sy
+    return cx, cy, counts.sum(axis=1), counts.argmax(axis=1)
+
+
+def point_traces(df, x, y, color, color_map, hover_name=None, extent=None):
+    """
+    Trace titik per kategori warna, jalur render sesuai jumlah titik.
+    extent=(xmin, xmax, ymin, ymax) membatasi ke area zoom. Mengembalikan (traces, mode).
+    """
+    if extent is not None:
+        xmin, xmax, ymin, ymax = extent
+        df = df[df[x].between(xmin, xmax) & df[y].between(ymin, ymax)]
+    df = df.dropna(subset=[x, y])
+
+    values = df[color].astype(object)
+    categories = list(color_map) + sorted(set(values.dropna()) - set(color_map), key=str)
+    codes = pd.Categorical(values, categories=categories).codes
+    xs, ys = df[x].to_numpy(dtype=float), df[y].to_numpy(dtype=float)
+
+    if len(df) > DETAIL_MAX_POINTS:
+        valid = codes >= 0
+        if not valid.any():
+            return [], "hexbin"
+        cx, cy, count, dominant = hexbin(xs[valid], ys[valid], codes[valid], len(categories), extent=extent)
+        size = 6 + 14 * np.log1p(count) / np.log1p(count.max())
+        traces = []
+        for k, cat in enumerate(categories):
+            m = dominant == k
+            if m.any():
+                traces.append(go.Scattergl(
+                    x=cx[m], y=cy[m], mode="markers", name=str(cat),
+                    marker=dict(symbol="hexagon", size=size[m], color=color_map.get(cat), line=dict(width=0)),
+                    customdata=count[m], hovertemplate=f"%{{customdata:,}} titik<extra>{cat}</extra>"
+                ))
+        return traces, "hexbin"
+
+    trace_cls = go.Scatter if len(df) <= SVG_MAX_POINTS else go.Scattergl
+    text = df[hover_name].to_numpy() if hover_name else None
+    hover = ("%{text}<br>" if hover_name else "") + f"{x}=%{{x:.2f}}<br>{y}=%{{y:.2f}}"
+    traces = []
+    for k, cat in enumerate(categories):
+        m = codes == k
+        if m.any():
+            traces.append(trace_cls(
+                x=xs[m], y=ys[m], mode="markers", name=str(cat), marker=dict(color=color_map.get(cat)),
+                text=None if text is None else text[m], hovertemplate=f"{hover}<extra>{cat}</extra>"
+            ))
+    return traces, "svg" if trace_cls is go.Scatter else "webgl"
+
+
+def _selected_box(event):
+    try:
+        boxes = event["selection"]["box"]
+    except (KeyError, TypeError):
+        return None
+    if not boxes:
+        return None
+    xs, ys = sorted(boxes[-1]["x"]), sorted(boxes[-1]["y"])
+    return (float(xs[0]), float(xs[1]), float(ys[0]), float(ys[1]))
+
+
+def render_scatter(df, x, y, color, color_map, key, hover_name="Country Name", title=None, labels=None,
+                   base_traces=(), extra_traces=(), layout=None):
+    """
+    Scatter dengan pemilihan jalur render otomatis. base_traces digambar di
+    bawah titik (mis. kontur), extra_traces di atasnya (mis. sorotan negara).
+    """
+    zoom_key, version_key = f"{key}_zoom", f"{key}_zoom_v"
+    extent = st.session_state.get(zoom_key)
+    if extent is None:
+        n_points = len(df)
+    else:
+        n_points = int((df[x].between(*extent[:2]) & df[y].between(*extent[2:])).sum())
+    aggregated = n_points > DETAIL_MAX_POINTS
+    selectable = aggregated or extent is not None
+
+    def build():
+        traces, _ = point_traces(df, x, y, color, color_map, hover_name, extent)
+        fig = go.Figure(list(base_traces) + traces + list(extra_traces))
+        fig.update_layout(title=title, xaxis_title=(labels or {}).get(x, x), yaxis_title=(labels or {}).get(y, y),
+                          legend_title_text=(labels or {}).get(color, color))
+        if layout:
+            fig.update_layout(**layout)
+        if extent is not None:
+            fig.update_xaxes(range=extent[:2])
+            fig.update_yaxes(range=extent[2:])
+        if selectable:
+            fig.update_layout(dragmode="select")
+        return fig
+
+    inputs = (df[[c for c in dict.fromkeys([x, y, color, hover_name]) if c in df.columns]],
+              tuple(color_map.items()), extent, title, labels, layout and repr(layout),
+              list(base_traces), list(extra_traces))
+
+    if not selectable:
+        plot(key, build, *inputs)
+        return
+
+    # Mode agregasi / zoom: box select -> rerun dengan detail area terpilih.
+    # Key widget diberi versi agar seleksi lama tidak terbawa setelah zoom / reset.
+    version = st.session_state.get(version_key, 0)
+    event = plot(key, build, *inputs, key=f"{key}_{version}", on_select="rerun", selection_mode="box")
+    box = _selected_box(event)
+    if box is not None:
+        st.session_state[zoom_key] = box
+        st.session_state[version_key] = version + 1
+        st.rerun()
+
+    if aggregated and extent is None:
+        st.caption(f"🔷 Agregasi hexbin ({n_points:,} titik). Pilih area (box select) untuk memuat detail.")
+    elif aggregated:
+        st.caption("🔷 Area masih padat: hexbin lebih halus. Pilih area lebih kecil untuk titik asli.")
+    if extent is not None and st.button("↩️ Reset zoom", key=f"{key}_reset"):
+        st.session_state.pop(zoom_key, None)
+        st.session_state[version_key] = version + 1
+        st.rerun()
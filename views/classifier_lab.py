@@ -0,0 +1,182 @@
+"""
+Halaman validasi classifier (Deep Forest / Random Forest) terhadap label DEC:
+peta klasifikasi, decision boundary, confusion matrix, dan simulator
+(satu titik atau batch skenario).
+"""
+import io
+import time
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from classifier import read_scenarios, scenario_features, scenario_results, to_features
+from shared import get_data, classify_points
+from views.charts import category_choropleth, plot, render_scatter
+
+
+def render(ctx):
+    st.markdown('<div class="main-header"><h2>🌲 Deep Forest Validation Core</h2><p>Validasi Klasifikasi menggunakan Label dari Clustering (DEC)</p></div>', unsafe_allow_html=True)
+
+    data = get_data()
+    df_df, tiers = data['dec'], data['dec_tiers']
+
+    if df_df is None or df_df.empty:
+        st.error("Data 'clustered_data_dec.csv' tidak ditemukan. Jalankan clustering terlebih dahulu.")
+        st.stop()
+
+    # Persiapan Data untuk Model
+    X = df_df[['log_GDP_per_Capita', 'log_Energy']].values
+    y = df_df['Cluster'].values
+
+    # Model dilatih sekali per proses (atau dipegang model server bersama)
+    from sklearn.metrics import accuracy_score, confusion_matrix
+
+    y_pred = classify_points(X)["labels"]
+    acc = accuracy_score(y, y_pred)
+
+    tab_geo, tab_bound, tab_perf, tab_sim = st.tabs(["🗺️ Peta Klasifikasi", "🧠 Decision Boundary", "🎯 Validasi Matriks", "🤖 Simulator"])
+
+    # --- TAB 1: PETA GEOSPASIAL ---
+    with tab_geo:
+        st.markdown("### 🌍 Peta Hasil Klasifikasi")
+
+        max_year = df_df['Year'].max()
+        df_map = df_df[df_df['Year'] == max_year].copy()
+
+        # Prediksi ulang untuk peta
+        X_map = df_map[['log_GDP_per_Capita', 'log_Energy']].values
+        df_map['Predicted_Label'] = classify_points(X_map)["labels"]
+        df_map['Label_Text'] = tiers.labels(df_map['Predicted_Label'])
+
+        hover_cols = ["GDP_per_Capita", "Energy_Consumption_kWh"]
+        plot("classifier_map", lambda: category_choropleth(
+            df_map, "ISO3", "Label_Text", tiers.colors, hover_cols=hover_cols,
+            title=f"Peta Klasifikasi Global (Tahun {max_year})", height=500
+        ), df_map[["ISO3", "Country Name", "Label_Text"] + hover_cols], tuple(tiers.colors.items()), max_year)
+
+    # --- TAB 2: BATAS KEPUTUSAN ---
+    with tab_bound:
+        st.markdown("### 🧠 Decision Boundary Landscape")
+        st.write("Visualisasi bagaimana model memisahkan Cluster (tier rendah → tinggi).")
+
+        # Meshgrid
+        x_min, x_max = df_df['log_GDP_per_Capita'].min() - 0.5, df_df['log_GDP_per_Capita'].max() + 0.5
+        y_min, y_max = df_df['log_Energy'].min() - 0.5, df_df['log_Energy'].max() + 0.5
+        xx, yy = np.meshgrid(np.arange(x_min, x_max, 0.1),
+                             np.arange(y_min, y_max, 0.1))
+
+        # Prediksi area (diwarnai per tier agar berlaku untuk k cluster berapa pun)
+        mesh_input = np.c_[xx.ravel(), yy.ravel()]
+        Z = tiers.tier_of(classify_points(mesh_input)["labels"]).reshape(xx.shape)
+        colors = list(tiers.colors.values())
+        colorscale = [[i / max(len(colors) - 1, 1), c] for i, c in enumerate(colors)]
+
+        contour = go.Contour(
+            z=Z, x=np.arange(x_min, x_max, 0.1), y=np.arange(y_min, y_max, 0.1),
+            colorscale=colorscale, zmin=0, zmax=len(colors) - 1,
+            opacity=0.3, showscale=False
+        )
+        # Semua baris (negara x tahun): WebGL / hexbin otomatis sesuai jumlah titik
+        render_scatter(
+            df_df, "log_GDP_per_Capita", "log_Energy", "Cluster Label", tiers.colors, key="boundary_scatter",
+            title="Decision Boundary", base_traces=[contour],
+            labels={"log_GDP_per_Capita": "Log GDP per Capita", "log_Energy": "Log Energy Consumption"}
+        )
+
+    # --- TAB 3: VALIDASI PERFORMA ---
+    with tab_perf:
+        st.markdown("### 🎯 Performa Model")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            cm = confusion_matrix(y, y_pred, labels=tiers.ids)
+            plot("confusion_matrix", lambda: px.imshow(
+                cm,
+                x=[f"Pred: {n}" for n in tiers.names],
+                y=[f"Act: {n}" for n in tiers.names],
+                color_continuous_scale='Blues',
+                text_auto=True,
+                title="Confusion Matrix"
+            ), cm, tuple(tiers.names))
+
+        with col2:
+            st.metric("Akurasi Model", f"{acc*100:.2f}%")
+            st.info("Akurasi dihitung dengan membandingkan prediksi model terhadap Label Cluster DEC.")
+
+    # --- TAB 4: SIMULATOR ---
+    with tab_sim:
+        render_simulator(tiers)
+
+
+def render_simulator(tiers):
+    st.markdown("### 🤖 Simulator Prediksi")
+
+    with st.form("sim"):
+        c1, c2 = st.columns(2)
+        gdp_input = c1.number_input("GDP per Capita (USD)", 100, 100000, 5000)
+        ene_input = c2.number_input("Energy Consumption (kWh)", 100, 50000, 2000)
+
+        if st.form_submit_button("Prediksi Kategori"):
+            features = to_features([gdp_input], [ene_input])
+            log_gdp, log_ene = features[0]
+
+            pred_result = classify_points(features)["labels"][0]
+
+            label_res = tiers.label_of(pred_result)
+            bg_color = tiers.colors.get(label_res, "#999999")
+
+            st.markdown(f"""
+            <div style='background-color: {bg_color}; padding: 20px; border-radius: 10px; text-align: center; color: white;'>
+                <h2>{label_res}</h2>
+                <p>Log GDP: {log_gdp:.2f} | Log Energy: {log_ene:.2f}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # --- MODE SKENARIO: banyak titik GDP/Energi sekaligus ---
+    st.markdown("---")
+    st.markdown("### 📋 Mode Skenario (Batch)")
+    st.caption("Unggah CSV atau tempel tabel dengan kolom `GDP_per_Capita` dan `Energy_Consumption_kWh`. "
+               "Semua skenario diprediksi dalam satu panggilan model.")
+
+    up_file = st.file_uploader("Upload CSV Skenario", type=["csv", "txt"])
+    pasted = st.text_area(
+        "...atau tempel tabel di sini",
+        placeholder="GDP_per_Capita,Energy_Consumption_kWh\n5000,2000\n45000,9000",
+        height=150
+    )
+
+    # Hasil disimpan di session_state: tombol unduh memicu rerun, dan hasil harus tetap tampil
+    if st.button("Prediksi Semua Skenario"):
+        st.session_state.pop("scenario_batch", None)
+        source = up_file if up_file is not None else (io.StringIO(pasted) if pasted.strip() else None)
+        if source is None:
+            st.warning("⚠️ Belum ada tabel skenario.")
+            return
+        try:
+            df_scn = read_scenarios(source)
+        except Exception as e:
+            st.error(f"❌ Tabel skenario tidak valid → {e}")
+            return
+
+        t0 = time.perf_counter()
+        res = classify_points(scenario_features(df_scn), proba=True)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        st.session_state["scenario_batch"] = (scenario_results(df_scn, res, tiers), elapsed_ms)
+
+    if "scenario_batch" not in st.session_state:
+        return
+    df_out, elapsed_ms = st.session_state["scenario_batch"]
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Jumlah Skenario", f"{len(df_out):,}")
+    m2.metric("Waktu Prediksi", f"{elapsed_ms:,.1f} ms")
+    m3.metric("Per Skenario", f"{elapsed_ms * 1000 / len(df_out):,.1f} µs")
+
+    st.dataframe(df_out, use_container_width=True)
+    st.download_button(
+        "⬇️ Unduh Hasil Skenario (CSV)",
+        df_out.to_csv(index=False).encode("utf-8"),
+        file_name="hasil_skenario.csv",
+        mime="text/csv"
+    )
@@ -0,0 +1,114 @@
+"""
+Halaman detail clustering (DEC): peta sebaran cluster, detail negara, posisi,
+dan negara paling serupa.
+"""
+import time
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from shared import get_data, get_similarity_index
+from views.charts import category_choropleth, plot, render_scatter
+
+
+def render(ctx):
+    selected_country, selected_year = ctx.country, ctx.year
+    st.header(f"🧩 Peta Segmentasi Global ({selected_year})")
+    st.markdown("Analisis pengelompokan negara berdasarkan **GDP per Kapita** dan **Konsumsi Energi**.")
+
+    data = get_data()
+    df_dec, tiers = data['dec'], data['dec_tiers']
+    df_year = df_dec[df_dec['Year'] == selected_year]
+    hl = df_year[df_year['Country_ID'] == ctx.country_id]
+
+    if hl.empty:
+        st.warning(f"⚠️ **Data Kosong:** Negara **{selected_country}** tidak memiliki data clustering pada tahun **{selected_year}**.")
+    else:
+        st.success(f"✅ Menampilkan posisi **{selected_country}** pada tahun **{selected_year}**.")
+
+    hover_cols = ["GDP_per_Capita", "Energy_Consumption_kWh"]
+    plot("cluster_map", lambda: category_choropleth(
+        df_year, "ISO3", "Cluster Label", tiers.colors, hover_cols=hover_cols,
+        title="Peta Distribusi Cluster", height=450
+    ), df_year[["ISO3", "Country Name", "Cluster Label"] + hover_cols], tuple(tiers.colors.items()))
+
+    col_kiri, col_kanan = st.columns([1, 2])
+
+    with col_kiri:
+        st.subheader(f"📊 Detail: {selected_country}")
+
+        if not hl.empty:
+            row = hl.iloc[0]
+            label = row['Cluster Label']
+
+            if label == tiers.names[-1]:
+                st.success(f"**Status:** {label}")
+                desc = "Negara ini memiliki tingkat ekonomi dan konsumsi energi yang **Tinggi**."
+            else:
+                st.warning(f"**Status:** {label}")
+                desc = "Negara ini memiliki tingkat ekonomi dan konsumsi energi yang **Rendah/Berkembang**."
+
+            st.markdown(desc)
+
+            m1, m2 = st.columns(2)
+            m1.metric("GDP/Kapita", f"${row['GDP_per_Capita']:,.0f}")
+            m2.metric("Energi/Kapita", f"{row['Energy_Consumption_kWh']:,.0f} kWh")
+
+            st.caption(f"Log-Scale: GDP={row['log_GDP_per_Capita']:.2f}, Energi={row['log_Energy']:.2f}")
+        else:
+            st.error(f"Data untuk {selected_country} pada tahun {selected_year} tidak tersedia.")
+
+    with col_kanan:
+        st.subheader("🔍 Analisis Posisi")
+        star = [] if hl.empty else [go.Scatter(
+            x=hl['log_GDP_per_Capita'], y=hl['log_Energy'], mode='markers',
+            marker=dict(size=25, color='yellow', symbol='star', line=dict(width=2, color='black')),
+            text=[selected_country], textposition="top center", name=selected_country
+        )]
+        render_scatter(
+            df_year, "log_GDP_per_Capita", "log_Energy", "Cluster Label", tiers.colors, key="cluster_scatter",
+            labels={"log_GDP_per_Capita": "Log GDP per Capita", "log_Energy": "Log Energy Consumption"},
+            extra_traces=star
+        )
+
+    render_similar(ctx, df_dec)
+
+
+def render_similar(ctx, df_dec):
+    st.subheader(f"👥 Negara Paling Mirip dengan {ctx.country} ({ctx.year})")
+    st.caption("Tetangga terdekat di ruang log GDP per kapita, log energi, dan pertumbuhan YoY keduanya "
+               "(distandardisasi per tahun).")
+
+    index = get_similarity_index()
+    k = st.slider("Jumlah negara serupa:", 3, 10, 5)
+
+    t0 = time.perf_counter()
+    similar = index.similar(ctx.country_id, ctx.year, k) if index is not None else None
+    elapsed_us = (time.perf_counter() - t0) * 1e6
+
+    if similar is None or similar.empty:
+        st.info(f"ℹ️ {ctx.country} tidak memiliki data lengkap pada tahun {ctx.year}.")
+        return
+
+    col_tab, col_plot = st.columns([1, 2])
+    with col_tab:
+        st.dataframe(similar[["Country Name", "Distance"]].round(3), hide_index=True, use_container_width=True)
+        st.caption(f"⚡ Pencarian KDTree: {elapsed_us:,.0f} µs")
+
+    with col_plot:
+        ids = [ctx.country_id] + similar["Country_ID"].tolist()
+        paths = df_dec[df_dec["Country_ID"].isin(ids)].sort_values(["Country_ID", "Year"])
+
+        def build_paths():
+            fig = px.line(paths, x="log_GDP_per_Capita", y="log_Energy", color="Country Name",
+                          hover_data=["Year"], markers=True,
+                          labels={"log_GDP_per_Capita": "Log GDP per Capita", "log_Energy": "Log Energy Consumption"},
+                          title="Lintasan Historis")
+            fig.update_traces(marker_size=4, line_width=1.5, opacity=0.6)
+            fig.update_traces(selector=dict(name=ctx.country), line_width=4, opacity=1, marker_size=6)
+            fig.update_layout(height=420, margin=dict(l=0, r=0, t=40, b=0))
+            return fig
+
+        plot("similar_paths", build_paths, paths[["Country Name", "Year", "log_GDP_per_Capita", "log_Energy"]],
+             ctx.country)
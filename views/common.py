@@ -0,0 +1,146 @@
+"""
+Komponen UI yang dipakai lebih dari satu halaman.
+"""
+import numpy as np
+import streamlit as st
+
+from data_cache import CACHE_TTL_SECONDS
+from exports import EXPORT_FORMATS, available_formats, export_bytes
+from forecasting import to_kwh
+from jobs import get_manager, DONE, FAILED, CANCELLED
+from quality import year_gaps
+from shared import get_data, country_forecast, country_id_of
+
+
+def build_forecast_figure(df_c, preds, country, n_years):
+    """Grafik historis + prediksi; preds boleh parsial (horizon yang sudah selesai)"""
+    import plotly.graph_objects as go
+
+    last_year = int(df_c["Year"].max())
+    future_years = list(range(last_year + 1, last_year + 1 + len(preds)))
+    y_pred_real = list(to_kwh(np.asarray(preds)))
+
+    df_hist = df_c.tail(15)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df_hist['Year'], y=df_hist['Energy_Consumption_kWh'], name='Data Historis', line=dict(color='#1f77b4', width=3)))
+
+    x_connect = [df_hist['Year'].iloc[-1]] + future_years
+    y_connect = [df_hist['Energy_Consumption_kWh'].iloc[-1]] + y_pred_real
+
+    fig.add_trace(go.Scatter(x=x_connect, y=y_connect, name='Prediksi AI', line=dict(color='#ff7f0e', width=3, dash='dot')))
+
+    # Sumbu X dikunci ke horizon penuh agar grafik tidak "melompat" selama streaming
+    fig.update_xaxes(range=[int(df_hist['Year'].iloc[0]) - 0.5, last_year + n_years + 0.5])
+    fig.update_layout(title=f"Forecast Energi: {country} (+{n_years} Thn)", xaxis_title="Tahun", yaxis_title="kWh", height=350, margin=dict(l=0,r=0,t=40,b=0))
+    return fig
+
+def plot_forecast(df_c, preds, country, n_years):
+    """Grafik forecast lewat jalur figure terpangkas & ter-cache (plotly baru di-import di sini)"""
+    from views.charts import plot
+
+    preds = tuple(float(p) for p in preds)
+    plot("forecast", lambda: build_forecast_figure(df_c, preds, country, n_years),
+         df_c[["Year", "Energy_Consumption_kWh"]].tail(15), preds, country, n_years)
+
+def render_lstm_forecast(country, n_years=10):
+    df_lstm = get_data()['lstm']
+    if df_lstm is None: return st.error("Data LSTM tidak ada.")
+
+    try:
+        df_c = df_lstm[df_lstm["Country_ID"] == country_id_of(country)].sort_values("Year")
+        preds = country_forecast(country, n_years)
+
+        if preds is None:
+            st.warning("Data historis kurang (atau bercelah tahun) untuk prediksi.")
+            return
+
+        plot_forecast(df_c, preds, country, n_years)
+
+        gaps = year_gaps(df_c)
+        if not gaps.empty:
+            g = gaps.iloc[-1]
+            st.caption(f"⚠️ Deret historis memiliki {len(gaps)} celah tahun (terakhir {g['Year_From']}→{g['Year_To']}); "
+                       "window prediksi memakai tahun yang tersedia apa adanya.")
+
+    except Exception as e:
+        st.error(f"Gagal memuat model forecasting: {e}")
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=16, show_spinner="Menyiapkan file ekspor...")
+def export_file(name, fmt, key, _build):
+    """Bytes file ekspor; dibangun sekali per (nama, format, kunci isi data)"""
+    return export_bytes(_build(), fmt)
+
+def render_bulk_export(name, label, build, key):
+    """
+    Tombol ekspor bulk: tabel dari build() (satu komputasi batch) ditulis
+    sekali ke Parquet/CSV lalu dialirkan ke tombol unduh. key = kunci isi
+    data/model sehingga file ikut dibangun ulang saat sumbernya berubah.
+    """
+    c_fmt, c_btn = st.columns([1, 2])
+    fmt = c_fmt.radio("Format", available_formats(), horizontal=True, key=f"{name}_export_fmt")
+    ext, mime = EXPORT_FORMATS[fmt]
+
+    ready_key = f"{name}_export_ready"
+    if c_btn.button(f"📦 Siapkan {label}", key=f"{name}_export_prepare"):
+        st.session_state[ready_key] = key
+    if st.session_state.get(ready_key) != key:
+        return
+
+    try:
+        data = export_file(name, fmt, key, build)
+    except Exception as e:
+        st.error(f"❌ Gagal menyiapkan ekspor → {e}")
+        return
+    st.download_button(f"⬇️ Unduh {label} ({fmt}, {len(data) / 1024:,.0f} KB)", data,
+                       file_name=f"{name}.{ext}", mime=mime, key=f"{name}_export_download")
+
+def ensure_job(state_key, job_key, fn, **params):
+    """
+    Job background untuk sesi ini. Jika parameter berubah (mis. negara diganti
+    di tengah jalan), job lama dibatalkan dan job baru dikirim.
+    """
+    manager = get_manager()
+    current = st.session_state.get(state_key)
+    if current is not None:
+        old_key, old_id = current
+        job = manager.get(old_id)
+        if old_key == job_key and job is not None and job.status != CANCELLED:
+            return job
+        manager.cancel(old_id)
+    job = manager.submit(state_key, fn, **params)
+    st.session_state[state_key] = (job_key, job.id)
+    return job
+
+def cancel_job(state_key):
+    current = st.session_state.pop(state_key, None)
+    if current is not None:
+        get_manager().cancel(current[1])
+
+JOB_POLL_SECONDS = 0.5
+
+def poll_job(job, render_fn):
+    """
+    render_fn(job) dijalankan di fragment yang di-rerun sendiri tiap
+    JOB_POLL_SECONDS selama job aktif, jadi bagian halaman lain tidak ikut
+    dieksekusi ulang. Saat job selesai, satu rerun penuh menghentikan polling.
+    """
+    was_active = job.active
+
+    @st.fragment(run_every=JOB_POLL_SECONDS if was_active else None)
+    def view():
+        render_fn(job)
+        if was_active and not job.active:
+            st.rerun()
+
+    view()
+
+def render_job_status(job, label):
+    partial, progress = job.snapshot()
+    if job.active:
+        st.progress(progress, text=f"⏳ {label}: {len(partial)} langkah selesai (job `{job.id}`)")
+    elif job.status == FAILED:
+        st.error(f"❌ Job `{job.id}` gagal → {job.error}")
+    elif job.status == DONE:
+        st.caption(f"✅ Job `{job.id}` selesai dalam {job.finished - job.created:.2f} detik")
+    return partial
@@ -0,0 +1,104 @@
+"""
+Halaman Executive Dashboard: metrik kunci, forecast singkat, peta & posisi.
+"""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from growth import GDP_GROWTH, ENERGY_GROWTH, ELASTICITY
+from shared import get_data, get_country_metrics
+from views.charts import category_choropleth, value_choropleth, plot, render_scatter
+from views.common import render_lstm_forecast
+
+
+def yoy(value):
+    return None if pd.isna(value) else f"{value:+.1f}% YoY"
+
+
+def render(ctx):
+    data = get_data()
+    tiers = data['dec_tiers']
+    selected_country, selected_year = ctx.country, ctx.year
+
+    st.title(f"📊 Dashboard Analisis: {selected_country}")
+
+    # --- BARIS 1: KEY METRICS ---
+    metrics = get_country_metrics(selected_country, year=selected_year)
+
+    if metrics is not None:
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("GDP per Kapita", f"${metrics['GDP_per_Capita']:,.0f}", delta=yoy(metrics[GDP_GROWTH]), delta_color="normal")
+        c2.metric("Konsumsi Energi", f"{metrics['Energy_Consumption_kWh']:,.0f} kWh", delta=yoy(metrics[ENERGY_GROWTH]), delta_color="normal")
+
+        status_label = metrics['Cluster Label']
+        status_color = tiers.colors.get(status_label, "#FF6B6B")
+        c3.markdown(f"**Status Ekonomi-Energi**\n\n<span style='color:{status_color}; font-weight:bold; font-size:1.2em'>{status_label}</span>", unsafe_allow_html=True)
+
+        g_res = "Data Tidak Tersedia"
+        if data['granger'] is not None:
+            dg = data['granger']
+            row_g = dg[dg['Country_ID'] == ctx.country_id]
+            if not row_g.empty:
+                g_res = row_g.iloc[0]['Hypothesis']
+        c4.markdown(f"**Hubungan Kausalitas**\n\n{g_res}")
+    else:
+        st.warning(f"⚠️ **Data Tidak Tersedia**: Data {selected_country} untuk tahun {selected_year} kosong. Metrik tidak dapat ditampilkan.")
+        st.caption("💡 Tips: Coba geser 'Slider Tahun' di sidebar ke tahun-tahun sebelumnya.")
+
+    st.markdown("---")
+
+    # --- BARIS 2: FORECASTING & GEOSPATIAL ---
+    col_left, col_right = st.columns([1.5, 1])
+
+    with col_left:
+        df_lstm = data['lstm']
+        df_c = df_lstm[df_lstm["Country_ID"] == ctx.country_id]
+        if df_c.empty:
+            st.warning(f"⚠️ Data historis untuk Forecasting {selected_country} tidak ditemukan.")
+        else:
+            render_lstm_forecast(selected_country, n_years=10)
+
+    with col_right:
+        st.subheader("📍 Posisi & Peta Global")
+
+        tab_map, tab_scatter, tab_elastic = st.tabs(["🗺️ Peta Dunia", "🔍 Scatter Plot", "📐 Elastisitas"])
+
+        df_dec = data['dec']
+        if df_dec is not None:
+            df_curr = df_dec[df_dec['Year'] == selected_year]
+            hl = df_curr[df_curr['Country_ID'] == ctx.country_id]
+            is_missing = hl.empty
+
+            with tab_map:
+                if is_missing:
+                    st.warning(f"⚠️ Peta tahun {selected_year} tidak mencakup data {selected_country}.")
+                plot("dash_map", lambda: category_choropleth(
+                    df_curr, "ISO3", "Cluster Label", tiers.colors,
+                    title=f"Peta Sebaran ({selected_year})", show_scale=False, height=350
+                ), df_curr[["ISO3", "Country Name", "Cluster Label"]], tuple(tiers.colors.items()), selected_year)
+
+            with tab_scatter:
+                if is_missing:
+                    st.warning(f"⚠️ Posisi statistik {selected_country} thn {selected_year} tidak diketahui.")
+                star = [] if is_missing else [go.Scatter(
+                    x=hl['log_GDP_per_Capita'], y=hl['log_Energy'], mode='markers',
+                    marker=dict(size=25, color='yellow', symbol='star', line=dict(width=2, color='black')),
+                    name=selected_country, showlegend=False
+                )]
+                render_scatter(
+                    df_curr, "log_GDP_per_Capita", "log_Energy", "Cluster Label", tiers.colors, key="dash_scatter",
+                    title=f"Posisi Statistik ({selected_year})", extra_traces=star,
+                    layout=dict(height=350, margin=dict(l=0,r=0,t=30,b=0), showlegend=False)
+                )
+
+            with tab_elastic:
+                # Elastisitas = pertumbuhan energi / pertumbuhan GDP per kapita (kolom hasil loader)
+                plot("dash_elasticity", lambda: value_choropleth(
+                    df_curr, "ISO3", ELASTICITY, title=f"Elastisitas Energi-GDP ({selected_year})",
+                    zmid=0, zrange=(-3, 3), colorbar_title="Elastisitas", height=350
+                ), df_curr[["ISO3", "Country Name", ELASTICITY]], selected_year)
+                if not is_missing and pd.notna(hl[ELASTICITY].iloc[0]):
+                    st.caption(f"{selected_country}: elastisitas **{hl[ELASTICITY].iloc[0]:.2f}** "
+                               "(> 1: energi tumbuh lebih cepat dari ekonomi, < 0: arah berlawanan).")
+                else:
+                    st.caption("Elastisitas kosong jika tahun sebelumnya tidak ada atau pertumbuhan GDP mendekati 0.")
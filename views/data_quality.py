@@ -0,0 +1,48 @@
+"""
+Halaman admin kualitas data: laporan validasi CSV mentah (skema, tipe,
+kunci ganda, celah tahun, nilai <= 0, nama negara) yang di-cache per isi file.
+"""
+import streamlit as st
+
+from quality import ERROR, WARNING, year_gaps
+from shared import get_data, get_quality_report
+
+LEVEL_ICONS = {"ok": "✅", "warning": "⚠️", "error": "❌"}
+
+
+def render(ctx):
+    st.header("🩺 Kualitas Data")
+    st.markdown("Validasi vektor terhadap semua CSV mentah, dihitung ulang hanya jika isi file berubah.")
+
+    quality = get_quality_report()
+    report = quality.report
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Error", int((report["Level"] == ERROR).sum()))
+    m2.metric("Peringatan", int((report["Level"] == WARNING).sum()))
+    m3.metric("Baris Diperiksa", f"{sum(quality.rows.values()):,}")
+    m4.metric("Waktu Validasi", f"{quality.validate_ms:,.1f} ms")
+
+    load_errors = get_data()['errors']
+    for name, message in load_errors.items():
+        st.error(f"❌ Dataset `{name}` gagal dimuat → {message}")
+
+    only_issues = st.checkbox("Tampilkan hanya cek yang bermasalah", value=True)
+    df_view = report[report["Level"] != "ok"] if only_issues else report
+    if df_view.empty:
+        st.success("✅ Semua cek lolos.")
+    else:
+        st.dataframe(
+            df_view.assign(Level=df_view["Level"].map(lambda lv: f"{LEVEL_ICONS[lv]} {lv}")),
+            hide_index=True, use_container_width=True
+        )
+
+    # Celah tahun negara fokus: window LSTM melompati tahun yang hilang
+    df_lstm = get_data()['lstm']
+    if df_lstm is not None:
+        st.subheader(f"📅 Celah Tahun: {ctx.country}")
+        gaps = year_gaps(df_lstm[df_lstm["Country_ID"] == ctx.country_id])
+        if gaps.empty:
+            st.caption("Deret tahunan lengkap (tanpa celah).")
+        else:
+            st.dataframe(gaps, hide_index=True, use_container_width=True)
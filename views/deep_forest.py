@@ -0,0 +1,109 @@
+"""
+Halaman hasil klasifikasi Deep Forest (CSV hasil model yang dilatih di luar aplikasi).
+"""
+import plotly.graph_objects as go
+import streamlit as st
+
+from shared import get_deepforest
+from views.charts import render_scatter
+from views.common import render_bulk_export
+
+
+def render(ctx):
+    st.header("🤖 Deep Forest Classification")
+    st.markdown("""
+    Halaman ini menampilkan **hasil klasifikasi Deep Forest**
+    berdasarkan **output model yang telah dilatih sebelumnya** (`CSV`).
+    """)
+
+    # Dataset berlabel & potongan per tahun dibangun sekali per isi file (cache)
+    try:
+        df_slices = get_deepforest()
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        st.stop()
+
+    if df_slices is None:
+        st.error("❌ File `klasifikasi_deepforest.csv` tidak ditemukan.")
+        st.stop()
+
+    # ==============================
+    # FILTER
+    # ==============================
+    st.subheader("🎛️ Filter Data")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        countries = df_slices.countries
+        country = st.selectbox(
+            "Pilih Negara",
+            countries,
+            index=countries.index(ctx.country) if ctx.country in countries else 0
+        )
+
+    with col2:
+        years = df_slices.years_by_country[country]
+        year = st.selectbox(
+            "Pilih Tahun",
+            years,
+            index=years.index(ctx.year) if ctx.year in years else len(years) - 1
+        )
+
+    df_year = df_slices.by_year[year]
+    row = df_year[df_year["Country_ID"] == df_slices.ids[country]]
+
+    if row.empty:
+        st.warning("⚠️ Data tidak tersedia.")
+        st.stop()
+
+    r = row.iloc[0]
+
+    # ==============================
+    # OUTPUT
+    # ==============================
+    st.success("✅ Hasil Klasifikasi Deep Forest")
+
+    c1, c2, c3 = st.columns(3)
+
+    c1.metric("GDP per Kapita", f"${r['GDP_per_Capita']:,.0f}")
+    c2.metric("Konsumsi Energi", f"{r['Energy_Consumption_kWh']:,.0f} kWh")
+    c3.metric("Cluster", int(r["DeepForest_Predicted_Cluster"]))
+
+    label = r["Cluster Label"]
+    badge = "🟩" if label == df_slices.tiers.names[-1] else "🟥"
+
+    st.markdown(f"## {badge} **{label}**")
+
+    # ==============================
+    # POSISI PADA SCATTER
+    # ==============================
+    st.subheader("📊 Posisi Global (Deep Forest)")
+
+    star = go.Scatter(
+        x=[r["GDP_per_Capita"]],
+        y=[r["Energy_Consumption_kWh"]],
+        mode="markers",
+        marker=dict(size=20, symbol="star", color="yellow", line=dict(width=2, color="black")),
+        name=country
+    )
+
+    render_scatter(
+        df_year, "GDP_per_Capita", "Energy_Consumption_kWh", "Cluster Label", df_slices.tiers.colors,
+        key="deepforest_scatter", extra_traces=[star]
+    )
+
+    # ==============================
+    # EKSPOR SEMUA TAHUN
+    # ==============================
+    st.subheader("⬇️ Ekspor Klasifikasi")
+    st.caption(f"Semua negara x semua tahun ({len(df_slices.frame):,} baris) dalam satu file.")
+    render_bulk_export("klasifikasi_deepforest", "klasifikasi semua tahun",
+                       lambda: df_slices.frame, df_slices.fingerprint)
+
+    st.info("""
+    ℹ️ **Catatan Metodologi**
+    - Model Deep Forest dilatih di luar aplikasi
+    - Aplikasi ini menampilkan **hasil klasifikasi resmi**
+    - Pendekatan ini umum untuk sistem analitik & dashboard
+    """)
@@ -0,0 +1,256 @@
+"""
+Halaman detail forecasting: forecast per negara (dari cache, atau dialirkan
+dari job background), benchmark engine multivariat / backend LSTM
+terkuantisasi, forecast semua negara, training ulang, dan perbandingan versi model.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from forecasting import LSTM_BACKEND, active_model_path, engine_signature, to_kwh
+from ingest import country_revision
+from jobs import DONE, get_manager, forecast_job, training_job
+from multivariate import MV_MODEL_PATH, MV_SCALER_PATH, engine_available
+from quantize import load_report
+from registry import BACKTEST_HORIZONS, IN_SAMPLE, list_versions
+from shared import (ENGINE_UNI, ENGINE_MV, get_data, get_manifest, get_engine, load_mv_engine, energy_of, all_country_forecasts,
+                    forecast_inputs_key, compare_model_versions, peek_country_forecast, remember_country_forecast)
+from views.charts import plot
+from views.common import plot_forecast, ensure_job, cancel_job, poll_job, render_job_status, render_bulk_export
+
+# Warna garis per versi (dipakai bergiliran); fan = warna sama dengan transparansi
+VERSION_COLORS = ["#1f77b4", "#d62728", "#2ca02c", "#9467bd", "#ff7f0e", "#17becf"]
+
+
+def render_version_comparison(ctx, df_c, n_years):
+    """Fan chart forecast semua versi model terpilih + galat backtest per horizon"""
+    versions = [v["name"] for v in list_versions()]
+    if not versions:
+        st.info("Belum ada model tersimpan.")
+        return
+    chosen = st.multiselect("Versi model:", versions, default=versions[:4], key="forecast_versions")
+    if len(versions) == 1:
+        st.caption("Hanya ada versi `current`. Arsipkan versi baru dengan `python train_lstm.py --register NAMA`.")
+    if not chosen:
+        return
+
+    try:
+        df_fc, df_err = compare_model_versions(ctx.country, n_years, tuple(chosen))
+    except Exception as e:
+        st.error(f"Gagal menjalankan perbandingan versi: {e}")
+        return
+    if df_fc.empty:
+        st.warning("Data historis terlalu pendek untuk window model terpilih.")
+        return
+
+    hist = df_c[["Year", "Energy_Consumption_kWh"]]
+
+    def build_fan():
+        fig = go.Figure(go.Scatter(x=hist["Year"], y=hist["Energy_Consumption_kWh"], name="Historis",
+                                   mode="lines", line=dict(color="grey")))
+        for i, (name, g) in enumerate(df_fc.groupby("Version", sort=False)):
+            color = VERSION_COLORS[i % len(VERSION_COLORS)]
+            rgb = tuple(int(color[j:j + 2], 16) for j in (1, 3, 5))
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([g["Year"], g["Year"][::-1]]),
+                y=np.concatenate([g["Upper_kWh"], g["Lower_kWh"][::-1]]),
+                fill="toself", fillcolor=f"rgba{rgb + (0.15,)}", line=dict(width=0),
+                hoverinfo="skip", showlegend=False, legendgroup=name,
+            ))
+            fig.add_trace(go.Scatter(x=g["Year"], y=g["Predicted_Energy_kWh"], name=name, legendgroup=name,
+                                     mode="lines+markers", line=dict(color=color)))
+        fig.update_layout(height=420, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Tahun",
+                          yaxis_title="Konsumsi Energi (kWh)", hovermode="x unified")
+        return fig
+
+    plot("version_fan", build_fan, hist, df_fc)
+    st.caption(f"Fan = ±RMSE backtest (log) per horizon, dari window historis negara ini; "
+               f"galat dilaporkan pada horizon {', '.join(map(str, BACKTEST_HORIZONS))} tahun.")
+
+    if not df_err.empty:
+        table = df_err.pivot(index="Version", columns="Horizon", values="MAPE_%")
+        table.columns = [f"MAPE +{h} Thn (%)" for h in table.columns]
+        table["Window Backtest"] = df_err.groupby("Version")["Backtest_Windows"].first()
+        table["Sampel"] = df_err.groupby("Version")["Sample"].first()
+        st.dataframe(table.reindex(chosen).dropna(how="all").style.format("{:,.1f}", subset=table.columns[:-1]),
+                     use_container_width=True)
+        if (df_err["Sample"] == IN_SAMPLE).any():
+            st.caption("⚠️ Backtest **in-sample**: tahun-tahun ini ikut dipakai training, jadi galatnya optimistis. "
+                       "Versi yang dilatih dengan `train_end_year` lebih awal dinilai out-of-sample. "
+                       "MAPE melewati tahun dengan konsumsi aktual 0 kWh.")
+
+
+def render_training():
+    """
+    Training ulang model.h5 di background (satu job per proses, dipakai bersama
+    semua sesi). Tidak dibatalkan saat halaman ditinggalkan; checkpoint membuat
+    training yang dibatalkan bisa dilanjutkan dengan jumlah epoch yang sama.
+    """
+    manager = get_manager()
+    job = manager.active_job("train_job")
+
+    c_epochs, c_run, c_stop = st.columns([2, 1, 1])
+    epochs = c_epochs.number_input("Epoch", 1, 500, 60, key="train_epochs")
+    if c_run.button("▶️ Mulai Training", disabled=job is not None):
+        job = manager.submit("train_job", training_job, epochs=int(epochs))
+        st.session_state["train_job"] = job.id
+    if c_stop.button("⏹️ Batalkan Training", disabled=job is None):
+        job.cancel()
+
+    job = job or manager.get(st.session_state.get("train_job"))
+    if job is None:
+        st.caption("Model baru ditulis atomik ke model.h5 + scalers.pkl dan dimuat otomatis oleh dashboard & model server.")
+        return
+
+    def show_training(job):
+        partial = render_job_status(job, f"Training {job.params['epochs']} epoch")
+        if partial:
+            st.line_chart(pd.DataFrame(partial).set_index("epoch")["loss"], height=200)
+        if job.status == DONE:
+            st.json(job.result, expanded=False)
+
+    poll_job(job, show_training)
+
+
+def render(ctx):
+    selected_country, selected_year = ctx.country, ctx.year
+    st.header(f"📈 Analisis Forecasting Mendalam: {selected_country}")
+
+    df_lstm = get_data()['lstm']
+    df_c = df_lstm[df_lstm["Country_ID"] == ctx.country_id].sort_values("Year")
+
+    if df_c.empty:
+        st.error(f"❌ Data historis (LSTM) untuk negara **{selected_country}** sama sekali tidak ditemukan.")
+        st.stop()
+
+    last_year_data = int(df_c['Year'].max())
+    if last_year_data < selected_year:
+        st.warning(f"⚠️ Data historis terakhir **{selected_country}** adalah tahun **{last_year_data}**.")
+
+    col_n, col_engine = st.columns([1, 1])
+    with col_n:
+        n_input = st.slider("Jumlah Tahun Prediksi:", 1, 30, 10)
+    with col_engine:
+        engine_name = st.radio("Engine Forecasting:", [ENGINE_UNI, ENGINE_MV], horizontal=True)
+
+    if engine_name == ENGINE_MV and not engine_available():
+        st.warning("⚠️ Model multivariat belum dilatih. Jalankan `python multivariate.py` terlebih dahulu. "
+                   "Sementara memakai engine univariat.")
+        engine_name = ENGINE_UNI
+
+    # Forecast univariat yang sudah ada di cache dipakai langsung; selain itu
+    # dijalankan di background dan grafik diperbarui tiap horizon selesai
+    try:
+        cached = peek_country_forecast(selected_country, n_input) if engine_name == ENGINE_UNI else None
+        look_back, predict_next, windows_of = get_engine(engine_name)
+        _, _, windows = windows_of(df_c)
+        _, model_sig = forecast_inputs_key(engine_name)
+        if cached is not None:
+            cancel_job("forecast_job")
+            plot_forecast(df_c, cached, selected_country, n_input)
+        elif len(windows) == 0:
+            st.warning("Data historis kurang (atau bercelah tahun) untuk prediksi.")
+        else:
+            job = ensure_job(
+                "forecast_job",
+                (selected_country, n_input, engine_name, look_back, model_sig,
+                 country_revision(get_manifest(), selected_country)),
+                forecast_job,
+                predict_next=predict_next, seqs=windows[:1], n_years=n_input
+            )
+
+            def show_forecast(job):
+                partial = render_job_status(job, "Prediksi berjalan")
+                plot_forecast(df_c, [energy_of(p)[0] for p in partial], selected_country, n_input)
+                if job.status == DONE and engine_name == ENGINE_UNI:
+                    remember_country_forecast(selected_country, n_input, job.result[0])
+
+            poll_job(job, show_forecast)
+    except Exception as e:
+        st.error(f"Gagal memuat model forecasting: {e}")
+
+    if engine_name == ENGINE_MV:
+        with st.expander("⏱️ Benchmark Engine Multivariat"):
+            meta = load_mv_engine(engine_signature(MV_MODEL_PATH, MV_SCALER_PATH))[2]
+            b1, b2, b3 = st.columns(3)
+            b1.metric("Waktu Training", f"{meta.get('train_seconds', float('nan')):,.1f} s")
+            latency = meta.get("latency", {})
+            b2.metric("Latensi 1 Negara", f"{latency.get('single_country_ms', float('nan')):,.1f} ms")
+            b3.metric(f"Latensi {latency.get('n_countries_batch', '-')} Negara", f"{latency.get('all_countries_ms', float('nan')):,.1f} ms")
+            st.json(meta, expanded=False)
+    else:
+        with st.expander(f"⚡ Backend LSTM: {LSTM_BACKEND}"):
+            st.caption(f"File model aktif: `{os.path.basename(active_model_path())}` "
+                       "(ganti lewat ENERGY_LSTM_BACKEND; buat model TFLite dengan `python quantize.py`).")
+            report = load_report()
+            if not report:
+                st.info("Belum ada laporan kuantisasi (model_quant.json).")
+            nan = float("nan")
+            for backend, r in report.items():
+                lat, mem, par = r.get("latency", {}), r.get("memory", {}), r.get("parity", {})
+                ms_q = lat.get("tflite", {}).get("all_countries_ms", nan)
+                ms_k = lat.get("keras", {}).get("all_countries_ms", nan)
+                mb_q, mb_k = mem.get("file_mb_tflite", nan), mem.get("file_mb_keras", nan)
+                mae_q, mae_k = par.get("backtest_mae_tflite", nan), par.get("backtest_mae_keras", nan)
+                q1, q2, q3 = st.columns(3)
+                q1.metric(f"{backend}: Latensi Semua Negara", f"{ms_q:,.1f} ms", f"{ms_q - ms_k:+,.1f} ms vs Keras",
+                          delta_color="inverse")
+                q2.metric("Ukuran File", f"{mb_q:,.2f} MB", f"{mb_q - mb_k:+,.2f} MB vs Keras", delta_color="inverse")
+                q3.metric("Backtest MAE (log)", f"{mae_q:.4f}", f"{mae_q - mae_k:+.4f} vs Keras", delta_color="inverse")
+            if report:
+                st.json(report, expanded=False)
+
+    # --- FORECAST SEMUA NEGARA (BACKGROUND JOB) ---
+    with st.expander("🌐 Forecast Semua Negara", expanded=st.session_state.get("forecast_all_job") is not None):
+        c_run, c_stop = st.columns(2)
+        run_all = c_run.button(f"🔮 Jalankan untuk semua negara (+{n_input} Thn)")
+        stop_all = c_stop.button("⏹️ Batalkan")
+
+        if stop_all:
+            cancel_job("forecast_all_job")
+
+        if run_all:
+            look_back, predict_next, windows_of = get_engine(engine_name)
+            countries, last_years, windows = windows_of(df_lstm)
+            st.session_state["forecast_all_meta"] = (countries, last_years)
+            ensure_job(
+                # Parameter sama -> job yang ada dipakai ulang; data / model berubah -> job baru
+                "forecast_all_job", ("all", n_input, engine_name) + forecast_inputs_key(engine_name), forecast_job,
+                predict_next=predict_next, seqs=windows, n_years=n_input
+            )
+
+        current = st.session_state.get("forecast_all_job")
+        job_all = get_manager().get(current[1]) if current else None
+        if job_all is not None:
+            def show_all(job):
+                partial = render_job_status(job, "Forecast semua negara")
+                if partial:
+                    countries, last_years = st.session_state["forecast_all_meta"]
+                    df_all = pd.DataFrame(to_kwh(np.column_stack([energy_of(p) for p in partial])), index=countries,
+                                          columns=[f"+{h + 1}" for h in range(len(partial))])
+                    df_all.insert(0, "Tahun Terakhir", last_years)
+                    st.dataframe(df_all, use_container_width=True)
+
+            poll_job(job_all, show_all)
+
+        # Ekspor: semua negara x horizon dari satu komputasi batch (tanpa streaming per horizon)
+        st.markdown("**⬇️ Ekspor Forecast Semua Negara**")
+        render_bulk_export(
+            f"forecast_semua_negara_{n_input}thn", f"forecast semua negara (+{n_input} Thn)",
+            lambda: all_country_forecasts(n_input, engine_name),
+            (n_input, engine_name) + forecast_inputs_key(engine_name)
+        )
+
+    # --- TRAINING ULANG (BACKGROUND JOB) ---
+    with st.expander("🏋️ Training Ulang Model LSTM"):
+        render_training()
+
+    # --- PERBANDINGAN VERSI MODEL ---
+    with st.expander("🧬 Perbandingan Versi Model"):
+        render_version_comparison(ctx, df_c, n_input)
+
+    st.subheader("📄 Data Historis")
+    st.dataframe(df_c[['Year', 'Energy_Consumption_kWh', 'log_Energy']].sort_values('Year', ascending=False), use_container_width=True)
@@ -0,0 +1,31 @@
+"""
+Halaman pengantar: ringkasan metode yang dipakai sistem.
+"""
+import streamlit as st
+
+from shared import get_data
+
+
+def render(ctx):
+    st.title("Analisis Big Data: Nexus Energi & Ekonomi")
+    st.markdown("""
+    Selamat datang di Dashboard Analisis Big Data. Sistem ini menggunakan 4 metode utama
+    untuk menganalisis hubungan antara **PDB (Ekonomi)**, **Konsumsi Energi**, dan **Populasi**:
+
+    1.  **LSTM (Long Short-Term Memory)**
+        * *Fungsi:* Memprediksi tren konsumsi energi global di masa depan berdasarkan data historis.
+    2.  **DEC (Deep Embedded Clustering)**
+        * *Fungsi:* Melakukan segmentasi negara menjadi klaster (misal: "Low-Low" dan "High-High").
+    3.  **Granger Causality Test**
+        * *Fungsi:* Menentukan **arah hubungan sebab-akibat**. Apakah Ekonomi mendorong Energi, atau Energi mendorong Ekonomi?
+    4.  **Deep Forest (gcForest)**
+        * *Fungsi:* Mengklasifikasikan kategori energi negara menggunakan pendekatan Deep Learning berbasis pohon keputusan.
+    """)
+
+    col1, col2, col3 = st.columns(3)
+
+    df_lstm = get_data()['lstm']
+    if df_lstm is not None:
+        col1.metric("Total Negara", f"{df_lstm['Country Name'].nunique()}", "Data World Bank")
+        col2.metric("Rentang Data", f"{int(df_lstm['Year'].min())} - {int(df_lstm['Year'].max())}", "Tahun")
+    col3.metric("Metode AI", "4 Model", "Integrated")
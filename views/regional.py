@@ -0,0 +1,79 @@
+"""
+Halaman agregasi regional: kubus region x kelompok pendapatan x tahun yang
+dihitung sekali per isi data; slider & pilihan hanya melakukan lookup.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from cube import COUNTRY_METRICS, MEASURES
+from shared import get_region_cube
+from views.charts import plot
+
+
+def render(ctx):
+    st.header("🌐 Agregasi Regional & Kelompok Pendapatan")
+    st.markdown("Tren energi & ekonomi per **region** (World Bank) dan **kelompok pendapatan**, "
+                "dari kubus agregasi yang dibangun sekali saat data dimuat.")
+
+    cube = get_region_cube()
+    if cube is None:
+        st.error("Data 'clustered_data_dec.csv' tidak ditemukan.")
+        st.stop()
+
+    col_m, col_y = st.columns([2, 1])
+    with col_m:
+        measure = st.selectbox("Metrik:", list(MEASURES), format_func=MEASURES.get)
+    with col_y:
+        year = st.select_slider("Tahun:", cube.years, value=ctx.year if ctx.year in cube.by_year else cube.years[-1])
+
+    # --- MATRIKS REGION x PENDAPATAN (satu lookup per tahun) ---
+    df_year = cube.by_year[year][measure].unstack("Income_Group")
+    df_year = df_year.reindex(index=cube.regions, columns=cube.incomes)
+
+    plot("regional_matrix", lambda: px.imshow(
+        df_year, text_auto=".3s", aspect="auto", color_continuous_scale="YlOrRd",
+        labels=dict(x="Kelompok Pendapatan", y="Region", color=""),
+        title=f"{MEASURES[measure]} — {year}"
+    ).update_layout(height=420, margin=dict(l=0, r=0, t=40, b=0)), df_year, measure, year)
+
+    # --- TREN SATU SEL KUBUS ---
+    st.subheader("📈 Tren")
+    c1, c2 = st.columns(2)
+    region = c1.selectbox("Region:", cube.regions)
+    income = c2.selectbox("Kelompok Pendapatan:", cube.incomes)
+
+    series = cube.by_group.get((region, income))
+    if series is None:
+        st.info("ℹ️ Tidak ada negara pada kombinasi region & kelompok pendapatan ini.")
+        return
+
+    base = next((m for m in COUNTRY_METRICS if measure.startswith(m + "_")), None)
+
+    def build_trend():
+        fig = go.Figure()
+        if base is not None:
+            # Pita p25–p75 antar negara untuk metrik per negara
+            fig.add_trace(go.Scatter(x=series.index, y=series[f"{base}_p75"], line=dict(width=0),
+                                     showlegend=False, hoverinfo="skip"))
+            fig.add_trace(go.Scatter(x=series.index, y=series[f"{base}_p25"], fill="tonexty", line=dict(width=0),
+                                     fillcolor="rgba(255,127,14,0.2)", name="p25–p75"))
+        fig.add_trace(go.Scatter(x=series.index, y=series[measure], name=MEASURES[measure],
+                                 line=dict(color="#ff7f0e", width=3)))
+        fig.add_vline(x=year, line_dash="dot", line_color="grey")
+        fig.update_layout(title=f"{region} · {income}", xaxis_title="Tahun", height=380,
+                          margin=dict(l=0, r=0, t=40, b=0), legend=dict(orientation="h"))
+        return fig
+
+    cols = [measure] + ([f"{base}_p25", f"{base}_p75"] if base else [])
+    plot("regional_trend", build_trend, series[cols], region, income, year)
+
+    row = series.loc[year] if year in series.index else None
+    if row is not None:
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Jumlah Negara", int(row["Countries"]))
+        m2.metric("Energi per Kapita", f"{row['Energy_per_Capita_kWh']:,.0f} kWh")
+        m3.metric("GDP per Kapita", f"${row['GDP_per_Capita_Weighted']:,.0f}")
+
+    with st.expander("📋 Tabel Kubus"):
+        st.dataframe(series.reset_index(), hide_index=True, use_container_width=True)
@@ -0,0 +1,73 @@
+"""
+Halaman skenario what-if: semua skenario x negara dihitung dalam satu batch.
+"""
+import plotly.express as px
+import streamlit as st
+
+from ingest import country_revision
+from scenarios import DEFAULT_SCENARIOS, normalize_scenarios
+from shared import compute_scenarios, get_manifest, model_signature
+from views.charts import plot
+
+
+def render(ctx):
+    st.header("🧪 Skenario What-If Konsumsi Energi")
+    st.markdown("Atur **pertumbuhan tambahan** dan **shock** terhadap jalur prediksi LSTM. "
+                "Semua skenario untuk semua negara terpilih dihitung dalam satu batch.")
+
+    col_a, col_b = st.columns([2, 1])
+    with col_a:
+        scn_countries = st.multiselect("Negara:", ctx.countries, default=[ctx.country])
+    with col_b:
+        scn_years = st.slider("Horizon (tahun):", 1, 30, 10)
+
+    st.caption("Horizon Shock = tahun ke-berapa shock terjadi (0 = tanpa shock).")
+    edited = st.data_editor(DEFAULT_SCENARIOS, num_rows="dynamic", use_container_width=True, key="scenario_editor")
+
+    try:
+        scenario_defs = normalize_scenarios(edited)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        st.stop()
+
+    if not scn_countries or not scenario_defs:
+        st.info("ℹ️ Pilih minimal satu negara dan satu skenario.")
+        st.stop()
+
+    try:
+        manifest = get_manifest()
+        scn_key = tuple(sorted(scn_countries))
+        df_scn = compute_scenarios(scenario_defs, scn_key, scn_years,
+                                   tuple(country_revision(manifest, c) for c in scn_key), model_signature())
+    except Exception as e:
+        st.error(f"Gagal menghitung skenario: {e}")
+        st.stop()
+
+    if df_scn.empty:
+        st.warning("⚠️ Data historis negara terpilih kurang untuk prediksi.")
+        st.stop()
+
+    def build_scenario_figure():
+        fig_scn = px.line(
+            df_scn, x="Year", y="Predicted_Energy_kWh", color="Country Name",
+            facet_col="Skenario", facet_col_wrap=min(len(scenario_defs), 4), markers=True,
+            labels={"Predicted_Energy_kWh": "kWh", "Year": "Tahun"}
+        )
+        fig_scn.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+        fig_scn.update_layout(height=350 * ((len(scenario_defs) - 1) // 4 + 1), margin=dict(l=0, r=0, t=40, b=0))
+        return fig_scn
+
+    plot("scenario_lines", build_scenario_figure, df_scn, len(scenario_defs))
+
+    # Ringkasan tahun terakhir: selisih terhadap skenario pertama
+    st.subheader(f"📋 Ringkasan Horizon +{scn_years}")
+    df_last = df_scn.groupby(["Country Name", "Skenario"], sort=False)["Predicted_Energy_kWh"].last().unstack("Skenario")
+    df_last = df_last[[s[0] for s in scenario_defs]]
+    base_name = scenario_defs[0][0]
+    df_delta = (df_last.div(df_last[base_name], axis=0) - 1) * 100
+    st.dataframe(df_last.round(0).join(df_delta.drop(columns=base_name).round(1).add_suffix(f" vs {base_name} (%)")), use_container_width=True)
+
+    st.download_button(
+        "⬇️ Unduh Semua Skenario (CSV)", df_scn.to_csv(index=False).encode("utf-8"),
+        file_name="skenario_forecast.csv", mime="text/csv"
+    )
@@ -0,0 +1,89 @@
+"""
+Halaman transisi cluster: aliran tier antar dua tahun (Sankey), matriks
+transisi tahun-ke-tahun, dan lintasan negara fokus. Semua dibaca dari hasil
+analitik transisi yang di-cache, tanpa memfilter data mentah per tahun.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from shared import get_transitions
+from transitions import UPGRADE, DOWNGRADE
+from views.charts import plot
+
+
+def render(ctx):
+    st.header("🔀 Transisi Cluster Antar Tahun")
+    st.markdown("Bagaimana negara berpindah **tier ekonomi-energi** (DEC) dari tahun ke tahun.")
+
+    tr = get_transitions()
+    if tr is None or len(tr.years) < 2:
+        st.error("Data 'clustered_data_dec.csv' tidak ditemukan atau hanya berisi satu tahun.")
+        st.stop()
+
+    years = [int(y) for y in tr.years]
+    year_a, year_b = st.select_slider("Rentang Tahun:", years, value=(years[0], years[-1]))
+    names, k = tr.tier_names, len(tr.tier_names)
+    colors = [tr.colors[n] for n in names]
+
+    # Matriks rentang dari prefix sum (O(1)); naik = di atas diagonal, turun = di bawah
+    matrix = tr.matrix_between(year_a, year_b)
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Transisi Tahunan", f"{int(matrix.sum()):,}")
+    m2.metric(f"⬆️ {UPGRADE}", f"{int(np.triu(matrix, 1).sum()):,}")
+    m3.metric(f"⬇️ {DOWNGRADE}", f"{int(np.tril(matrix, -1).sum()):,}")
+
+    col_sankey, col_heat = st.columns(2)
+
+    with col_sankey:
+        flow = tr.flow_between(year_a, year_b)
+        src, dst = np.nonzero(flow)
+
+        def build_sankey():
+            fig = go.Figure(go.Sankey(
+                node=dict(label=[f"{n} ({year_a})" for n in names] + [f"{n} ({year_b})" for n in names],
+                          color=colors + colors, pad=15),
+                link=dict(source=src, target=dst + k, value=flow[src, dst]),
+            ))
+            fig.update_layout(title=f"Aliran Tier {year_a} → {year_b}", height=420, margin=dict(l=0, r=0, t=40, b=0))
+            return fig
+
+        plot("transition_sankey", build_sankey, flow, tuple(names), year_a, year_b)
+
+    with col_heat:
+        plot("transition_matrix", lambda: px.imshow(
+            matrix, x=[f"Ke: {n}" for n in names], y=[f"Dari: {n}" for n in names],
+            text_auto=True, color_continuous_scale="Blues",
+            title=f"Matriks Transisi Tahunan {year_a}–{year_b}"
+        ).update_layout(height=420, margin=dict(l=0, r=0, t=40, b=0)), matrix, tuple(names), year_a, year_b)
+
+    # --- LINTASAN NEGARA FOKUS ---
+    st.subheader(f"🧭 Lintasan: {ctx.country}")
+    if ctx.country not in tr.trajectory.index:
+        st.warning(f"⚠️ Tidak ada data cluster untuk {ctx.country}.")
+    else:
+        path = tr.trajectory.loc[ctx.country].dropna()
+
+        def build_path():
+            fig = go.Figure(go.Scatter(
+                x=path.index, y=path.to_numpy(), mode="lines+markers", line_shape="hv",
+                marker=dict(color=[colors[int(t)] for t in path], size=8), line=dict(color="grey"),
+                text=[names[int(t)] for t in path], hovertemplate="%{x}: %{text}<extra></extra>"
+            ))
+            fig.update_yaxes(tickvals=list(range(k)), ticktext=names, range=[-0.5, k - 0.5])
+            fig.update_layout(height=300, margin=dict(l=0, r=0, t=20, b=0), xaxis_title="Tahun")
+            return fig
+
+        plot("transition_path", build_path, path, tuple(names))
+
+        events = tr.events_of(ctx.country)
+        moves = events[events["Change"] != 0]
+        if moves.empty:
+            st.caption("Tidak pernah berpindah tier.")
+        else:
+            st.dataframe(moves.assign(From=np.asarray(names)[moves["From"]], To=np.asarray(names)[moves["To"]])
+                         [["Year_From", "Year_To", "From", "To", "Event"]], hide_index=True, use_container_width=True)
+
+    with st.expander("🏆 Negara Paling Dinamis"):
+        st.dataframe(tr.summary.head(20), use_container_width=True)
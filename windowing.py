@@ -0,0 +1,113 @@
+"""
+Pembangun sliding-window vektoris untuk training dan backtesting LSTM.
+
+Seluruh panel (semua negara) diubah menjadi window sekaligus dengan
+`sliding_window_view` di atas satu array kontigu: window yang melintasi
+batas negara (atau lompatan tahun, jika diminta) dibuang lewat mask, bukan
+loop Python per negara. Window mentah adalah view tanpa salinan; salinan
+hanya dibuat sekali saat X / y diambil, atau per potongan lewat chunks()
+untuk pipeline streaming.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class WindowSet:
+    """
+    Kumpulan window beserta metadata per window:
+      X       (n, look_back, n_fitur) input
+      y       (n, horizon, n_fitur)   target
+      country (n,) nama negara, year (n,) tahun target pertama
+    """
+
+    def __init__(self, view, starts, look_back, horizon, countries, years):
+        self.view = view            # (n_baris - span + 1, n_fitur, span), tanpa salinan
+        self.starts = starts        # indeks window yang valid
+        self.look_back = look_back
+        self.horizon = horizon
+        self.country = countries[starts + look_back]
+        self.year = years[starts + look_back]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _take(self):
+        # Jika semua window valid, slicing saja (tetap view); selain itu fancy-index (satu salinan)
+        if len(self.starts) == len(self.view):
+            return self.view
+        return self.view[self.starts]
+
+    @property
+    def X(self):
+        return self._take()[:, :, :self.look_back].transpose(0, 2, 1)
+
+    @property
+    def y(self):
+        return self._take()[:, :, self.look_back:].transpose(0, 2, 1)
+
+    def chunks(self, size):
+        """(X, y) per potongan `size` window; salinan yang dibuat hanya sebesar satu potongan"""
+        for i in range(0, len(self.starts), size):
+            block = self.view[self.starts[i:i + size]]
+            yield block[:, :, :self.look_back].transpose(0, 2, 1), block[:, :, self.look_back:].transpose(0, 2, 1)
+
+    def subset(self, mask):
+        """Window terpilih (mis. split backtest berdasarkan tahun target)"""
+        mask = np.asarray(mask, dtype=bool)
+        out = WindowSet.__new__(WindowSet)
+        out.view, out.look_back, out.horizon = self.view, self.look_back, self.horizon
+        out.starts, out.country, out.year = self.starts[mask], self.country[mask], self.year[mask]
+        return out
+
+    def split_by_year(self, first_test_year):
+        """(train, test): test = window dengan tahun target >= first_test_year"""
+        is_test = self.year >= first_test_year
+        return self.subset(~is_test), self.subset(is_test)
+
+
+def build_windows(df, value_cols, look_back, horizon=1, require_consecutive=False,
+                  country_col="Country Name", year_col="Year"):
+    """
+    Panel (Country Name, Year, ...) -> WindowSet.
+
+    require_consecutive=True membuang window yang tahunnya tidak berurutan
+    (data bolong), sehingga model tidak belajar dari lompatan tahun.
+    """
+    value_cols = [value_cols] if isinstance(value_cols, str) else list(value_cols)
+    df = df.sort_values([country_col, year_col], kind="stable")
+
+    values = np.ascontiguousarray(df[value_cols].to_numpy(dtype=float))
+    countries = df[country_col].to_numpy()
+    years = df[year_col].to_numpy().astype(int)
+    codes = df[country_col].factorize()[0]
+
+    span = look_back + horizon
+    if len(values) < span:
+        empty = np.empty((0, len(value_cols), span))
+        return WindowSet(empty, np.empty(0, dtype=int), look_back, horizon, countries, years)
+
+    view = sliding_window_view(values, span, axis=0)    # (n - span + 1, n_fitur, span)
+    n_win = len(view)
+
+    # Window valid jika baris pertama & terakhir milik negara yang sama
+    # (data terurut per negara, jadi semua baris di antaranya juga sama)
+    valid = codes[:n_win] == codes[span - 1:]
+    if require_consecutive:
+        valid &= (years[span - 1:] - years[:n_win]) == span - 1
+
+    return WindowSet(view, np.flatnonzero(valid), look_back, horizon, countries, years)
+
+
+if __name__ == "__main__":
+    import time
+
+    import pandas as pd
+
+    df = pd.read_csv("data_bersih.csv")
+    df["log_Energy"] = np.log10(df["Energy_Consumption_kWh"] + 1)
+    for look_back in (3, 5, 10):
+        t0 = time.perf_counter()
+        ws = build_windows(df, "log_Energy", look_back)
+        X, y = ws.X, ws.y
+        print(f"look_back={look_back}: X{X.shape} y{y.shape} "
+              f"{len(np.unique(ws.country))} negara dalam {(time.perf_counter() - t0) * 1000:.1f} ms")